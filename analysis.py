@@ -3,6 +3,7 @@ import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 from plotly.subplots import make_subplots
+from viz_engine import density_grid, density_heatmap, lod_downsample
 
 # Load data
 df = pd.read_csv('hltb_dataset.csv')
@@ -64,21 +65,28 @@ high_conf = df_clean['confidence_score'] > 3.5
 low_time = df_clean['time_cost'] < 15
 high_time = df_clean['time_cost'] > 40
 
-# Sample for visualization (too many points)
-sample = df_clean.sample(min(5000, len(df_clean)), random_state=42)
-
-fig1.add_trace(go.Scatter(
-    x=sample['time_cost'],
-    y=sample['confidence_score'],
+# Every game, binned server-side (payload depends on the grid, not the catalogue)
+counts, x_centers, y_centers = density_grid(
+    df_clean['time_cost'], df_clean['confidence_score'],
+    (0, df_clean['time_cost'].max()), (0, df_clean['confidence_score'].max() * 1.001)
+)
+fig1.add_trace(density_heatmap(counts, x_centers, y_centers, 'Viridis'))
+
+# Individual markers only for the sparse mirage zone (long, few reports)
+mirage = df_clean[(df_clean['confidence_score'] < 2.0) & (df_clean['time_cost'] > 50)]
+mirage = mirage.iloc[lod_downsample(mirage['time_cost'], mirage['confidence_score'],
+                                    priority=mirage['main_story_polled'], budget=5000)]
+fig1.add_trace(go.Scattergl(
+    x=mirage['time_cost'],
+    y=mirage['confidence_score'],
     mode='markers',
     marker=dict(
-        size=np.sqrt(sample['main_story_polled'])/2,
-        color=sample['confidence_score'],
-        colorscale='Viridis',
-        opacity=0.6,
-        line=dict(width=0)
+        size=np.sqrt(mirage['main_story_polled'])*2,
+        color='orange',
+        opacity=0.8,
+        line=dict(width=1, color='white')
     ),
-    text=sample['name'],
+    text=mirage['name'],
     hovertemplate='%{text}<br>Hours: %{x:.1f}<br>Confidence: %{y:.2f}<extra></extra>',
     showlegend=False
 ))
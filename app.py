@@ -3,10 +3,12 @@ Do Games Respect Your Time?
 
 This is not a dashboard. This is visual reasoning.
 """
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
-from data_engine import TimeRespectAnalyzer
+from data_engine import TimeRespectAnalyzer, aggregate_cube, platform_mask
+from clustering import add_cluster_columns
 from viz_engine import (
     trust_time_landscape, perception_reality_split, genre_honesty_ranking,
     sensitivity_proof, confidence_crisis_histogram, trs_leaderboard, topographic_density_map, zone_distribution_pie, PALETTE
@@ -15,12 +17,18 @@ from viz_3d_advanced import (
     trust_time_stability_3d, genre_honesty_orbit_3d, platform_reliability_cube_3d,
     misrepresentation_risk_helix_3d, hidden_gems_cluster_3d
 )
-from timeline_viz import create_timeline_viz, generate_synthetic_journey, TIMELINE_PALETTE
-from radar_viz import create_radar_chart, get_game_stats, RADAR_PALETTE
+from timeline_viz import create_timeline_viz, default_journey, TIMELINE_PALETTE
+from radar_viz import create_radar_chart, create_radar_comparison, get_game_stats, RADAR_PALETTE
 from model_eval import (
-    prepare_model_data, train_models, create_roc_curve, 
+    prepare_model_data, train_models, create_roc_curve, create_pr_curve, create_calibration_curve,
     get_feature_importance, create_feature_importance_viz, MODEL_PALETTE
 )
+from feature_store import FeatureStore
+from journey_store import JourneyStore
+from payload import compact_figure, payload_report
+from similarity import similar_games
+from name_search import search_names
+from tracing import start_run, current_spans
 # Page config
 st.set_page_config(
     page_title="Do Games Respect Your Time?",
@@ -114,14 +122,46 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Hidden debug panel (?debug=1, honoured only when the server sets TRS_DEBUG_PANEL=1):
+# traces the stages of the requesting rerun only
+DEBUG = os.environ.get('TRS_DEBUG_PANEL') == '1' and st.query_params.get('debug') == '1'
+start_run(trace=DEBUG)
+
 # Load data
-@st.cache_data
+@st.cache_resource
 def load_data():
     analyzer = TimeRespectAnalyzer('hltb_dataset.csv')
     analyzer.clean_data()
     analyzer.compute_metrics()
+    add_cluster_columns(analyzer.df)
     return analyzer
 
+@st.cache_resource
+def get_feature_store():
+    return FeatureStore()
+
+@st.cache_resource
+def get_journey_store():
+    return JourneyStore()
+
+payload_reports = []
+
+def render_chart(fig, config=None):
+    """Send a compacted figure (float32 typed arrays, deduplicated strings) to the browser
+
+    Figures from cached builders were compacted when they were cached and
+    are sent as they are.
+    """
+    report = getattr(fig, '_payload_report', None)
+    if report is None:
+        compact = compact_figure(fig)
+        report = payload_report(fig, compact) if DEBUG else None
+    else:
+        compact = fig
+    if DEBUG:
+        payload_reports.append({'chart': fig.layout.title.text or '', **report})
+    st.plotly_chart(compact, use_container_width=True, config=config)
+
 analyzer = load_data()
 insight = analyzer.get_core_insight()
 
@@ -189,7 +229,7 @@ Yet platforms treat a game with 5 reports the same as one with 500.
 """, unsafe_allow_html=True)
 
 fig_crisis = confidence_crisis_histogram(analyzer.df)
-st.plotly_chart(fig_crisis, use_container_width=True)
+render_chart(fig_crisis)
 
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
 
@@ -231,15 +271,15 @@ This is the map. Every dot is a game. Position reveals truth.
 </div>
 """, unsafe_allow_html=True)
 
-fig_landscape = trust_time_landscape(analyzer.df)
-st.plotly_chart(fig_landscape, use_container_width=True, config={'displayModeBar': False})
+fig_landscape = trust_time_landscape(analyzer.df, render='raster')
+render_chart(fig_landscape, config={'displayModeBar': False})
 
 zone_dist = analyzer.get_zone_distribution()
 st.markdown("**Zone Distribution:**")
 st.dataframe(zone_dist, use_container_width=True, hide_index=True)
 
 fig_pie = zone_distribution_pie(analyzer.df)
-st.plotly_chart(fig_pie, use_container_width=True, config={'displayModeBar': False})
+render_chart(fig_pie, config={'displayModeBar': False})
 
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
 
@@ -261,8 +301,14 @@ The contour lines trace elevation: <strong>higher = more games</strong>.
 </div>
 """, unsafe_allow_html=True)
 
-fig_topo = topographic_density_map(analyzer.df)
-st.plotly_chart(fig_topo, use_container_width=True, config={'displayModeBar': False})
+topo_genres = st.multiselect(
+    "Filter by genre",
+    options=analyzer.df['primary_genre'].value_counts().index.tolist(),
+    default=[],
+    key='topo_genres'
+)
+fig_topo = topographic_density_map(analyzer.df, genres=topo_genres or None)
+render_chart(fig_topo, config={'displayModeBar': False})
 
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
 
@@ -282,7 +328,7 @@ The rankings shift. The "short" genres stay short. But the "long" ones? <strong>
 
 genre_stats = analyzer.genre_analysis()
 fig_split = perception_reality_split(analyzer.df, genre_stats)
-st.plotly_chart(fig_split, use_container_width=True, config={'displayModeBar': False})
+render_chart(fig_split, config={'displayModeBar': False})
 
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
 
@@ -301,7 +347,7 @@ Some genres are systematically over-estimated. Others under-estimated.
 """, unsafe_allow_html=True)
 
 fig_honesty = genre_honesty_ranking(genre_stats)
-st.plotly_chart(fig_honesty, use_container_width=True, config={'displayModeBar': False})
+render_chart(fig_honesty, config={'displayModeBar': False})
 
 # Show biggest movers
 col1, col2 = st.columns(2)
@@ -361,7 +407,7 @@ Most "epics" float in unstable territory. The few verified epics form a tiny, is
 
 with st.container():
     fig_3d_1 = trust_time_stability_3d(analyzer.df)
-    st.plotly_chart(fig_3d_1, use_container_width=True, config=plotly_3d_config)
+    render_chart(fig_3d_1, config=plotly_3d_config)
 
 st.markdown("---")
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
@@ -386,7 +432,7 @@ The gold diamond marks the most honest genre. The red X marks the most misleadin
 
 with st.container():
     fig_3d_2 = genre_honesty_orbit_3d(analyzer.df)
-    st.plotly_chart(fig_3d_2, use_container_width=True, config=plotly_3d_config)
+    render_chart(fig_3d_2, config=plotly_3d_config)
 
 st.markdown("---")
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
@@ -410,7 +456,7 @@ The cube reveals <strong>platform-specific patterns</strong> invisible in aggreg
 
 with st.container():
     fig_3d_3 = platform_reliability_cube_3d(analyzer.df)
-    st.plotly_chart(fig_3d_3, use_container_width=True, config=plotly_3d_config)
+    render_chart(fig_3d_3, config=plotly_3d_config)
 
 st.markdown("---")
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
@@ -434,7 +480,7 @@ Avoid the danger zone. Trust the low-Z cluster.
 
 with st.container():
     fig_3d_4 = misrepresentation_risk_helix_3d(analyzer.df)
-    st.plotly_chart(fig_3d_4, use_container_width=True, config=plotly_3d_config)
+    render_chart(fig_3d_4, config=plotly_3d_config)
 
 st.markdown("---")
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
@@ -461,7 +507,7 @@ The structure is invisible in 2D. In 3D, it's unmistakable.
 
 with st.container():
     fig_3d_5 = hidden_gems_cluster_3d(analyzer.df)
-    st.plotly_chart(fig_3d_5, use_container_width=True, config=plotly_3d_config)
+    render_chart(fig_3d_5, config=plotly_3d_config)
 
 st.markdown("---")
 
@@ -494,7 +540,7 @@ An insight that survives only one threshold is not an insight. It's noise.
 
 sensitivity_df = analyzer.sensitivity_analysis()
 fig_sensitivity = sensitivity_proof(sensitivity_df)
-st.plotly_chart(fig_sensitivity, use_container_width=True, config={'displayModeBar': False})
+render_chart(fig_sensitivity, config={'displayModeBar': False})
 
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
 
@@ -523,7 +569,7 @@ Rankings reveal truth. The best games are short, confident, and honest. The wors
 
 top_games, bottom_games = analyzer.get_trs_leaderboard(top_n=10, bottom_n=10)
 fig_trs = trs_leaderboard(top_games, bottom_games)
-st.plotly_chart(fig_trs, use_container_width=True, config={'displayModeBar': False})
+render_chart(fig_trs, config={'displayModeBar': False})
 
 # Show detailed tables
 col1, col2 = st.columns(2)
@@ -578,8 +624,19 @@ Watch how metrics evolve from early game through post-game padding.
 </div>
 """, unsafe_allow_html=True)
 
-# Generate synthetic journey data
-journey_df = generate_synthetic_journey(hours=100)
+# Per-game journeys come from the memory-mapped store; the reference journey is the original 100h model
+REFERENCE_JOURNEY = 'Synthetic reference journey (100h)'
+journey_games = analyzer.df.nlargest(100, 'main_story_polled')
+journey_choice = st.selectbox(
+    'Select Game',
+    [REFERENCE_JOURNEY] + journey_games.index.tolist(),
+    format_func=lambda x: x if x == REFERENCE_JOURNEY else journey_games.at[x, 'name'],
+    key='timeline_game_selector'
+)
+if journey_choice == REFERENCE_JOURNEY:
+    journey_df = default_journey(hours=100)
+else:
+    journey_df = get_journey_store().journey(analyzer.df, journey_choice)
 
 # Metric selector
 col1, col2, col3 = st.columns([2, 1, 1])
@@ -620,7 +677,7 @@ st.markdown("<br>", unsafe_allow_html=True)
 
 # Timeline visualization
 fig_timeline = create_timeline_viz(journey_df, timeline_metric)
-st.plotly_chart(fig_timeline, use_container_width=True, config={'displayModeBar': False})
+render_chart(fig_timeline, config={'displayModeBar': False})
 
 # Insights
 timeline_insights = {
@@ -658,108 +715,168 @@ Six metrics form a complete picture: efficiency, density, repetition control, re
 </div>
 """, unsafe_allow_html=True)
 
-# Game selector
+# Game selector: the most polled games by default, any game in the catalogue through search
 top_games_list = analyzer.df.nlargest(100, 'main_story_polled')['name'].tolist()
 
+def game_options(query: str) -> list:
+    """Search matches for a query (possibly none), the most polled games while it is empty"""
+    return search_names(analyzer.df, query, limit=50) if query.strip() else top_games_list
+
 col1, col2 = st.columns(2)
 
 with col1:
+    radar_query1 = st.text_input('Search Primary Game', '', key='radar_search1')
     radar_game1 = st.selectbox(
         'Primary Game',
-        top_games_list,
+        game_options(radar_query1),
         index=0,
         key='radar_game1'
     )
 
 with col2:
+    radar_query2 = st.text_input('Search Comparison Game', '', key='radar_search2')
+    radar_options2 = game_options(radar_query2)
+    if not radar_options2:
+        st.caption(f"No games match \"{radar_query2}\"")
     radar_game2 = st.selectbox(
         'Compare With (Optional)',
-        ['None'] + top_games_list,
+        ['None'] + radar_options2,
         index=0,
         key='radar_game2'
     )
 
-# Radar chart
-radar_game2_val = None if radar_game2 == 'None' else radar_game2
-fig_radar = create_radar_chart(analyzer.df, radar_game1, radar_game2_val)
-st.plotly_chart(fig_radar, use_container_width=True, config={'displayModeBar': False})
-
-# Stat cards
-stats = get_game_stats(analyzer.df, radar_game1)
-
-st.markdown("<br>", unsafe_allow_html=True)
-
-col1, col2, col3, col4, col5 = st.columns(5)
-
-with col1:
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
-                border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
-        <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
-            {stats['completion_time']:.1f}h
-        </div>
-        <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
-            Avg Completion
+if radar_game1 is None:
+    st.warning(f"No games match \"{radar_query1}\"")
+else:
+    # Radar chart
+    radar_game2_val = None if radar_game2 == 'None' else radar_game2
+    fig_radar = create_radar_chart(analyzer.df, radar_game1, radar_game2_val)
+    render_chart(fig_radar, config={'displayModeBar': False})
+    
+    # Stat cards
+    stats = get_game_stats(analyzer.df, radar_game1)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    
+    col1, col2, col3, col4, col5 = st.columns(5)
+    
+    with col1:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
+                    border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
+                {stats['completion_time']:.1f}h
+            </div>
+            <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
+                Avg Completion
+            </div>
         </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col2:
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
-                border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
-        <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
-            {stats['completion_rate']:.0f}%
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
+                    border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
+                {stats['completion_rate']:.0f}%
+            </div>
+            <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
+                Finish Rate
+            </div>
         </div>
-        <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
-            Finish Rate
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
+                    border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
+                {stats['dropoff_hours']:.0f}h
+            </div>
+            <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
+                Avg Drop-off
+            </div>
         </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col3:
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
-                border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
-        <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
-            {stats['dropoff_hours']:.0f}h
+        """, unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
+                    border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
+                {stats['side_quest_density']:.0f}%
+            </div>
+            <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
+                Side Quest Density
+            </div>
         </div>
-        <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
-            Avg Drop-off
+        """, unsafe_allow_html=True)
+
+    with col5:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
+                    border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
+                    box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
+            <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
+                {stats['grind_index']:.0f}
+            </div>
+            <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
+                Grind Index
+            </div>
         </div>
-    </div>
-    """, unsafe_allow_html=True)
+        """, unsafe_allow_html=True)
 
-with col4:
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
-                border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
-        <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
-            {stats['side_quest_density']:.0f}%
-        </div>
-        <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
-            Side Quest Density
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
-
-with col5:
-    st.markdown(f"""
-    <div style="background: linear-gradient(135deg, {RADAR_PALETTE['surface']} 0%, #252d3d 100%); 
-                border-radius: 12px; padding: 1.5rem; border: 1px solid {RADAR_PALETTE['grid']}; 
-                box-shadow: 0 4px 12px rgba(0,0,0,0.3); text-align: center;">
-        <div style="font-size: 2.5rem; font-weight: 700; color: {RADAR_PALETTE['accent']}; margin-bottom: 0.5rem;">
-            {stats['grind_index']:.0f}
-        </div>
-        <div style="font-size: 0.75rem; color: {RADAR_PALETTE['text_dim']}; text-transform: uppercase; letter-spacing: 0.05em;">
-            Grind Index
-        </div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Games like this: nearest radar profiles across the whole catalogue
+    st.markdown("<br>", unsafe_allow_html=True)
+    st.markdown(f"**Games like {radar_game1}:**")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        similar_genre = st.selectbox(
+            'Genre',
+            ['Any'] + sorted(analyzer.df['primary_genre'].dropna().unique().tolist()),
+            index=0,
+            key='similar_genre'
+        )
+    
+    with col2:
+        similar_tier = st.selectbox(
+            'Confidence Tier',
+            ['Any', 'Unreliable', 'Weak', 'Moderate', 'Strong'],
+            index=0,
+            key='similar_tier'
+        )
+    
+    similar = similar_games(
+        analyzer.df, radar_game1, k=10,
+        genre=None if similar_genre == 'Any' else similar_genre,
+        tier=None if similar_tier == 'Any' else similar_tier
+    )
+    # Other entries sharing the primary game's name are not "similar games"
+    similar = similar[similar['name'] != radar_game1]
+    display_similar = similar[['name', 'primary_genre', 'time_cost', 'main_story_polled', 'similarity_distance']].copy()
+    display_similar.columns = ['Game', 'Genre', 'Hours', 'Polls', 'Profile Distance']
+    display_similar['Hours'] = display_similar['Hours'].round(1)
+    display_similar['Profile Distance'] = display_similar['Profile Distance'].round(1)
+    st.dataframe(display_similar, use_container_width=True, hide_index=True)
+    
+    # Multi-game overlay against genre median profiles
+    comparison_defaults = list(dict.fromkeys([radar_game1] + similar['name'].tolist()))[:5]
+    comparison_games = st.multiselect(
+        'Compare Several Games',
+        list(dict.fromkeys(comparison_defaults + top_games_list)),
+        default=comparison_defaults,
+        max_selections=10,
+        key='radar_comparison'
+    )
+    if comparison_games:
+        fig_comparison = create_radar_comparison(analyzer.df, comparison_games)
+        render_chart(fig_comparison, config={'displayModeBar': False})
 
 st.markdown("""
 <div class="narrative" style="margin-top: 2rem;">
@@ -788,7 +905,16 @@ confidence_threshold = st.slider(
     step=1
 )
 
-filtered_df = analyzer.df[analyzer.df['main_story_polled'] >= confidence_threshold]
+explore_platforms = st.multiselect(
+    "Platforms (games listed on any of them, not only as their first platform)",
+    sorted(analyzer.platform_analysis(multi_platform=True)['platform']),
+    key='explore_platforms'
+)
+
+explore_mask = (analyzer.df['main_story_polled'] >= confidence_threshold).to_numpy()
+if explore_platforms:
+    explore_mask &= platform_mask(analyzer.df, explore_platforms)
+filtered_df = analyzer.df[explore_mask]
 
 if len(filtered_df) > 100:
     weights = filtered_df['main_story_polled']
@@ -813,6 +939,27 @@ if len(filtered_df) > 100:
 else:
     st.warning("Not enough games at this threshold")
 
+# Any filter combination is answered from the pre-aggregated genre x platform x tier x zone cube
+cube = aggregate_cube(analyzer.df)
+st.markdown("**Slice the catalogue:**")
+col1, col2, col3, col4 = st.columns(4)
+slice_genres = col1.multiselect('Genre', cube.labels['genre'], key='cube_genre')
+slice_platforms = col2.multiselect('Platform', cube.labels['platform'], key='cube_platform')
+slice_tiers = col3.multiselect('Confidence Tier', cube.labels['tier'], key='cube_tier')
+slice_zones = col4.multiselect('Zone', cube.labels['zone'], key='cube_zone')
+
+cube_slice = cube.summary(
+    genre=slice_genres or None,
+    platform=slice_platforms or None,
+    tier=slice_tiers or None,
+    zone=slice_zones or None
+)
+col1, col2, col3, col4 = st.columns(4)
+col1.metric("Games", f"{cube_slice['count']:,}")
+col2.metric("Median", f"{cube_slice['median_time']:.1f}h" if cube_slice['count'] else "–")
+col3.metric("Poll-Weighted Median", f"{cube_slice['weighted_median_time']:.1f}h" if cube_slice['count'] else "–")
+col4.metric("Mean TRS", f"{cube_slice['mean_trs']:.3f}" if cube_slice['count'] else "–")
+
 st.markdown('<div class="section-break"></div>', unsafe_allow_html=True)
 
 # ============================================================================
@@ -834,7 +981,7 @@ repetition patterns, completion rates, and drop-off risk.
 
 # Prepare data and train models
 with st.spinner('Training models...'):
-    X, y = prepare_model_data(analyzer.df)
+    X, y = prepare_model_data(analyzer.df, store=get_feature_store())
     results = train_models(X, y)
     feature_names = ['Time Efficiency', 'Content Density', 'Repetition Rate', 'Completion Rate', 'Drop-off Risk']
     importance_df = get_feature_importance(results['gradient']['model'], feature_names)
@@ -850,7 +997,7 @@ with col1:
     """, unsafe_allow_html=True)
     
     fig_roc = create_roc_curve(results)
-    st.plotly_chart(fig_roc, use_container_width=True, config={'displayModeBar': False})
+    render_chart(fig_roc, config={'displayModeBar': False})
 
 with col2:
     st.markdown(f"""
@@ -860,7 +1007,29 @@ with col2:
     """, unsafe_allow_html=True)
     
     fig_importance = create_feature_importance_viz(importance_df)
-    st.plotly_chart(fig_importance, use_container_width=True, config={'displayModeBar': False})
+    render_chart(fig_importance, config={'displayModeBar': False})
+
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown(f"""
+    <div style="color: {MODEL_PALETTE['text']}; font-size: 1rem; font-weight: 600; margin-bottom: 1rem;">
+        Precision-Recall Curve
+    </div>
+    """, unsafe_allow_html=True)
+    
+    fig_pr = create_pr_curve(results)
+    render_chart(fig_pr, config={'displayModeBar': False})
+
+with col2:
+    st.markdown(f"""
+    <div style="color: {MODEL_PALETTE['text']}; font-size: 1rem; font-weight: 600; margin-bottom: 1rem;">
+        Calibration
+    </div>
+    """, unsafe_allow_html=True)
+    
+    fig_calibration = create_calibration_curve(results)
+    render_chart(fig_calibration, config={'displayModeBar': False})
 
 # Feature details table
 st.markdown("<br>", unsafe_allow_html=True)
@@ -904,7 +1073,8 @@ st.markdown(f"""
     <div style="color: {MODEL_PALETTE['text']}; font-size: 1rem; line-height: 1.7;">
         <strong>Time Efficiency</strong> and <strong>Content Density</strong> are the strongest predictors of perceived time respect, 
         contributing {importance_df.iloc[0]['importance']:.1f}% and {importance_df.iloc[1]['importance']:.1f}% respectively. 
-        The Gradient Boosting model achieves <strong>{results['gradient']['auc']:.1%} AUC</strong>, 
+        The Gradient Boosting model achieves <strong>{results['gradient']['auc']:.1%} AUC</strong> 
+        (95% CI {results['gradient']['bands']['auc_ci'][0]:.1%}–{results['gradient']['bands']['auc_ci'][1]:.1%}), 
         indicating strong predictive performance for identifying games that respect player time.
     </div>
 </div>
@@ -950,3 +1120,20 @@ They disrespect it by being <strong>unmeasured</strong>.
 # ============================================================================
 
 st.markdown("---")
+
+if DEBUG:
+    with st.expander("Debug: stage timings for this rerun", expanded=True):
+        spans = pd.DataFrame(current_spans())
+        if len(spans) > 0:
+            cols = [c for c in ['span', 'parent', 'wall_ms', 'cpu_ms', 'rows_in', 'rows_out', 'peak_mb', 'points'] if c in spans.columns]
+            st.markdown(f"**{len(spans)} spans, {spans.loc[spans['depth'] == 0, 'wall_ms'].sum():,.0f} ms traced**")
+            st.dataframe(spans[cols].sort_values('wall_ms', ascending=False), use_container_width=True, hide_index=True)
+        else:
+            st.markdown("No spans recorded yet.")
+    
+    with st.expander("Debug: chart payloads for this rerun"):
+        payloads = pd.DataFrame(payload_reports)
+        if len(payloads) > 0:
+            st.markdown(f"**{payloads['bytes_after'].sum() / 2**20:,.1f} MB sent, "
+                        f"{payloads['bytes_saved'].sum() / 2**20:,.1f} MB saved by compaction**")
+            st.dataframe(payloads.sort_values('bytes_after', ascending=False), use_container_width=True, hide_index=True)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Model Benchmark - Training and inference scaling on synthetic HLTB-shaped data
+
+    python bench_models.py                          # 40k, 400k and 4M rows
+    python bench_models.py --sizes 40000 --models logistic --out models.json
+"""
+import argparse
+import tempfile
+import time
+from sklearn.model_selection import train_test_split
+from bench_utils import measure, peak_memory, write_results
+from data_engine import TimeRespectAnalyzer
+from feature_store import FeatureStore
+from model_eval import build_models, evaluate_models, prepare_model_data, train_models
+from synthetic_data import generate_hltb_frame
+
+DEFAULT_SIZES = [40_000, 400_000, 4_000_000]
+
+def predict_throughput(model, X, min_seconds: float = 0.5) -> float:
+    """Rows scored per second, repeating predict_proba until min_seconds have elapsed"""
+    rows = 0
+    start = time.perf_counter()
+    while True:
+        model.predict_proba(X)
+        rows += len(X)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_seconds:
+            return rows / elapsed
+
+def bench_size(n_rows: int, model_names: list, seed: int = 42, n_bootstrap: int = 200) -> list:
+    """Benchmark feature preparation, training, inference and evaluation at one data size"""
+    analyzer = TimeRespectAnalyzer.from_frame(generate_hltb_frame(n_rows, seed))
+    analyzer.clean_data()
+    analyzer.compute_metrics()
+    df = analyzer.df
+    base = {'rows': n_rows, 'games': len(df)}
+    records = []
+    
+    (X, y), metrics = measure(prepare_model_data, df)
+    records.append({'entry_point': 'prepare_model_data', 'mode': 'memory', **base, **metrics})
+    
+    with tempfile.TemporaryDirectory() as root:
+        # Every run gets a store of its own: an empty directory, or the warmed one
+        _, metrics = measure(lambda: prepare_model_data(df, store=FeatureStore(tempfile.mkdtemp(dir=root))))
+        records.append({'entry_point': 'prepare_model_data', 'mode': 'store_cold', **base, **metrics})
+        warm = tempfile.mkdtemp(dir=root)
+        prepare_model_data(df, store=FeatureStore(warm))
+        _, metrics = measure(lambda: prepare_model_data(df, store=FeatureStore(warm)))
+        records.append({'entry_point': 'prepare_model_data', 'mode': 'store_warm', **base, **metrics})
+    
+    # Same split as train_models, for scoring the trained models
+    _, X_test, _, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+    scores = {}
+    
+    for name in model_names:
+        # The real training entry point, one model at a time and without bootstrap bands
+        results, metrics = measure(train_models, X, y, n_bootstrap=0, models=[name])
+        model = results[name]['model']
+        scores[name] = model.predict_proba(X_test)[:, 1]
+        records.append({
+            'entry_point': 'train_models',
+            'model': name,
+            **base,
+            'train_rows': len(X) - len(X_test),
+            'test_rows': len(X_test),
+            **metrics,
+            'predict_peak_mb': peak_memory(model.predict_proba, X_test),
+            'predict_rows_per_s': predict_throughput(model, X_test),
+            'auc': results[name]['auc']
+        })
+    
+    _, metrics = measure(evaluate_models, y_test, scores, n_bootstrap=n_bootstrap)
+    records.append({'entry_point': 'evaluate_models', 'models': len(scores),
+                    'n_bootstrap': n_bootstrap, **base, **metrics})
+    return records
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--models', nargs='+', default=list(build_models()))
+    parser.add_argument('--bootstrap', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', help='result file (default: bench_results/models-<timestamp>.json)')
+    args = parser.parse_args()
+    
+    records = []
+    for n_rows in args.sizes:
+        print(f"Benchmarking {n_rows:,} rows...")
+        for record in bench_size(n_rows, args.models, args.seed, args.bootstrap):
+            records.append(record)
+            tag = record.get('model') or record.get('mode')
+            label = f"{record['entry_point']}[{tag}]" if tag else record['entry_point']
+            wall = record['wall_s']
+            extra = f", AUC={record['auc']:.3f}, {record['predict_rows_per_s']:,.0f} rows/s" if 'auc' in record else ''
+            print(f"  {label}: {wall:.3f}s{extra}")
+    
+    path = write_results('models', records, args.out)
+    print(f"✓ Results written to {path}")
+
+if __name__ == '__main__':
+    main()
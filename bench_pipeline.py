@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Pipeline Benchmark - Every data_engine entry point and figure builder, per data size
+
+    python bench_pipeline.py run                            # 40k, 200k, 1M rows
+    python bench_pipeline.py run --sizes 40000 --save-baseline
+    python bench_pipeline.py run --repeat 7                 # median of 7 timed runs per entry point
+    python bench_pipeline.py compare                        # latest run vs saved baseline
+    python bench_pipeline.py compare old.json new.json --tolerance 0.1
+"""
+import argparse
+import os
+import shutil
+import sys
+from functools import partial
+import plotly.graph_objects as go
+from bench_utils import RESULTS_DIR, compare_results, latest_results, load_results, measure, write_results
+from data_engine import TimeRespectAnalyzer
+from figure_cache import configure_figure_cache
+from payload import compact_figure
+from synthetic_data import generate_hltb_frame
+import viz_engine
+import viz_3d_advanced
+import radar_viz
+import timeline_viz
+
+DEFAULT_SIZES = [40_000, 200_000, 1_000_000]
+BASELINE_PATH = os.path.join(RESULTS_DIR, 'pipeline-baseline.json')
+KEY_FIELDS = ('entry_point', 'rows')
+METRICS = ('wall_s', 'wall_first_s', 'peak_mb', 'figure_json_bytes', 'compact_json_bytes')
+
+def figure_builders(ctx: dict) -> list:
+    """(entry point name, builder, args) for every figure builder in the dashboard"""
+    df = ctx['df']
+    top, bottom = ctx['leaderboard']
+    games = df.nlargest(2, 'main_story_polled')['name'].tolist()
+    return [
+        ('viz_engine.topographic_density_map', viz_engine.topographic_density_map, (df,)),
+        ('viz_engine.trust_time_landscape', viz_engine.trust_time_landscape, (df,)),
+        ('viz_engine.trust_time_landscape[raster]', partial(viz_engine.trust_time_landscape, render='raster'), (df,)),
+        ('viz_engine.trust_time_landscape[webgl]', partial(viz_engine.trust_time_landscape, render='webgl'), (df,)),
+        ('viz_engine.perception_reality_split', viz_engine.perception_reality_split, (df, ctx['genre_stats'])),
+        ('viz_engine.genre_honesty_ranking', viz_engine.genre_honesty_ranking, (ctx['genre_stats'],)),
+        ('viz_engine.trs_leaderboard', viz_engine.trs_leaderboard, (top, bottom)),
+        ('viz_engine.sensitivity_proof', viz_engine.sensitivity_proof, (ctx['sensitivity'],)),
+        ('viz_engine.confidence_crisis_histogram', viz_engine.confidence_crisis_histogram, (df,)),
+        ('viz_engine.zone_distribution_pie', viz_engine.zone_distribution_pie, (df,)),
+        ('viz_engine.hidden_gems_cluster_3d', viz_engine.hidden_gems_cluster_3d, (df,)),
+        ('viz_3d_advanced.trust_time_stability_3d', viz_3d_advanced.trust_time_stability_3d, (df,)),
+        ('viz_3d_advanced.genre_honesty_orbit_3d', viz_3d_advanced.genre_honesty_orbit_3d, (df,)),
+        ('viz_3d_advanced.platform_reliability_cube_3d', viz_3d_advanced.platform_reliability_cube_3d, (df,)),
+        ('viz_3d_advanced.misrepresentation_risk_helix_3d', viz_3d_advanced.misrepresentation_risk_helix_3d, (df,)),
+        ('viz_3d_advanced.hidden_gems_cluster_3d', viz_3d_advanced.hidden_gems_cluster_3d, (df,)),
+        ('radar_viz.create_radar_chart', radar_viz.create_radar_chart, (df, games[0], games[-1])),
+        ('radar_viz.create_radar_comparison', radar_viz.create_radar_comparison,
+         (df, df.nlargest(10, 'main_story_polled')['name'].tolist())),
+        ('timeline_viz.create_timeline_viz', timeline_viz.create_timeline_viz, ())
+    ]
+
+def bench_size(n_rows: int, seed: int = 42, repeat: int = 3) -> list:
+    """Time each analyzer stage and figure builder separately at one data size
+
+    Each entry point is timed repeat times and reported by its median.
+    Runs after the first can hit the module-level memo caches, so
+    wall_first_s is the cold cost and wall_s the steady-state rerun.
+    """
+    analyzer = TimeRespectAnalyzer.from_frame(generate_hltb_frame(n_rows, seed))
+    records = []
+    
+    def record(name, fn, *args, **kwargs):
+        result, metrics = measure(fn, *args, repeat=repeat, **kwargs)
+        entry = {'entry_point': name, 'rows': n_rows, **metrics}
+        if isinstance(result, go.Figure):
+            entry['figure_json_bytes'] = len(result.to_json())
+            entry['compact_json_bytes'] = len(compact_figure(result).to_json())
+        records.append(entry)
+        return result
+    
+    record('data_engine.clean_data', analyzer.clean_data)
+    record('data_engine.compute_metrics', analyzer.compute_metrics)
+    games = len(analyzer.df)
+    ctx = {
+        'df': analyzer.df,
+        'insight': record('data_engine.get_core_insight', analyzer.get_core_insight),
+        'genre_stats': record('data_engine.genre_analysis', analyzer.genre_analysis),
+        'sensitivity': record('data_engine.sensitivity_analysis', analyzer.sensitivity_analysis),
+        'platform_stats': record('data_engine.platform_analysis', analyzer.platform_analysis),
+        'leaderboard': record('data_engine.get_trs_leaderboard', analyzer.get_trs_leaderboard)
+    }
+    
+    for name, builder, args in figure_builders(ctx):
+        record(name, builder, *args)
+    
+    for entry in records:
+        entry['games'] = games
+    return records
+
+def print_records(records: list):
+    """One aligned line per record: wall time, peak memory, figure size"""
+    for r in records:
+        size = f", {r['figure_json_bytes'] / 1024:,.0f} KB ({r['compact_json_bytes'] / 1024:,.0f} KB compact)" if 'figure_json_bytes' in r else ''
+        print(f"  {r['entry_point']:<48} {r['wall_s'] * 1000:9.1f} ms  {r['peak_mb']:8.1f} MB{size}")
+
+def run(args):
+    """Run every size, write the results and optionally promote them to baseline"""
+    # Time the builders themselves, not figure cache hits
+    configure_figure_cache(enabled=args.figure_cache)
+    records = []
+    for n_rows in args.sizes:
+        print(f"Benchmarking {n_rows:,} rows...")
+        size_records = bench_size(n_rows, args.seed, args.repeat)
+        print_records(size_records)
+        records.extend(size_records)
+    
+    path = write_results('pipeline', records, args.out)
+    print(f"✓ Results written to {path}")
+    if args.save_baseline:
+        shutil.copyfile(path, BASELINE_PATH)
+        print(f"✓ Saved as baseline {BASELINE_PATH}")
+
+def compare(args):
+    """Print the largest changes against the baseline; non-zero exit on regressions"""
+    baseline = load_results(args.baseline or BASELINE_PATH)
+    current = load_results(args.current or latest_results('pipeline'))
+    rows = compare_results(baseline, current, KEY_FIELDS, METRICS, args.tolerance)
+    
+    regressions = [r for r in rows if r['regression']]
+    for r in sorted(rows, key=lambda r: -r['ratio'])[:args.top]:
+        flag = '✗' if r['regression'] else ' '
+        print(f"{flag} {r['entry_point']:<48} {r['rows']:>10,} {r['metric']:<18} "
+              f"{r['baseline']:12.4g} → {r['current']:<12.4g} ×{r['ratio']:.2f}")
+    
+    if regressions:
+        print(f"\n✗ {len(regressions)} regressions above {args.tolerance:.0%}")
+        return 1
+    print(f"\n✓ No regressions above {args.tolerance:.0%} ({len(rows)} comparisons)")
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = sub.add_parser('run', help='run the benchmark suite')
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--repeat', type=int, default=3, help='timed runs per entry point (median reported)')
+    run_parser.add_argument('--out', help='result file (default: bench_results/pipeline-<timestamp>.json)')
+    run_parser.add_argument('--figure-cache', action='store_true', help='leave the figure cache on')
+    run_parser.add_argument('--save-baseline', action='store_true', help=f'also copy the results to {BASELINE_PATH}')
+    
+    compare_parser = sub.add_parser('compare', help='compare a run against a saved baseline')
+    compare_parser.add_argument('baseline', nargs='?', help=f'baseline results (default: {BASELINE_PATH})')
+    compare_parser.add_argument('current', nargs='?', help='results to check (default: latest run)')
+    compare_parser.add_argument('--tolerance', type=float, default=0.2, help='allowed growth before flagging (0.2 = 20%%)')
+    compare_parser.add_argument('--top', type=int, default=30, help='rows to print, largest ratios first')
+    
+    args = parser.parse_args()
+    return run(args) if args.command == 'run' else compare(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
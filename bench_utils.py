@@ -0,0 +1,135 @@
+"""
+Benchmark Utilities - Timing, memory and result files shared by the bench suites
+"""
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+RESULTS_DIR = 'bench_results'
+
+def peak_memory(fn, *args, **kwargs) -> float:
+    """Peak traced memory (MB) allocated by one run of fn"""
+    # Leave an outer tracemalloc session (stage tracing) running
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    else:
+        tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    try:
+        fn(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        if started:
+            tracemalloc.stop()
+    return (peak - base) / 2**20
+
+def measure(fn, *args, repeat: int = 1, **kwargs):
+    """Run fn and return (result, metrics) with wall time, CPU time and peak traced memory
+
+    Timed runs happen without tracemalloc, whose allocation hooks slow
+    allocation-heavy code down; peak memory comes from a separate run, so
+    fn must be repeatable. With repeat > 1, wall_s and cpu_s are medians
+    over the timed runs, wall_best_s the fastest and wall_first_s the
+    first (before any warm-up); the first run's result is returned.
+    """
+    walls, cpus = [], []
+    for i in range(repeat):
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        output = fn(*args, **kwargs)
+        walls.append(time.perf_counter() - wall_start)
+        cpus.append(time.process_time() - cpu_start)
+        if i == 0:
+            result = output
+    
+    metrics = {
+        'wall_s': statistics.median(walls),
+        'cpu_s': statistics.median(cpus),
+        'peak_mb': peak_memory(fn, *args, **kwargs)
+    }
+    if repeat > 1:
+        metrics.update(wall_best_s=min(walls), wall_first_s=walls[0], repeat=repeat)
+    return result, metrics
+
+def environment() -> dict:
+    """Versions and machine details recorded with every result file"""
+    import numpy, pandas, sklearn
+    return {
+        'python': sys.version.split()[0],
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'sklearn': sklearn.__version__,
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpus': os.cpu_count()
+    }
+
+def write_results(suite: str, records: list, path: str = None) -> str:
+    """Write benchmark records as JSON; defaults to bench_results/<suite>-<timestamp>.json"""
+    stamp = datetime.now(timezone.utc)
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, f"{suite}-{stamp:%Y%m%dT%H%M%S}.json")
+    
+    payload = {
+        'suite': suite,
+        'created': stamp.isoformat(),
+        'environment': environment(),
+        'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        'records': records
+    }
+    with open(path, 'w') as fh:
+        json.dump(payload, fh, indent=2)
+    return path
+
+def load_results(path: str) -> dict:
+    """Read a result file written by write_results"""
+    with open(path) as fh:
+        return json.load(fh)
+
+def latest_results(suite: str) -> str:
+    """Most recent non-baseline result file for a suite"""
+    candidates = sorted(
+        f for f in os.listdir(RESULTS_DIR)
+        if f.startswith(f"{suite}-") and f.endswith('.json') and not f.endswith('-baseline.json')
+    ) if os.path.isdir(RESULTS_DIR) else []
+    if not candidates:
+        raise FileNotFoundError(f"No {suite} results in {RESULTS_DIR}/")
+    return os.path.join(RESULTS_DIR, candidates[-1])
+
+def compare_results(baseline: dict, current: dict, key_fields: tuple, metrics: tuple,
+                    tolerance: float = 0.2) -> list:
+    """Match records on key_fields and report current/baseline ratios for each metric
+
+    A metric regresses when it grows by more than `tolerance` (0.2 = 20%).
+    """
+    def key(record):
+        return tuple(record.get(f) for f in key_fields)
+    
+    base_index = {key(r): r for r in baseline['records']}
+    rows = []
+    for record in current['records']:
+        base = base_index.get(key(record))
+        if base is None:
+            continue
+        for metric in metrics:
+            old, new = base.get(metric), record.get(metric)
+            if not old or new is None:
+                continue
+            ratio = new / old
+            rows.append({
+                **{f: record.get(f) for f in key_fields},
+                'metric': metric,
+                'baseline': old,
+                'current': new,
+                'ratio': ratio,
+                'regression': ratio > 1 + tolerance
+            })
+    return rows
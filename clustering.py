@@ -0,0 +1,127 @@
+"""
+Clustering - Hidden Gems clusters fitted once per dataset version over every game
+Mini-batch k-means on standardised (log adjusted hours, confidence, log polls);
+labels and centroids are stored under the cache directory and reused until
+the dataset fingerprint changes
+"""
+import json
+import os
+import numpy as np
+import pandas as pd
+from sklearn.cluster import MiniBatchKMeans
+from data_engine import CACHE_DIR, dataset_fingerprint
+
+# Bump when the features, scaling or naming below change
+CLUSTER_VERSION = 1
+CLUSTER_COLUMNS = ['cluster_id', 'cluster', 'cluster_adjusted_time', 'cluster_confidence', 'cluster_polls']
+
+_CLUSTERS = {}
+_MAX_CLUSTERS = 4
+
+def _feature_matrix(df: pd.DataFrame) -> np.ndarray:
+    """Standardised features; adjusted hours are log-scaled so the tail does not dominate"""
+    X = np.column_stack([
+        np.log1p(df['adjusted_time_cost'].to_numpy(dtype=np.float64)),
+        df['confidence_score'].to_numpy(dtype=np.float64),
+        np.log1p(df['main_story_polled'].to_numpy(dtype=np.float64))
+    ])
+    X = np.where(np.isnan(X), np.nanmedian(X, axis=0), X)
+    std = X.std(axis=0)
+    return (X - X.mean(axis=0)) / np.where(std > 0, std, 1)
+
+def _name_clusters(centers: np.ndarray) -> list:
+    """Name centroids by where they sit in standardised (time, confidence) space
+
+    Hidden Gems maximise confidence - time, Overhyped time - confidence and
+    Verified Epics time + confidence; each name goes to a different cluster,
+    every other cluster is Standard.
+    """
+    time_z = centers[:, 0]
+    conf_z = centers[:, 1:].mean(axis=1)
+    names = ['Standard'] * len(centers)
+    free = list(range(len(centers)))
+    for name, score in [('Hidden Gems', conf_z - time_z), ('Overhyped', time_z - conf_z),
+                        ('Verified Epics', time_z + conf_z)]:
+        if not free:
+            break
+        best = max(free, key=lambda i: score[i])
+        names[best] = name
+        free.remove(best)
+    return names
+
+def fit_clusters(df: pd.DataFrame, n_clusters: int = 4, seed: int = 42) -> dict:
+    """Fit mini-batch k-means over every game; centroids are reported in original units"""
+    X = _feature_matrix(df)
+    model = MiniBatchKMeans(n_clusters=n_clusters, random_state=seed, batch_size=4096, n_init=3)
+    labels = model.fit_predict(X).astype(np.int16)
+    
+    # Centroids in original units: per-cluster means of the raw columns
+    counts = np.bincount(labels, minlength=n_clusters)
+    def cluster_mean(values):
+        return np.bincount(labels, weights=values, minlength=n_clusters) / np.maximum(counts, 1)
+    
+    return {
+        'labels': labels,
+        'names': _name_clusters(model.cluster_centers_),
+        'sizes': counts.tolist(),
+        'adjusted_time': cluster_mean(df['adjusted_time_cost'].to_numpy(dtype=np.float64)).tolist(),
+        'confidence': cluster_mean(df['confidence_score'].to_numpy(dtype=np.float64)).tolist(),
+        'polls': cluster_mean(df['main_story_polled'].to_numpy(dtype=np.float64)).tolist(),
+        'time': cluster_mean(df['time_cost'].to_numpy(dtype=np.float64)).tolist()
+    }
+
+def get_clusters(df: pd.DataFrame, n_clusters: int = 4, root: str = None) -> dict:
+    """Cluster labels and centroids for this dataset version, fitting only on a new fingerprint"""
+    key = f"v{CLUSTER_VERSION}-k{n_clusters}-{dataset_fingerprint(df)}"
+    if key in _CLUSTERS:
+        return _CLUSTERS[key]
+    
+    root = root or os.path.join(CACHE_DIR, 'clusters')
+    labels_path = os.path.join(root, f"{key}.labels.npy")
+    meta_path = os.path.join(root, f"{key}.json")
+    if os.path.exists(meta_path):
+        with open(meta_path) as fh:
+            clusters = json.load(fh)
+        clusters['labels'] = np.load(labels_path)
+    else:
+        clusters = fit_clusters(df, n_clusters)
+        os.makedirs(root, exist_ok=True)
+        np.save(labels_path, clusters['labels'])
+        # Metadata is written last: its presence marks a complete entry
+        tmp = meta_path + '.tmp'
+        with open(tmp, 'w') as fh:
+            json.dump({k: v for k, v in clusters.items() if k != 'labels'}, fh, indent=2)
+        os.replace(tmp, meta_path)
+    
+    if len(_CLUSTERS) >= _MAX_CLUSTERS:
+        del _CLUSTERS[next(iter(_CLUSTERS))]
+    _CLUSTERS[key] = clusters
+    return clusters
+
+def cluster_columns(df: pd.DataFrame, n_clusters: int = 4) -> pd.DataFrame:
+    """Cluster id, name and centroid coordinates for every row of df, aligned to its index"""
+    clusters = get_clusters(df, n_clusters)
+    labels = clusters['labels']
+    return pd.DataFrame({
+        'cluster_id': labels,
+        'cluster': np.asarray(clusters['names'], dtype=object)[labels],
+        'cluster_adjusted_time': np.asarray(clusters['adjusted_time'])[labels],
+        'cluster_confidence': np.asarray(clusters['confidence'])[labels],
+        'cluster_polls': np.asarray(clusters['polls'])[labels]
+    }, index=df.index)
+
+def add_cluster_columns(df: pd.DataFrame, n_clusters: int = 4) -> pd.DataFrame:
+    """Write the cluster columns into df in place (like compute_metrics) and return it"""
+    columns = cluster_columns(df, n_clusters)
+    for name in CLUSTER_COLUMNS:
+        df[name] = columns[name]
+    return df
+
+def with_clusters(df: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """rows (a subset of df) with the cluster columns of get_clusters(df)
+
+    Cluster columns already on rows are replaced: they may come from a
+    model fitted on a larger frame, whose labels do not match df's
+    centroids.
+    """
+    return rows.drop(columns=CLUSTER_COLUMNS, errors='ignore').join(cluster_columns(df))
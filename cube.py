@@ -0,0 +1,161 @@
+"""
+Aggregate Cube - Pre-aggregated counts, poll sums, TRS sums and time sketches per dimension cell
+Dashboard filters (genre x platform x confidence tier x zone) are answered
+by summing cells instead of rescanning rows
+"""
+import numpy as np
+import pandas as pd
+
+class AggregateCube:
+    """Dense additive measures over every cell plus a poll-weighted time histogram per occupied cell
+
+    Counts, poll sums, TRS sums and time sums/squares are exact; medians
+    and other quantiles come from log-spaced histograms (sketch_bins bins
+    between the shortest and longest game), so they are accurate to
+    within one bin.
+    """
+
+    def __init__(self, dimensions: dict, time_cost, polls, trs=None, sketch_bins: int = 256):
+        """dimensions maps each name to (per-row integer codes, labels); code -1 means missing"""
+        self.dimensions = list(dimensions)
+        self.labels = {name: list(labels) for name, (_, labels) in dimensions.items()}
+        self.shape = tuple(len(labels) + 1 for _, labels in dimensions.values())
+        # The extra last slot of every axis holds rows whose code is missing
+        codes = [np.where(np.asarray(c) < 0, len(labels), c) for c, labels in dimensions.values()]
+        cells = np.ravel_multi_index(codes, self.shape)
+        size = int(np.prod(self.shape))
+        
+        time_cost = np.asarray(time_cost, dtype=np.float64)
+        polls = np.asarray(polls, dtype=np.float64)
+        
+        def cell_sum(weights=None):
+            return np.bincount(cells, weights=weights, minlength=size).reshape(self.shape)
+        self.count = cell_sum().astype(np.int64)
+        self.polls = cell_sum(polls)
+        # Without TRS there is no sum to report: mean_trs comes out NaN rather than 0
+        self.trs_sum = None if trs is None else cell_sum(np.nan_to_num(np.asarray(trs, dtype=np.float64)))
+        self.time_sum = cell_sum(time_cost)
+        self.time_sq = cell_sum(time_cost ** 2)
+        
+        # Histograms only for occupied cells
+        finite = time_cost[np.isfinite(time_cost)]
+        low, high = (finite.min(), finite.max()) if len(finite) else (1.0, 1.0)
+        self.edges = np.geomspace(max(low, 1e-3), max(high, low * 1.001, 1e-3 * 1.001), sketch_bins + 1)
+        bins = np.clip(np.searchsorted(self.edges, time_cost, side='right') - 1, 0, sketch_bins - 1)
+        self.occupied, row_of_cell = np.unique(cells, return_inverse=True)
+        self.occupied_codes = np.column_stack(np.unravel_index(self.occupied, self.shape))
+        slots = row_of_cell * sketch_bins + bins
+        sketch_size = len(self.occupied) * sketch_bins
+        self.sketch = np.bincount(slots, minlength=sketch_size).reshape(-1, sketch_bins).astype(np.float64)
+        self.weighted_sketch = np.bincount(slots, weights=polls, minlength=sketch_size).reshape(-1, sketch_bins)
+        self._sketch_totals = (self.sketch.sum(axis=0), self.weighted_sketch.sum(axis=0))
+    
+    def _axis_mask(self, name: str, value) -> np.ndarray:
+        mask = np.zeros(self.shape[self.dimensions.index(name)], dtype=bool)
+        if value is None:
+            mask[:] = True
+            return mask
+        values = [value] if isinstance(value, str) or not hasattr(value, '__iter__') else value
+        labels = self.labels[name]
+        for v in values:
+            if v in labels:
+                mask[labels.index(v)] = True
+        return mask
+    
+    def _masks(self, filters: dict) -> list:
+        unknown = set(filters) - set(self.dimensions)
+        if unknown:
+            raise ValueError(f"Unknown cube dimensions: {sorted(unknown)}")
+        return [self._axis_mask(name, filters.get(name)) for name in self.dimensions]
+    
+    def _sub(self, measure: np.ndarray, masks: list) -> np.ndarray:
+        return measure[np.ix_(*masks)]
+    
+    def _sketch_rows(self, masks: list) -> np.ndarray:
+        """Occupied cells inside the slice"""
+        keep = np.ones(len(self.occupied), dtype=bool)
+        for axis, mask in enumerate(masks):
+            keep &= mask[self.occupied_codes[:, axis]]
+        return keep
+    
+    def _histograms(self, rows: np.ndarray) -> tuple:
+        """Plain and poll-weighted time histograms of a slice"""
+        if rows.all():
+            return self._sketch_totals
+        return self.sketch[rows].sum(axis=0), self.weighted_sketch[rows].sum(axis=0)
+    
+    def _quantile(self, histogram: np.ndarray, q: float) -> float:
+        """Quantile of a binned distribution, interpolated geometrically inside the bin"""
+        total = histogram.sum()
+        if total <= 0:
+            return np.nan
+        cumulative = np.cumsum(histogram)
+        target = q * total
+        b = min(int(np.searchsorted(cumulative, target, side='left')), len(histogram) - 1)
+        before = cumulative[b - 1] if b > 0 else 0.0
+        fraction = (target - before) / histogram[b] if histogram[b] > 0 else 0.5
+        lo, hi = self.edges[b], self.edges[b + 1]
+        return float(lo * (hi / lo) ** np.clip(fraction, 0, 1))
+    
+    def quantile(self, q: float, weighted: bool = True, **filters) -> float:
+        """Approximate (poll-weighted by default) quantile of time_cost over a slice"""
+        plain, polls = self._histograms(self._sketch_rows(self._masks(filters)))
+        return self._quantile(polls if weighted else plain, q)
+    
+    def summary(self, **filters) -> dict:
+        """Totals and medians of a slice, e.g. summary(genre='RPG', tier=['Moderate', 'Strong'])"""
+        masks = self._masks(filters)
+        count = int(self._sub(self.count, masks).sum())
+        polls = float(self._sub(self.polls, masks).sum())
+        time_sum = float(self._sub(self.time_sum, masks).sum())
+        time_sq = float(self._sub(self.time_sq, masks).sum())
+        plain, weighted = self._histograms(self._sketch_rows(masks))
+        variance = (time_sq - time_sum ** 2 / count) / (count - 1) if count > 1 else np.nan
+        return {
+            'count': count,
+            'total_polls': polls,
+            'mean_time': time_sum / count if count else np.nan,
+            'time_std': float(np.sqrt(max(variance, 0))) if count > 1 else np.nan,
+            'median_time': self._quantile(plain, 0.5),
+            'weighted_median_time': self._quantile(weighted, 0.5),
+            'mean_trs': float(self._sub(self.trs_sum, masks).sum()) / count
+                        if count and self.trs_sum is not None else np.nan
+        }
+    
+    def groupby(self, dimension: str, **filters) -> pd.DataFrame:
+        """One summary row per label of dimension (empty labels dropped), within the other filters"""
+        masks = self._masks(filters)
+        axis = self.dimensions.index(dimension)
+        other = tuple(i for i in range(len(self.dimensions)) if i != axis)
+        
+        def by_label(measure):
+            return self._sub(measure, masks).sum(axis=other)
+        label_slots = np.flatnonzero(masks[axis])
+        count = by_label(self.count)
+        time_sum, time_sq = by_label(self.time_sum), by_label(self.time_sq)
+        
+        # Per-label histograms: selected cells ordered by label, summed segment by segment
+        rows = np.flatnonzero(self._sketch_rows(masks))
+        codes = self.occupied_codes[rows, axis]
+        order = np.argsort(codes, kind='stable')
+        rows, codes = rows[order], codes[order]
+        grouped = np.zeros((self.shape[axis], self.sketch.shape[1]))
+        weighted = np.zeros_like(grouped)
+        if len(rows):
+            starts = np.flatnonzero(np.append(True, codes[1:] != codes[:-1]))
+            grouped[codes[starts]] = np.add.reduceat(self.sketch[rows], starts, axis=0)
+            weighted[codes[starts]] = np.add.reduceat(self.weighted_sketch[rows], starts, axis=0)
+        
+        labels = self.labels[dimension] + [None]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result = pd.DataFrame({
+                dimension: [labels[i] for i in label_slots],
+                'count': count,
+                'total_polls': by_label(self.polls),
+                'mean_time': time_sum / count,
+                'time_std': np.sqrt(np.maximum((time_sq - time_sum ** 2 / count) / (count - 1), 0)),
+                'median_time': [self._quantile(grouped[i], 0.5) for i in label_slots],
+                'weighted_median_time': [self._quantile(weighted[i], 0.5) for i in label_slots],
+                'mean_trs': by_label(self.trs_sum) / count if self.trs_sum is not None else np.nan
+            })
+        return result[result['count'] > 0].reset_index(drop=True)
@@ -2,17 +2,185 @@
 Data Engine for Time Respect Analysis
 Research-grade confidence modeling and uncertainty quantification
 """
+import hashlib
+import os
+import weakref
 import pandas as pd
 import numpy as np
-from typing import Tuple, Dict, List
+from typing import Tuple, Dict, List, Optional
 from scipy import stats
+from cube import AggregateCube
+from multilabel import MultiLabelIndex
+from tracing import traced
+
+# Root directory for on-disk caches (feature matrices, indexes, figures)
+CACHE_DIR = os.environ.get('TRS_CACHE_DIR', '.trs_cache')
+
+# Columns that define a dataset version; derived metric columns are excluded
+SOURCE_COLUMNS = ['name', 'type', 'main_story', 'main_story_polled', 'main_extras', 'genres', 'platform']
+# Derived columns that compute_time_respect_score can rewrite in place with new values (multi_label)
+RECOMPUTED_COLUMNS = ['genre_median', 'genre_deviation', 'time_respect_score']
+
+_FINGERPRINTS = {}
+_MEMBERSHIPS = {}
+_PLATFORM_STATS = {}
+_CUBES = {}
+
+CONFIDENCE_TIERS = ['Unreliable', 'Weak', 'Moderate', 'Strong']
+
+def dataset_fingerprint(df: pd.DataFrame, columns: Optional[List[str]] = None) -> str:
+    """Stable content hash of a frame, used to key everything cached per dataset version
+
+    By default only SOURCE_COLUMNS are hashed, so adding metric columns in
+    place does not change the version. Results are memoised per frame object
+    and shape; in-place edits of existing values are not detected.
+    """
+    cols = [c for c in (SOURCE_COLUMNS if columns is None else columns) if c in df.columns]
+    memo_key = (id(df), tuple(cols))
+    cached = _FINGERPRINTS.get(memo_key)
+    if cached is not None and cached[0]() is df and cached[1] == df.shape:
+        return cached[2]
+    
+    h = hashlib.sha1()
+    h.update(repr(cols).encode())
+    h.update(pd.util.hash_pandas_object(df[cols], index=True).values.tobytes())
+    fingerprint = h.hexdigest()[:16]
+    
+    if len(_FINGERPRINTS) > 256:
+        for key in [k for k, v in _FINGERPRINTS.items() if v[0]() is None]:
+            del _FINGERPRINTS[key]
+    _FINGERPRINTS[memo_key] = (weakref.ref(df), df.shape, fingerprint)
+    return fingerprint
+
+def column_hash(df: pd.DataFrame, column: str) -> str:
+    """Content hash of one column, recomputed on every call ('' when the column is absent)
+
+    For derived columns that are rewritten in place (time_respect_score):
+    dataset_fingerprint's memo is keyed on frame identity and shape, so it
+    would keep returning the hash of the old values.
+    """
+    if column not in df.columns:
+        return ''
+    values = pd.util.hash_pandas_object(df[column], index=False).values
+    return hashlib.sha1(values.tobytes()).hexdigest()[:16]
+
+def quantile_buckets(values, quantiles: List[float], labels: List[str]) -> pd.Categorical:
+    """Label values by quantile cut points computed once over all of them
+
+    With cut points c_1 <= ... <= c_k, a value v gets labels[i] where i is
+    the number of cut points <= v (so v >= c_k is the top label). Missing
+    values stay missing. One quantile pass plus one searchsorted, O(n log k).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if len(labels) != len(quantiles) + 1:
+        raise ValueError("Need exactly one more label than quantiles")
+    cuts = np.nanquantile(values, quantiles)
+    codes = np.searchsorted(cuts, values, side='right')
+    codes[np.isnan(values)] = -1
+    return pd.Categorical.from_codes(codes, categories=labels)
+
+def label_membership(df: pd.DataFrame, column: str = 'genres') -> MultiLabelIndex:
+    """Sparse multi-label membership of a comma-separated column, parsed once per dataset version"""
+    key = (dataset_fingerprint(df, columns=[column]), column)
+    index = _MEMBERSHIPS.get(key)
+    if index is None:
+        index = MultiLabelIndex(df[column])
+        if len(_MEMBERSHIPS) >= 8:
+            del _MEMBERSHIPS[next(iter(_MEMBERSHIPS))]
+        _MEMBERSHIPS[key] = index
+    return index
+
+def platform_stats(df: pd.DataFrame, multi_platform: bool = False) -> pd.DataFrame:
+    """Per-platform counts, medians, weighted medians, confidence tier shares and TRS
+
+    By default each game counts toward its first listed platform; with
+    multi_platform=True it counts toward every platform it is listed on.
+    Built from the parsed platform membership, cached per dataset version.
+    """
+    key = (dataset_fingerprint(df), column_hash(df, 'time_respect_score'), multi_platform)
+    result = _PLATFORM_STATS.get(key)
+    if result is not None:
+        return result
+    
+    membership = label_membership(df, 'platform')
+    if not multi_platform:
+        membership = membership.primary()
+    polls = df['main_story_polled']
+    counts = membership.counts()
+    result = pd.DataFrame({
+        'platform': membership.labels,
+        'count': counts.values,
+        'total_polls': membership.sums(polls).round().astype(np.int64).values,
+        'median_time': membership.medians(df['time_cost']).values,
+        'median_conf': membership.medians(df['confidence_score']).values,
+        'weighted_median_time': membership.weighted_medians(df['time_cost'], polls).values,
+        'weighted_median_adjusted': membership.weighted_medians(df['adjusted_time_cost'], polls).values
+    })
+    tiers = df['confidence_tier'].astype(object).to_numpy()
+    for tier in CONFIDENCE_TIERS:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            result[f"share_{tier.lower()}"] = (membership.sums(tiers == tier) / counts).values
+    if 'time_respect_score' in df.columns:
+        result['mean_trs'] = membership.means(df['time_respect_score']).values
+        result['median_trs'] = membership.medians(df['time_respect_score']).values
+    result = result[result['count'] > 0].reset_index(drop=True)
+    
+    if len(_PLATFORM_STATS) >= 8:
+        del _PLATFORM_STATS[next(iter(_PLATFORM_STATS))]
+    _PLATFORM_STATS[key] = result
+    return result
+
+def platform_mask(df: pd.DataFrame, platforms: List[str]) -> np.ndarray:
+    """Rows of df listed on any of platforms (every listed platform counts, not only the first)"""
+    return label_membership(df, 'platform').members_of(platforms)
+
+def aggregate_cube(df: pd.DataFrame) -> AggregateCube:
+    """Genre x platform x confidence tier x zone cube, built once per dataset version
+
+    Games count once, under their primary genre and first listed platform,
+    so every slice of the cube adds up to a number of games.
+    """
+    key = (dataset_fingerprint(df), column_hash(df, 'time_respect_score'))
+    cube = _CUBES.get(key)
+    if cube is not None:
+        return cube
+    
+    platforms = label_membership(df, 'platform')
+    genre_codes, genres = pd.factorize(df['primary_genre'], sort=True)
+    zone_codes, zones = pd.factorize(df['zone'], sort=True)
+    tiers = df['confidence_tier'].astype(pd.CategoricalDtype(CONFIDENCE_TIERS))
+    cube = AggregateCube(
+        {
+            'genre': (genre_codes, list(genres)),
+            'platform': (platforms.first, platforms.labels),
+            'tier': (tiers.cat.codes.to_numpy(), CONFIDENCE_TIERS),
+            'zone': (zone_codes, list(zones))
+        },
+        time_cost=df['time_cost'],
+        polls=df['main_story_polled'],
+        trs=df['time_respect_score'] if 'time_respect_score' in df.columns else None
+    )
+    if len(_CUBES) >= 4:
+        del _CUBES[next(iter(_CUBES))]
+    _CUBES[key] = cube
+    return cube
 
 class TimeRespectAnalyzer:
     def __init__(self, filepath: str):
         self.df_raw = pd.read_csv(filepath)
         self.df = None
         self.stats = {}
-        
+    
+    @classmethod
+    def from_frame(cls, df_raw: pd.DataFrame) -> 'TimeRespectAnalyzer':
+        """Build an analyzer over an in-memory frame (synthetic data, benchmarks)"""
+        analyzer = cls.__new__(cls)
+        analyzer.df_raw = df_raw
+        analyzer.df = None
+        analyzer.stats = {}
+        return analyzer
+    
+    @traced
     def clean_data(self) -> pd.DataFrame:
         """Transparent, documented cleaning pipeline"""
         df = self.df_raw.copy()
@@ -31,6 +199,7 @@ class TimeRespectAnalyzer:
         self.df = df
         return df
     
+    @traced
     def compute_metrics(self):
         """Research-grade confidence-aware metrics"""
         df = self.df
@@ -88,6 +257,7 @@ class TimeRespectAnalyzer:
         
         self.df = df
     
+    @traced
     def get_core_insight(self) -> Dict:
         """The unforgettable insight with robust statistics"""
         # Weighted medians (not raw medians)
@@ -123,8 +293,17 @@ class TimeRespectAnalyzer:
             'avg_misrep_risk': avg_risk
         }
     
-    def genre_analysis(self, min_games: int = 30) -> pd.DataFrame:
-        """Genre-level weighted analysis with honesty scoring"""
+    @traced
+    def genre_analysis(self, min_games: int = 30, multi_label: bool = False) -> pd.DataFrame:
+        """Genre-level weighted analysis with honesty scoring
+
+        By default each game counts toward its primary genre only; with
+        multi_label=True it counts toward every genre it is tagged with.
+        """
+        if multi_label:
+            genre_stats = self.label_analysis('genres').rename(columns={'genres': 'primary_genre'})
+            return self._honesty_ranking(genre_stats, min_games)
+        
         def weighted_median(values, weights):
             if len(values) == 0:
                 return 0
@@ -147,6 +326,10 @@ class TimeRespectAnalyzer:
             })
         ).reset_index()
         
+        return self._honesty_ranking(genre_stats, min_games)
+    
+    def _honesty_ranking(self, genre_stats: pd.DataFrame, min_games: int) -> pd.DataFrame:
+        """Perception gap, honesty score and raw vs adjusted rank shift per genre, by adjusted median"""
         genre_stats = genre_stats[genre_stats['count'] >= min_games].copy()
         
         # Honesty score (inverse of perception gap)
@@ -160,6 +343,31 @@ class TimeRespectAnalyzer:
         
         return genre_stats.sort_values('adjusted_median')
     
+    @traced
+    def label_analysis(self, column: str = 'genres') -> pd.DataFrame:
+        """Weighted medians and averages per label of a multi-label column (genres, platform)
+
+        Every game counts toward each of its labels; all statistics are
+        sparse aggregations over the membership matrix.
+        """
+        df = self.df
+        membership = label_membership(df, column)
+        polls = df['main_story_polled']
+        return pd.DataFrame({
+            column: membership.labels,
+            'raw_median': membership.weighted_medians(df['time_cost'], polls).values,
+            'adjusted_median': membership.weighted_medians(df['adjusted_time_cost'], polls).values,
+            'count': membership.counts().values,
+            'total_polls': membership.sums(polls).values,
+            'avg_reliability': membership.means(df['reliability']).values,
+            'avg_risk': membership.means(df['misrep_risk']).values
+        })
+    
+    def label_medians(self, column: str = 'genres', value: str = 'time_cost') -> pd.Series:
+        """Plain median of value per label, over full multi-label membership"""
+        return label_membership(self.df, column).medians(self.df[value])
+    
+    @traced
     def sensitivity_analysis(self, thresholds: List[int] = [1, 5, 10, 20, 50, 100]) -> pd.DataFrame:
         """Robust sensitivity analysis across confidence thresholds"""
         def weighted_median(values, weights):
@@ -191,10 +399,13 @@ class TimeRespectAnalyzer:
                 })
         return pd.DataFrame(results)
     
+    @traced
     def get_zone_distribution(self) -> pd.DataFrame:
         """Distribution across Trust-Time zones"""
-        return self.df['zone'].value_counts().reset_index()
+        zones = aggregate_cube(self.df).groupby('zone')[['zone', 'count']]
+        return zones.sort_values('count', ascending=False, kind='stable').reset_index(drop=True)
     
+    @traced
     def get_illusion_games(self, top_n: int = 20) -> pd.DataFrame:
         """Games with largest perception gaps (False Epics)"""
         illusion = self.df[self.df['main_story_polled'] < 20].copy()
@@ -202,14 +413,21 @@ class TimeRespectAnalyzer:
         return illusion[['name', 'time_cost', 'adjusted_time_cost', 'main_story_polled', 
                         'perception_gap', 'primary_genre', 'zone']]
     
-    def compute_time_respect_score(self):
-        """Time Respect Score (TRS) - penalizes length, rewards confidence, normalizes by genre"""
+    @traced
+    def platform_analysis(self, multi_platform: bool = False, min_games: int = 1) -> pd.DataFrame:
+        """Platform-level medians, confidence distribution and TRS (see platform_stats)"""
+        stats = platform_stats(self.df, multi_platform)
+        return stats[stats['count'] >= min_games].sort_values('median_time').reset_index(drop=True)
+    
+    @traced
+    def compute_time_respect_score(self, multi_label: bool = False):
+        """Time Respect Score (TRS) - penalizes length, rewards confidence, normalizes by genre
+
+        With multi_label=True, genre medians use every game tagged with a
+        genre, and a game's genre deviation is averaged over all its genres.
+        """
         df = self.df
         
-        # Genre median time (expectation)
-        genre_medians = df.groupby('primary_genre')['time_cost'].median()
-        df['genre_median'] = df['primary_genre'].map(genre_medians)
-        
         # Length penalty (exponential decay for extreme length)
         df['length_penalty'] = np.exp(-df['time_cost'] / 30)
         
@@ -217,7 +435,17 @@ class TimeRespectAnalyzer:
         df['confidence_reward'] = df['confidence_score'] / df['confidence_score'].max()
         
         # Genre deviation (penalize games much longer than genre norm)
-        df['genre_deviation'] = 1 / (1 + np.abs(df['time_cost'] - df['genre_median']) / df['genre_median'])
+        if multi_label:
+            membership = label_membership(df, 'genres')
+            medians = membership.spread(membership.medians(df['time_cost']))
+            time_cost = df['time_cost'].to_numpy(dtype=np.float64)[membership.rows]
+            df['genre_median'] = membership.row_means(medians)
+            df['genre_deviation'] = membership.row_means(1 / (1 + np.abs(time_cost - medians) / medians))
+        else:
+            # Genre median time (expectation)
+            genre_medians = df.groupby('primary_genre')['time_cost'].median()
+            df['genre_median'] = df['primary_genre'].map(genre_medians)
+            df['genre_deviation'] = 1 / (1 + np.abs(df['time_cost'] - df['genre_median']) / df['genre_median'])
         
         # TRS formula: weighted combination
         df['time_respect_score'] = (
@@ -228,6 +456,7 @@ class TimeRespectAnalyzer:
         
         self.df = df
     
+    @traced
     def get_trs_leaderboard(self, top_n: int = 10, bottom_n: int = 10) -> tuple:
         """Get top and bottom games by Time Respect Score"""
         top = self.df.nlargest(top_n, 'time_respect_score')[
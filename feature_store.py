@@ -0,0 +1,147 @@
+"""
+Feature Store - Versioned model features, materialised once per dataset
+Training, batch scoring and the app all read the same memory-mapped matrix
+"""
+import hashlib
+import json
+import os
+import numpy as np
+import pandas as pd
+from data_engine import CACHE_DIR, column_hash, dataset_fingerprint
+
+# Bump FEATURE_VERSION whenever a formula below changes; stored matrices
+# built from older definitions are then ignored rather than reused.
+FEATURE_VERSION = 1
+
+FEATURE_DEFINITIONS = {
+    'time_efficiency': '1 / (main_story + 1)',
+    'content_density': 'log1p(main_story_polled)',
+    'repetition_rate': 'main_extras / (main_story + 1), main_story when main_extras is absent',
+    'completion_rate': 'clip(main_story_polled / median(main_story_polled), 0, 2)',
+    'dropoff_risk': 'main_story / 50'
+}
+FEATURE_NAMES = list(FEATURE_DEFINITIONS)
+
+LABEL_QUANTILE = 0.70
+
+def definitions_hash() -> str:
+    """Hash of the feature spec, so a silent formula edit also invalidates the store"""
+    spec = json.dumps({'version': FEATURE_VERSION, 'features': FEATURE_DEFINITIONS,
+                       'label_quantile': LABEL_QUANTILE}, sort_keys=True)
+    return hashlib.sha1(spec.encode()).hexdigest()[:8]
+
+def _label_source(df: pd.DataFrame) -> str:
+    return 'time_respect_score' if 'time_respect_score' in df.columns else 'confidence_score'
+
+def compute_features(df: pd.DataFrame):
+    """Compute the feature matrix (float32, C-contiguous), labels and normalisers in one pass"""
+    main_story = df['main_story'].to_numpy(dtype=np.float64)
+    polled = df['main_story_polled'].to_numpy(dtype=np.float64)
+    extras = df['main_extras'].to_numpy(dtype=np.float64) if 'main_extras' in df.columns else main_story
+    polled_median = float(np.nanmedian(polled))
+    
+    matrix = np.empty((len(df), len(FEATURE_NAMES)), dtype=np.float32, order='C')
+    matrix[:, 0] = 1 / (main_story + 1)
+    matrix[:, 1] = np.log1p(polled)
+    matrix[:, 2] = extras / (main_story + 1)
+    matrix[:, 3] = np.clip(polled / polled_median, 0, 2)
+    matrix[:, 4] = main_story / 50
+    
+    # Handle missing values
+    fill_values = np.nanmedian(matrix, axis=0)
+    missing = np.isnan(matrix)
+    if missing.any():
+        matrix[missing] = np.take(fill_values, np.nonzero(missing)[1])
+    
+    # Binary target: high time respect (top 30%)
+    label_source = _label_source(df)
+    target = df[label_source].to_numpy(dtype=np.float64)
+    threshold = float(np.nanquantile(target, LABEL_QUANTILE))
+    labels = (target >= threshold).astype(np.int8)
+    
+    meta = {
+        'feature_version': FEATURE_VERSION,
+        'definitions_hash': definitions_hash(),
+        'features': FEATURE_NAMES,
+        'label_source': label_source,
+        'label_threshold': threshold,
+        'polled_median': polled_median,
+        'fill_values': [float(v) for v in fill_values],
+        'n_rows': len(df)
+    }
+    return matrix, labels, meta
+
+class FeatureStore:
+    """Memory-mapped feature matrices keyed by dataset version and feature version"""
+
+    def __init__(self, root: str = None):
+        self.root = root or os.path.join(CACHE_DIR, 'features')
+        self._loaded = {}
+    
+    def key(self, df: pd.DataFrame) -> str:
+        # The label column is hashed by value: an in-place TRS recompute keeps the fingerprint
+        label_source = 'trs' if 'time_respect_score' in df.columns else 'conf'
+        label_hash = column_hash(df, _label_source(df))
+        return f"v{FEATURE_VERSION}-{definitions_hash()}-{label_source}{label_hash}-{dataset_fingerprint(df)}"
+    
+    def _path(self, key: str, part: str) -> str:
+        return os.path.join(self.root, f"{key}.{part}")
+    
+    def materialise(self, df: pd.DataFrame) -> str:
+        """Compute and write the feature matrix for this dataset version"""
+        key = self.key(df)
+        os.makedirs(self.root, exist_ok=True)
+        matrix, labels, meta = compute_features(df)
+        
+        for part, array in [('features.npy', matrix), ('labels.npy', labels)]:
+            tmp = self._path(key, part) + '.tmp'
+            with open(tmp, 'wb') as fh:
+                np.save(fh, array)
+            os.replace(tmp, self._path(key, part))
+        
+        # Metadata is written last: its presence marks a complete entry
+        tmp = self._path(key, 'json.tmp')
+        with open(tmp, 'w') as fh:
+            json.dump(meta, fh, indent=2)
+        os.replace(tmp, self._path(key, 'json'))
+        return key
+    
+    def get(self, df: pd.DataFrame) -> dict:
+        """Features, labels and metadata for df, materialising on first use"""
+        key = self.key(df)
+        if key in self._loaded:
+            return self._loaded[key]
+        if not os.path.exists(self._path(key, 'json')):
+            self.materialise(df)
+        
+        with open(self._path(key, 'json')) as fh:
+            meta = json.load(fh)
+        entry = {
+            'key': key,
+            'features': np.load(self._path(key, 'features.npy'), mmap_mode='r'),
+            'labels': np.load(self._path(key, 'labels.npy'), mmap_mode='r'),
+            'meta': meta
+        }
+        self._loaded[key] = entry
+        return entry
+    
+    def frames(self, df: pd.DataFrame):
+        """(features DataFrame, label Series) views over the memory-mapped arrays
+
+        Rows are in df's order; the key's fingerprint covers df's index, so
+        df.index labels them whatever its dtype.
+        """
+        entry = self.get(df)
+        index = df.index
+        X = pd.DataFrame(entry['features'], columns=FEATURE_NAMES, index=index, copy=False)
+        y = pd.Series(entry['labels'], index=index, name=entry['meta']['label_source'], copy=False)
+        return X, y
+
+def score_games(model, df: pd.DataFrame, store: FeatureStore, batch_size: int = 65536) -> np.ndarray:
+    """Batch-score every game straight from the stored matrix, one slice at a time"""
+    features = store.get(df)['features']
+    scores = np.empty(len(features), dtype=np.float32)
+    for start in range(0, len(features), batch_size):
+        batch = pd.DataFrame(np.asarray(features[start:start + batch_size]), columns=FEATURE_NAMES)
+        scores[start:start + batch_size] = model.predict_proba(batch)[:, 1]
+    return scores
@@ -0,0 +1,208 @@
+"""
+Figure Cache - Serialised Plotly figures keyed by builder, arguments and dataset version
+A rerun with unchanged inputs rebuilds the figure from stored JSON instead of recomputing traces;
+figures are compacted for the browser once, when they are stored
+
+    TRS_FIGURE_CACHE=0 streamlit run app.py        # bypass the cache
+"""
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+import plotly
+import plotly.graph_objects as go
+from data_engine import CACHE_DIR, RECOMPUTED_COLUMNS, column_hash, dataset_fingerprint
+from payload import compact_figure, payload_report
+
+_config = {
+    'enabled': os.environ.get('TRS_FIGURE_CACHE', '1') != '0',
+    'root': os.path.join(CACHE_DIR, 'figures'),
+    'memory_entries': 64,
+    'disk_bytes': int(os.environ.get('TRS_FIGURE_CACHE_MB', '256')) * 2**20
+}
+_code_version = []
+_memory = OrderedDict()
+_lock = threading.Lock()
+_stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'bypassed': 0}
+
+class _Uncacheable(Exception):
+    pass
+
+def configure_figure_cache(enabled: bool = None, root: str = None, memory_entries: int = None,
+                           disk_bytes: int = None):
+    """Change cache settings at runtime (benchmarks turn it off)"""
+    for name, value in [('enabled', enabled), ('root', root), ('memory_entries', memory_entries),
+                        ('disk_bytes', disk_bytes)]:
+        if value is not None:
+            _config[name] = value
+
+def clear_figure_cache(disk: bool = False):
+    """Drop in-memory entries, and on-disk ones too when disk=True"""
+    with _lock:
+        _memory.clear()
+        if disk and os.path.isdir(_config['root']):
+            for entry in os.scandir(_config['root']):
+                if entry.name.endswith('.json'):
+                    os.remove(entry.path)
+
+def figure_cache_stats() -> dict:
+    """Hit and miss counters since start-up"""
+    return dict(_stats)
+
+def code_version() -> str:
+    """Hash of every module next to this one, so a code change invalidates on-disk figures
+
+    A builder's own source is not enough: the helpers it calls can change
+    the figure without touching it.
+    """
+    if not _code_version:
+        root = os.path.dirname(os.path.abspath(__file__))
+        hasher = hashlib.sha1()
+        for name in sorted(os.listdir(root)):
+            if name.endswith('.py'):
+                hasher.update(name.encode())
+                with open(os.path.join(root, name), 'rb') as fh:
+                    hasher.update(fh.read())
+        _code_version.append(hasher.hexdigest()[:16])
+    return _code_version[0]
+
+def _token(value, hasher):
+    """Feed a stable description of an argument into hasher"""
+    if isinstance(value, pd.DataFrame):
+        hasher.update(b'df' + dataset_fingerprint(value, columns=list(value.columns)).encode())
+        # The fingerprint memo cannot see in-place rewrites, so these are hashed by value every call
+        for column in RECOMPUTED_COLUMNS:
+            hasher.update(column_hash(value, column).encode())
+    elif isinstance(value, pd.Series):
+        hasher.update(b'series' + repr(value.name).encode())
+        hasher.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, np.ndarray):
+        hasher.update(f'nd{value.dtype}{value.shape}'.encode())
+        hasher.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        hasher.update(b'{')
+        for k in sorted(value, key=repr):
+            hasher.update(repr(k).encode())
+            _token(value[k], hasher)
+        hasher.update(b'}')
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b'[' if isinstance(value, list) else b'(')
+        for item in value:
+            _token(item, hasher)
+        hasher.update(b']')
+    elif value is None or isinstance(value, (str, int, float, bool, np.generic)):
+        hasher.update(repr(value).encode())
+    else:
+        # Fitted models and other objects: hash their pickled state
+        try:
+            hasher.update(type(value).__qualname__.encode() + pickle.dumps(value, protocol=4))
+        except Exception as exc:
+            raise _Uncacheable(type(value).__name__) from exc
+
+def _read_disk(path: str):
+    try:
+        with open(path) as fh:
+            payload = fh.read()
+        os.utime(path)
+        return payload
+    except OSError:
+        return None
+
+def _write_disk(path: str, payload: str):
+    """Atomic write, then evict least recently used files beyond the size bound"""
+    root = _config['root']
+    os.makedirs(root, exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w') as fh:
+        fh.write(payload)
+    os.replace(tmp, path)
+    
+    entries = [e for e in os.scandir(root) if e.name.endswith('.json')]
+    total = sum(e.stat().st_size for e in entries)
+    for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+        if total <= _config['disk_bytes']:
+            break
+        total -= entry.stat().st_size
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
+
+def _figure(payload: str) -> go.Figure:
+    """Stored entry (payload report line, then figure JSON) back to a compacted figure"""
+    report, _, spec = payload.partition('\n')
+    # Stored JSON came from a validated figure; skip re-validation
+    fig = go.Figure(json.loads(spec), _validate=False)
+    fig._payload_report = json.loads(report)
+    return fig
+
+def _remember(key: str, payload: str):
+    with _lock:
+        _memory[key] = payload
+        _memory.move_to_end(key)
+        while len(_memory) > _config['memory_entries']:
+            _memory.popitem(last=False)
+
+def cached_figure(fn):
+    """Cache a figure builder's compacted output as JSON in memory and on disk
+
+    The builder's figure goes through compact_figure once, on a miss; the
+    returned figure carries its payload report as _payload_report, which
+    tells render_chart it is already compacted.
+    The key combines the builder's name and source, the code version of
+    the app's modules, the plotly version and every argument; DataFrames contribute their dataset fingerprint. Builders
+    called with arguments that cannot be hashed simply run uncached.
+    """
+    name = f"{fn.__module__}.{fn.__qualname__}"
+    source = hashlib.sha1(inspect.getsource(fn).encode()).hexdigest()
+    signature = inspect.signature(fn)
+    
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not _config['enabled']:
+            return fn(*args, **kwargs)
+        
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        hasher = hashlib.sha1(f"{name}|{source}|{code_version()}|{plotly.__version__}".encode())
+        try:
+            _token(dict(bound.arguments), hasher)
+        except _Uncacheable:
+            _stats['bypassed'] += 1
+            return fn(*args, **kwargs)
+        key = hasher.hexdigest()
+        path = os.path.join(_config['root'], f"{key}.json")
+        
+        with _lock:
+            payload = _memory.get(key)
+            if payload is not None:
+                _memory.move_to_end(key)
+                _stats['memory_hits'] += 1
+        if payload is None:
+            payload = _read_disk(path)
+            if payload is not None:
+                _stats['disk_hits'] += 1
+                _remember(key, payload)
+        if payload is not None:
+            return _figure(payload)
+        
+        _stats['misses'] += 1
+        fig = fn(*args, **kwargs)
+        compact = compact_figure(fig)
+        report = payload_report(fig, compact)
+        payload = json.dumps(report) + '\n' + compact.to_json()
+        _remember(key, payload)
+        try:
+            _write_disk(path, payload)
+        except OSError:
+            pass
+        compact._payload_report = report
+        return compact
+    
+    return wrapper
@@ -0,0 +1,135 @@
+"""
+Journey Store - Synthetic player journeys for every game, generated in one vectorised batch
+Stored as a memory-mapped (games, points, metrics) float16 array per dataset version
+"""
+import json
+import os
+import numpy as np
+import pandas as pd
+from data_engine import CACHE_DIR, dataset_fingerprint
+from timeline_viz import JOURNEY_METRICS
+
+# Bump JOURNEY_VERSION whenever the journey model below changes
+JOURNEY_VERSION = 1
+JOURNEY_POINTS = 50
+BLOCK_GAMES = 65_536
+
+# Per-metric noise at the reference confidence, and clip range
+NOISE = np.array([3.0, 0.3, 2.0, 4.0, 3.0])
+CLIP_LOW = np.array([20.0, 0.05, 0.0, 20.0, 10.0])
+CLIP_HIGH = np.array([100.0, 10.0, 50.0, 100.0, 80.0])
+
+def _journey_block(seed: int, block: int, main_story: np.ndarray, confidence: np.ndarray,
+                   points: int) -> np.ndarray:
+    """Journeys for one block of games from its own SeedSequence stream
+
+    The shape follows generate_synthetic_journey on a 0-100 scale stretched
+    over each game's main story; time to progress scales with game length,
+    and noise shrinks as confidence (log polls) grows.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+    n = len(main_story)
+    x = np.linspace(0, 100, points)[None, :]
+    length = (main_story / 100)[:, None]
+    noise_scale = np.clip(3 / (1 + confidence), 0.3, 2.0)[:, None, None]
+    
+    early = np.exp(-x / 10) * 30 + 70
+    mid = 60 + 10 * np.sin(x / 15)
+    late = 50 - x / 10
+    
+    curves = np.empty((n, points, len(JOURNEY_METRICS)), dtype=np.float64)
+    curves[:, :, 0] = np.where(x < 20, early, np.where(x < 60, mid, late))
+    curves[:, :, 1] = (2 + x / 20) * length
+    curves[:, :, 2] = 5 + x / 5 + np.where(x > 40, (x - 40) / 2, 0)
+    curves[:, :, 3] = 70 - x / 3 + 10 * np.sin(x / 10)
+    curves[:, :, 4] = 20 + x / 2 + np.where(x > 50, (x - 50) * 0.8, 0)
+    
+    curves += rng.standard_normal(curves.shape) * NOISE * noise_scale
+    return np.clip(curves, CLIP_LOW, CLIP_HIGH).astype(np.float16)
+
+def generate_journey_batch(main_story, confidence, points: int = JOURNEY_POINTS, seed: int = 42,
+                           out: np.ndarray = None) -> np.ndarray:
+    """(games, points, metrics) journeys; game i always gets the same stream for a given seed"""
+    main_story = np.nan_to_num(np.asarray(main_story, dtype=np.float64), nan=10.0)
+    confidence = np.nan_to_num(np.asarray(confidence, dtype=np.float64))
+    n = len(main_story)
+    if out is None:
+        out = np.empty((n, points, len(JOURNEY_METRICS)), dtype=np.float16)
+    for block, start in enumerate(range(0, n, BLOCK_GAMES)):
+        stop = min(start + BLOCK_GAMES, n)
+        out[start:stop] = _journey_block(seed, block, main_story[start:stop], confidence[start:stop], points)
+    return out
+
+class JourneyStore:
+    """Memory-mapped journeys keyed by dataset version, journey version and seed"""
+
+    def __init__(self, root: str = None, points: int = JOURNEY_POINTS, seed: int = 42):
+        self.root = root or os.path.join(CACHE_DIR, 'journeys')
+        self.points = points
+        self.seed = seed
+        self._loaded = {}
+    
+    def key(self, df: pd.DataFrame) -> str:
+        return f"v{JOURNEY_VERSION}-p{self.points}-s{self.seed}-{dataset_fingerprint(df)}"
+    
+    def _path(self, key: str, part: str) -> str:
+        return os.path.join(self.root, f"{key}.{part}")
+    
+    def materialise(self, df: pd.DataFrame) -> str:
+        """Generate every game's journey straight into the memory-mapped file"""
+        key = self.key(df)
+        os.makedirs(self.root, exist_ok=True)
+        shape = (len(df), self.points, len(JOURNEY_METRICS))
+        
+        tmp = self._path(key, 'journeys.npy.tmp')
+        journeys = np.lib.format.open_memmap(tmp, mode='w+', dtype=np.float16, shape=shape)
+        generate_journey_batch(df['main_story'], df['confidence_score'], self.points, self.seed, out=journeys)
+        journeys.flush()
+        del journeys
+        os.replace(tmp, self._path(key, 'journeys.npy'))
+        
+        tmp = self._path(key, 'horizon.npy.tmp')
+        with open(tmp, 'wb') as fh:
+            np.save(fh, df['main_story'].to_numpy(dtype=np.float32))
+        os.replace(tmp, self._path(key, 'horizon.npy'))
+        
+        # Metadata is written last: its presence marks a complete entry
+        tmp = self._path(key, 'json.tmp')
+        with open(tmp, 'w') as fh:
+            json.dump({'journey_version': JOURNEY_VERSION, 'metrics': JOURNEY_METRICS,
+                       'points': self.points, 'seed': self.seed, 'n_games': len(df)}, fh, indent=2)
+        os.replace(tmp, self._path(key, 'json'))
+        return key
+    
+    def get(self, df: pd.DataFrame) -> dict:
+        """Journeys and horizons for df (row i is df.iloc[i]), materialising on first use"""
+        key = self.key(df)
+        if key in self._loaded:
+            return self._loaded[key]
+        if not os.path.exists(self._path(key, 'json')):
+            self.materialise(df)
+        
+        with open(self._path(key, 'json')) as fh:
+            meta = json.load(fh)
+        entry = {
+            'key': key,
+            'journeys': np.load(self._path(key, 'journeys.npy'), mmap_mode='r'),
+            'horizon': np.load(self._path(key, 'horizon.npy'), mmap_mode='r'),
+            'meta': meta
+        }
+        self._loaded[key] = entry
+        return entry
+    
+    def journey(self, df: pd.DataFrame, label) -> pd.DataFrame:
+        """One game's journey (by row label) in the generate_synthetic_journey layout
+
+        Labels resolve through df.index, which the dataset fingerprint in the
+        key covers; a duplicated label gives its first row.
+        """
+        entry = self.get(df)
+        position = df.index.get_loc(label)
+        if not isinstance(position, (int, np.integer)):
+            position = np.arange(len(df))[position][0]
+        frame = pd.DataFrame(np.asarray(entry['journeys'][position], dtype=np.float64), columns=JOURNEY_METRICS)
+        frame.insert(0, 'hours', np.linspace(0, float(entry['horizon'][position]), self.points))
+        return frame
@@ -8,8 +8,10 @@ import numpy as np
 import pandas as pd
 from sklearn.linear_model import LogisticRegression
 from sklearn.ensemble import GradientBoostingClassifier
-from sklearn.metrics import roc_curve, auc
 from sklearn.model_selection import train_test_split
+from feature_store import FEATURE_NAMES, compute_features
+from figure_cache import cached_figure
+from tracing import traced
 
 MODEL_PALETTE = {
     'bg': '#0f1419',
@@ -24,76 +26,237 @@ MODEL_PALETTE = {
     'negative': '#ef5350'
 }
 
-def prepare_model_data(df):
-    """Prepare features for time respect prediction"""
-    # Create binary target: high time respect (top 30%)
-    threshold = df['time_respect_score'].quantile(0.70) if 'time_respect_score' in df.columns else df['confidence_score'].quantile(0.70)
+MODEL_LABELS = {
+    'logistic': 'Logistic Regression',
+    'gradient': 'Gradient Boosting'
+}
+
+@traced
+def prepare_model_data(df, store=None):
+    """Prepare features for time respect prediction
+
+    With a FeatureStore the memory-mapped matrix for this dataset version is
+    read back instead of recomputed; without one the same versioned
+    definitions are evaluated in memory.
+    """
+    if store is not None:
+        return store.frames(df)
     
-    if 'time_respect_score' in df.columns:
-        y = (df['time_respect_score'] >= threshold).astype(int)
-    else:
-        y = (df['confidence_score'] >= threshold).astype(int)
+    matrix, labels, meta = compute_features(df)
+    features = pd.DataFrame(matrix, columns=FEATURE_NAMES, index=df.index)
+    y = pd.Series(labels, index=df.index, name=meta['label_source'])
     
-    # Feature engineering
-    features = pd.DataFrame({
-        'time_efficiency': 1 / (df['main_story'] + 1),
-        'content_density': np.log1p(df['main_story_polled']),
-        'repetition_rate': df.get('main_extras', df['main_story']) / (df['main_story'] + 1),
-        'completion_rate': np.clip(df['main_story_polled'] / df['main_story_polled'].median(), 0, 2),
-        'dropoff_risk': df['main_story'] / 50
-    })
+    return features, y
+
+def _tie_ends(sorted_scores):
+    """Last position of every run of tied scores (one threshold per distinct score)"""
+    change = np.flatnonzero(np.diff(sorted_scores))
+    return np.r_[change, len(sorted_scores) - 1]
+
+def _bootstrap_weights(rng, n, n_rows):
+    """Multinomial resampling counts for n_rows replicates in a single bincount"""
+    idx = rng.integers(0, n, size=(n_rows, n))
+    idx += (np.arange(n_rows) * n)[:, None]
+    return np.bincount(idx.ravel(), minlength=n_rows * n).reshape(n_rows, n).astype(np.float64)
+
+def _interp_rows(grid, x, y):
+    """Interpolate every row of monotone curves in [0, 1] on a shared grid with one np.interp"""
+    offsets = (np.arange(x.shape[0]) * 2.0)[:, None]
+    values = np.interp((grid[None, :] + offsets).ravel(), (x + offsets).ravel(), y.ravel())
+    return values.reshape(x.shape[0], len(grid))
+
+def _weighted_curves(w, y_sorted, s_sorted, ends, bin_ends):
+    """ROC, PR and calibration statistics for each row of resampling weights
+
+    Works on descending-sorted scores: every statistic is a difference of
+    cumulative sums, so all replicates are evaluated in one pass.
+    """
+    cum_w = np.cumsum(w, axis=1)
+    cum_pos = np.cumsum(w * y_sorted, axis=1)
+    cum_score = np.cumsum(w * s_sorted, axis=1)
     
-    # Handle missing values
-    features = features.fillna(features.median())
+    tp = cum_pos[:, ends]
+    fp = cum_w[:, ends] - tp
+    n_pos = tp[:, -1:]
+    n_neg = fp[:, -1:]
     
-    return features, y
+    zeros = np.zeros((w.shape[0], 1))
+    tpr = np.hstack([zeros, tp / n_pos])
+    fpr = np.hstack([zeros, fp / n_neg])
+    roc_auc = 0.5 * np.sum(np.diff(fpr, axis=1) * (tpr[:, 1:] + tpr[:, :-1]), axis=1)
+    
+    predicted = tp + fp
+    precision = np.divide(tp, predicted, out=np.ones_like(tp), where=predicted > 0)
+    recall = tpr[:, 1:]
+    avg_precision = np.sum(np.diff(np.hstack([zeros, recall]), axis=1) * precision, axis=1)
+    
+    # Calibration bins are contiguous runs in the sorted order
+    starts = np.r_[0, bin_ends[:-1] + 1]
+    def bin_sums(cum):
+        padded = np.hstack([zeros, cum])
+        return padded[:, bin_ends + 1] - padded[:, starts]
+    count = bin_sums(cum_w)
+    pos = bin_sums(cum_pos)
+    score = bin_sums(cum_score)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        frac_pos = pos / count
+        mean_pred = score / count
+    
+    return {
+        'fpr': fpr, 'tpr': tpr, 'auc': roc_auc,
+        'precision': np.hstack([np.ones((w.shape[0], 1)), precision]),
+        'recall': np.hstack([zeros, recall]),
+        'average_precision': avg_precision,
+        'count': count, 'fraction_positive': frac_pos, 'mean_predicted': mean_pred
+    }
 
-def train_models(X, y):
-    """Train prediction models and compute ROC curves"""
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+@traced
+def evaluate_models(y_true, scores, n_bootstrap=200, n_bins=10, level=0.95,
+                    grid_size=101, seed=42, chunk_size=None):
+    """ROC, precision-recall and calibration curves for any number of models
+
+    `scores` maps model name -> predicted probability of the positive class.
+    Each model's scores are sorted once; the point estimate and all bootstrap
+    replicates are read off cumulative sums over that sorted array. Replicates
+    share the same resampling weights across models (paired bootstrap) and are
+    processed in vectorised chunks, so there is no Python loop per replicate.
+    """
+    y = np.asarray(y_true, dtype=np.float64)
+    n = len(y)
+    rng = np.random.default_rng(seed)
+    grid = np.linspace(0, 1, grid_size)
+    tail = 100 * (1 - level) / 2
+    if chunk_size is None:
+        chunk_size = max(1, min(n_bootstrap, 4_000_000 // max(n, 1)))
+    
+    prepared = {}
+    for name, s in scores.items():
+        s = np.asarray(s, dtype=np.float64)
+        order = np.argsort(-s, kind='mergesort')
+        s_sorted = s[order]
+        bins = np.clip((s_sorted * n_bins).astype(int), 0, n_bins - 1)
+        prepared[name] = {
+            'order': order,
+            'y': y[order],
+            's': s_sorted,
+            'ends': _tie_ends(s_sorted),
+            'bin_ends': _tie_ends(bins),
+            'replicates': {'tpr': [], 'precision': [], 'auc': [], 'average_precision': [], 'fraction_positive': []}
+        }
     
-    # Logistic Regression
-    lr = LogisticRegression(random_state=42, max_iter=1000)
-    lr.fit(X_train, y_train)
-    lr_probs = lr.predict_proba(X_test)[:, 1]
-    lr_fpr, lr_tpr, _ = roc_curve(y_test, lr_probs)
-    lr_auc = auc(lr_fpr, lr_tpr)
+    for start in range(0, n_bootstrap, chunk_size):
+        w = _bootstrap_weights(rng, n, min(chunk_size, n_bootstrap - start))
+        for p in prepared.values():
+            curves = _weighted_curves(w[:, p['order']], p['y'], p['s'], p['ends'], p['bin_ends'])
+            valid = np.isfinite(curves['auc'])
+            reps = p['replicates']
+            reps['tpr'].append(_interp_rows(grid, curves['fpr'][valid], curves['tpr'][valid]))
+            reps['precision'].append(_interp_rows(grid, curves['recall'][valid], curves['precision'][valid]))
+            reps['auc'].append(curves['auc'][valid])
+            reps['average_precision'].append(curves['average_precision'][valid])
+            reps['fraction_positive'].append(curves['fraction_positive'][valid])
     
-    # Gradient Boosting
-    gb = GradientBoostingClassifier(random_state=42, n_estimators=100)
-    gb.fit(X_train, y_train)
-    gb_probs = gb.predict_proba(X_test)[:, 1]
-    gb_fpr, gb_tpr, _ = roc_curve(y_test, gb_probs)
-    gb_auc = auc(gb_fpr, gb_tpr)
+    results = {}
+    for name, p in prepared.items():
+        point = _weighted_curves(np.ones((1, n)), p['y'], p['s'], p['ends'], p['bin_ends'])
+        result = {
+            'fpr': point['fpr'][0],
+            'tpr': point['tpr'][0],
+            'thresholds': np.r_[np.inf, p['s'][p['ends']]],
+            'auc': float(point['auc'][0]),
+            'precision': point['precision'][0][::-1],
+            'recall': point['recall'][0][::-1],
+            'average_precision': float(point['average_precision'][0]),
+            'calibration': {
+                'mean_predicted': point['mean_predicted'][0][::-1],
+                'fraction_positive': point['fraction_positive'][0][::-1],
+                'count': point['count'][0][::-1]
+            }
+        }
+        
+        reps = {k: np.concatenate(v) for k, v in p['replicates'].items() if v}
+        if reps and len(reps['auc']) > 0:
+            lo, hi = tail, 100 - tail
+            with np.errstate(invalid='ignore'):
+                frac_lo, frac_hi = np.nanpercentile(reps['fraction_positive'], [lo, hi], axis=0)
+            result['bands'] = {
+                'level': level,
+                'n_replicates': len(reps['auc']),
+                'fpr_grid': grid,
+                'tpr_lower': np.percentile(reps['tpr'], lo, axis=0),
+                'tpr_upper': np.percentile(reps['tpr'], hi, axis=0),
+                'recall_grid': grid,
+                'precision_lower': np.percentile(reps['precision'], lo, axis=0),
+                'precision_upper': np.percentile(reps['precision'], hi, axis=0),
+                'auc_ci': tuple(float(v) for v in np.percentile(reps['auc'], [lo, hi])),
+                'average_precision_ci': tuple(float(v) for v in np.percentile(reps['average_precision'], [lo, hi])),
+                'fraction_positive_lower': frac_lo[::-1],
+                'fraction_positive_upper': frac_hi[::-1]
+            }
+        results[name] = result
     
+    return results
+
+def build_models():
+    """Fresh, unfitted instances of every model we evaluate"""
     return {
-        'logistic': {'fpr': lr_fpr, 'tpr': lr_tpr, 'auc': lr_auc, 'model': lr},
-        'gradient': {'fpr': gb_fpr, 'tpr': gb_tpr, 'auc': gb_auc, 'model': gb}
+        'logistic': LogisticRegression(random_state=42, max_iter=1000),
+        'gradient': GradientBoostingClassifier(random_state=42, n_estimators=100)
     }
 
+@traced
+def train_models(X, y, n_bootstrap=200, models=None):
+    """Train prediction models and evaluate them with bootstrap confidence bands
+
+    models optionally names a subset of build_models() to train.
+    """
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.3, random_state=42)
+    
+    models = {name: model for name, model in build_models().items() if models is None or name in models}
+    
+    scores = {}
+    for name, model in models.items():
+        model.fit(X_train, y_train)
+        scores[name] = model.predict_proba(X_test)[:, 1]
+    
+    results = evaluate_models(y_test, scores, n_bootstrap=n_bootstrap)
+    for name, model in models.items():
+        results[name]['model'] = model
+    
+    return results
+
+def _band_traces(x, lower, upper, color):
+    """Shaded confidence band drawn as an upper edge plus a filled lower edge"""
+    fill = f"rgba{tuple(list(bytes.fromhex(color[1:])) + [0.15])}"
+    return [
+        go.Scatter(x=x, y=upper, mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'),
+        go.Scatter(x=x, y=lower, mode='lines', line=dict(width=0), fill='tonexty',
+                   fillcolor=fill, showlegend=False, hoverinfo='skip')
+    ]
+
+def _model_style(name):
+    """Display label and colour for a model key"""
+    return MODEL_LABELS.get(name, name), MODEL_PALETTE.get(name, MODEL_PALETTE['text_dim'])
+
+@traced
+@cached_figure
 def create_roc_curve(results):
-    """Create ROC curve visualization"""
+    """Create ROC curve visualization with bootstrap confidence bands"""
     fig = go.Figure()
     
-    # Gradient Boosting
-    fig.add_trace(go.Scatter(
-        x=results['gradient']['fpr'],
-        y=results['gradient']['tpr'],
-        mode='lines',
-        name=f"Gradient Boosting (AUC={results['gradient']['auc']:.3f})",
-        line=dict(color=MODEL_PALETTE['gradient'], width=3),
-        hovertemplate='FPR: %{x:.3f}<br>TPR: %{y:.3f}<extra></extra>'
-    ))
-    
-    # Logistic Regression
-    fig.add_trace(go.Scatter(
-        x=results['logistic']['fpr'],
-        y=results['logistic']['tpr'],
-        mode='lines',
-        name=f"Logistic Regression (AUC={results['logistic']['auc']:.3f})",
-        line=dict(color=MODEL_PALETTE['logistic'], width=3),
-        hovertemplate='FPR: %{x:.3f}<br>TPR: %{y:.3f}<extra></extra>'
-    ))
+    for name, res in results.items():
+        label, color = _model_style(name)
+        if 'bands' in res:
+            bands = res['bands']
+            fig.add_traces(_band_traces(bands['fpr_grid'], bands['tpr_lower'], bands['tpr_upper'], color))
+        fig.add_trace(go.Scatter(
+            x=res['fpr'],
+            y=res['tpr'],
+            mode='lines',
+            name=f"{label} (AUC={res['auc']:.3f})",
+            line=dict(color=color, width=3),
+            hovertemplate='FPR: %{x:.3f}<br>TPR: %{y:.3f}<extra></extra>'
+        ))
     
     # Random baseline
     fig.add_trace(go.Scatter(
@@ -145,6 +308,122 @@ def create_roc_curve(results):
     
     return fig
 
+def _curve_layout(fig, x_title, y_title, legend_y=0.02, legend_yanchor='bottom'):
+    """Shared dark layout for model evaluation curves"""
+    fig.update_layout(
+        plot_bgcolor=MODEL_PALETTE['bg'],
+        paper_bgcolor=MODEL_PALETTE['bg'],
+        font=dict(family='Inter, sans-serif', color=MODEL_PALETTE['text'], size=12),
+        xaxis=dict(
+            title=x_title,
+            gridcolor=MODEL_PALETTE['grid'],
+            gridwidth=1,
+            showgrid=True,
+            zeroline=False,
+            range=[0, 1],
+            title_font=dict(size=13)
+        ),
+        yaxis=dict(
+            title=y_title,
+            gridcolor=MODEL_PALETTE['grid'],
+            gridwidth=1,
+            showgrid=True,
+            zeroline=False,
+            range=[0, 1],
+            title_font=dict(size=13)
+        ),
+        legend=dict(
+            orientation='v',
+            yanchor=legend_yanchor,
+            y=legend_y,
+            xanchor='right' if legend_yanchor == 'bottom' else 'left',
+            x=0.98 if legend_yanchor == 'bottom' else 0.02,
+            bgcolor='rgba(0,0,0,0.3)',
+            bordercolor=MODEL_PALETTE['grid'],
+            borderwidth=1,
+            font=dict(size=11)
+        ),
+        margin=dict(l=60, r=20, t=20, b=60),
+        height=450,
+        hovermode='closest'
+    )
+    return fig
+
+@traced
+@cached_figure
+def create_pr_curve(results):
+    """Create precision-recall curve visualization with bootstrap confidence bands"""
+    fig = go.Figure()
+    
+    for name, res in results.items():
+        label, color = _model_style(name)
+        if 'bands' in res:
+            bands = res['bands']
+            fig.add_traces(_band_traces(bands['recall_grid'], bands['precision_lower'], bands['precision_upper'], color))
+        fig.add_trace(go.Scatter(
+            x=res['recall'],
+            y=res['precision'],
+            mode='lines',
+            name=f"{label} (AP={res['average_precision']:.3f})",
+            line=dict(color=color, width=3, shape='hv'),
+            hovertemplate='Recall: %{x:.3f}<br>Precision: %{y:.3f}<extra></extra>'
+        ))
+    
+    return _curve_layout(fig, 'Recall', 'Precision')
+
+@traced
+@cached_figure
+def create_calibration_curve(results):
+    """Create reliability diagram: predicted probability vs observed positive rate"""
+    fig = go.Figure()
+    
+    for name, res in results.items():
+        label, color = _model_style(name)
+        calib = res['calibration']
+        observed = calib['count'] > 0
+        if 'bands' in res:
+            bands = res['bands']
+            fig.add_trace(go.Scatter(
+                x=calib['mean_predicted'][observed],
+                y=calib['fraction_positive'][observed],
+                mode='markers',
+                marker=dict(opacity=0),
+                error_y=dict(
+                    type='data',
+                    symmetric=False,
+                    array=(bands['fraction_positive_upper'] - calib['fraction_positive'])[observed],
+                    arrayminus=(calib['fraction_positive'] - bands['fraction_positive_lower'])[observed],
+                    color=color,
+                    thickness=1.5,
+                    width=4
+                ),
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+        fig.add_trace(go.Scatter(
+            x=calib['mean_predicted'][observed],
+            y=calib['fraction_positive'][observed],
+            mode='lines+markers',
+            name=label,
+            line=dict(color=color, width=3),
+            marker=dict(size=8, color=color),
+            customdata=calib['count'][observed],
+            hovertemplate='Predicted: %{x:.3f}<br>Observed: %{y:.3f}<br>Games: %{customdata:.0f}<extra></extra>'
+        ))
+    
+    # Perfect calibration
+    fig.add_trace(go.Scatter(
+        x=[0, 1],
+        y=[0, 1],
+        mode='lines',
+        name='Perfect Calibration',
+        line=dict(color=MODEL_PALETTE['baseline'], width=2, dash='dash'),
+        hoverinfo='skip'
+    ))
+    
+    return _curve_layout(fig, 'Mean Predicted Probability', 'Observed Positive Rate',
+                         legend_y=0.98, legend_yanchor='top')
+
 def get_feature_importance(model, feature_names):
     """Extract feature importance/coefficients"""
     if hasattr(model, 'coef_'):
@@ -165,6 +444,8 @@ def get_feature_importance(model, feature_names):
         'impact': ['Positive' if x > 0 else 'Negative' for x in importance]
     }).sort_values('importance', ascending=False)
 
+@traced
+@cached_figure
 def create_feature_importance_viz(importance_df):
     """Create feature importance horizontal bar chart"""
     fig = go.Figure()
@@ -0,0 +1,139 @@
+"""
+Multi-Label Membership - Comma-separated tag columns (genres, platform) as sparse matrices
+A game tagged "Action, RPG" is a member of both labels; per-label statistics
+are computed by sparse aggregation over the membership matrix instead of
+exploding the frame
+"""
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+class MultiLabelIndex:
+    """CSR membership matrix (games x labels) parsed once from a comma-separated column
+
+    Only the distinct tag strings are split in Python; every row then
+    reuses the parsed labels of its string.
+    """
+
+    def __init__(self, values: pd.Series, missing: str = 'Unknown'):
+        codes, uniques = pd.factorize(values.fillna(missing).astype(str), sort=False)
+        parsed = [list(dict.fromkeys(t.strip() for t in s.split(',') if t.strip())) or [missing]
+                  for s in uniques]
+        self.labels = sorted({label for tags in parsed for label in tags})
+        label_codes = {label: i for i, label in enumerate(self.labels)}
+        
+        # Membership of each distinct string, then one sparse row gather for every game
+        lengths = np.array([len(tags) for tags in parsed])
+        columns = np.array([label_codes[label] for tags in parsed for label in tags], dtype=np.int32)
+        by_string = sparse.csr_matrix(
+            (np.ones(len(columns), dtype=np.float64), columns, np.concatenate([[0], np.cumsum(lengths)])),
+            shape=(len(uniques), len(self.labels))
+        )
+        self.matrix = by_string[codes].tocsr()
+        self.matrix.sort_indices()
+        # First listed label of every game (its primary genre or platform)
+        self.first = np.array([label_codes[tags[0]] for tags in parsed], dtype=np.int32)[codes]
+    
+    def primary(self) -> 'MultiLabelIndex':
+        """The same labels with each game a member of its first label only"""
+        index = MultiLabelIndex.__new__(MultiLabelIndex)
+        index.labels = self.labels
+        index.first = self.first
+        n = len(self.first)
+        index.matrix = sparse.csr_matrix(
+            (np.ones(n, dtype=np.float64), self.first, np.arange(n + 1)), shape=(n, len(self.labels))
+        )
+        return index
+    
+    def members_of(self, labels) -> np.ndarray:
+        """Boolean mask of games carrying any of labels"""
+        wanted = [i for i, label in enumerate(self.labels) if label in set(labels)]
+        if not wanted:
+            return np.zeros(len(self), dtype=bool)
+        return np.asarray(self.matrix[:, wanted].sum(axis=1)).ravel() > 0
+    
+    def __len__(self):
+        return self.matrix.shape[0]
+    
+    @property
+    def rows(self) -> np.ndarray:
+        """Game position of every membership entry, in CSR order"""
+        return np.repeat(np.arange(len(self), dtype=np.int64), np.diff(self.matrix.indptr))
+    
+    @property
+    def columns(self) -> np.ndarray:
+        """Label of every membership entry, in CSR order"""
+        return self.matrix.indices
+    
+    def counts(self) -> pd.Series:
+        """Games per label"""
+        return pd.Series(np.asarray(self.matrix.sum(axis=0)).ravel().astype(np.int64), index=self.labels)
+    
+    def sums(self, values) -> pd.Series:
+        """Per-label sum of a per-game value (NaN counts as 0)"""
+        values = np.nan_to_num(np.asarray(values, dtype=np.float64))
+        return pd.Series(self.matrix.T @ values, index=self.labels)
+    
+    def means(self, values) -> pd.Series:
+        """Per-label mean of a per-game value over non-missing members"""
+        values = np.asarray(values, dtype=np.float64)
+        present = (~np.isnan(values)).astype(np.float64)
+        totals = self.matrix.T @ np.nan_to_num(values)
+        n = self.matrix.T @ present
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.Series(np.where(n > 0, totals / n, np.nan), index=self.labels)
+    
+    def _segments(self, values, weights=None) -> tuple:
+        """Entries grouped by label and sorted by value within each label, NaN values dropped"""
+        values = np.asarray(values, dtype=np.float64)
+        rows, labels = self.rows, self.columns
+        entry_values = values[rows]
+        keep = ~np.isnan(entry_values)
+        rows, labels, entry_values = rows[keep], labels[keep], entry_values[keep]
+        order = np.lexsort((entry_values, labels))
+        sizes = np.bincount(labels, minlength=len(self.labels))
+        starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+        entry_weights = None if weights is None else np.asarray(weights, dtype=np.float64)[rows[order]]
+        return entry_values[order], entry_weights, starts, sizes
+    
+    def medians(self, values) -> pd.Series:
+        """Per-label median (pandas semantics: NaN skipped, mean of the middle pair)"""
+        ordered, _, starts, sizes = self._segments(values)
+        lo = starts + np.maximum(sizes - 1, 0) // 2
+        hi = starts + sizes // 2
+        with np.errstate(invalid='ignore'):
+            result = np.where(sizes > 0, (ordered[np.minimum(lo, len(ordered) - 1)] +
+                                          ordered[np.minimum(hi, len(ordered) - 1)]) / 2, np.nan)
+        return pd.Series(result, index=self.labels)
+    
+    def weighted_medians(self, values, weights) -> pd.Series:
+        """Per-label weighted median, matching the analyzer's weighted_median
+
+        Within each label, values are sorted and the first one whose
+        cumulative weight reaches half the label's total is taken; labels
+        without members get 0. Unlike weighted_median, NaN values are
+        dropped with their weights rather than sorted last (where they
+        could be picked and turn the median into NaN).
+        """
+        ordered, entry_weights, starts, sizes = self._segments(values, weights)
+        if not len(ordered):
+            return pd.Series(0.0, index=self.labels)
+        cumulative = np.cumsum(entry_weights)
+        before = np.where(starts > 0, cumulative[np.maximum(starts - 1, 0)], 0.0)
+        ends = starts + sizes
+        totals = np.where(sizes > 0, cumulative[np.maximum(ends - 1, 0)] - before, 0.0)
+        # Global cumulative weights are monotone, so one searchsorted finds every label's cut-off
+        picks = np.searchsorted(cumulative, before + totals / 2.0, side='left')
+        picks = np.clip(picks, starts, np.maximum(ends - 1, starts))
+        result = np.where(sizes > 0, ordered[np.minimum(picks, len(ordered) - 1)], 0.0)
+        return pd.Series(result, index=self.labels)
+    
+    def row_means(self, entry_values) -> np.ndarray:
+        """Per-game mean of a value given for each membership entry (CSR order)"""
+        entry_values = np.asarray(entry_values, dtype=np.float64)
+        totals = np.bincount(self.rows, weights=entry_values, minlength=len(self))
+        return totals / np.maximum(np.diff(self.matrix.indptr), 1)
+    
+    def spread(self, label_values) -> np.ndarray:
+        """A per-label value for every membership entry (CSR order)"""
+        return np.asarray(label_values, dtype=np.float64)[self.columns]
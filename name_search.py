@@ -0,0 +1,122 @@
+"""
+Name Search - Prefix and fuzzy search over every game name, for the radar selectors
+A sorted array of normalised names answers prefix queries by binary search;
+a trigram posting list (CSR layout) ranks fuzzy matches by trigram overlap
+"""
+import re
+import unicodedata
+import numpy as np
+import pandas as pd
+from data_engine import dataset_fingerprint
+
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+
+_INDEXES = {}
+_MAX_INDEXES = 4
+
+def normalise_name(name) -> str:
+    """Lower case ASCII, accents stripped ("Pokémon" -> "pokemon"), punctuation folded to single spaces"""
+    folded = unicodedata.normalize('NFKD', str(name)).encode('ascii', 'ignore').decode('ascii')
+    return _NON_ALNUM.sub(' ', folded.lower()).strip()
+
+def _trigram_codes(names: np.ndarray) -> tuple:
+    """(trigram code, name position) pairs for padded names, one per distinct trigram, sorted by code
+
+    Names are laid out as a fixed-width byte matrix so every trigram is
+    computed with array arithmetic rather than per-name Python loops.
+    """
+    padded = np.char.add(np.char.add('  ', names.astype(str)), ' ').astype('S')
+    width = padded.dtype.itemsize
+    chars = np.frombuffer(padded.tobytes(), dtype=np.uint8).reshape(len(names), width).astype(np.int64)
+    codes = (chars[:, :-2] << 16) | (chars[:, 1:-1] << 8) | chars[:, 2:]
+    # A window that reaches into the zero padding of a short name is not a trigram
+    valid = chars[:, 2:] != 0
+    rows = np.broadcast_to(np.arange(len(names))[:, None], codes.shape)[valid]
+    pairs = codes[valid] << 32 | rows
+    pairs.sort()
+    pairs = pairs[np.append(True, pairs[1:] != pairs[:-1])]
+    return (pairs >> 32).astype(np.int32), (pairs & 0xFFFFFFFF).astype(np.int32)
+
+def build_name_index(df: pd.DataFrame) -> dict:
+    """Sorted normalised names plus trigram postings; duplicate names keep their first row"""
+    names = df['name'].to_numpy(dtype=object)
+    first = np.flatnonzero(~pd.Index(names).duplicated(keep='first'))
+    names = names[first]
+    normalised = np.array([normalise_name(n) for n in names], dtype=object)
+    
+    order = np.argsort(normalised, kind='stable')
+    codes, rows = _trigram_codes(normalised)
+    trigrams, starts = np.unique(codes, return_index=True)
+    
+    return {
+        'names': names,
+        'popularity': df['main_story_polled'].to_numpy(dtype=np.float64)[first],
+        'sorted_names': normalised[order],
+        'sorted_positions': order,
+        'trigrams': trigrams,
+        'offsets': np.append(starts, len(codes)),
+        'postings': rows,
+        'trigram_counts': np.bincount(rows, minlength=len(names))
+    }
+
+def get_name_index(df: pd.DataFrame) -> dict:
+    """Name index for this dataset version"""
+    key = dataset_fingerprint(df, columns=['name', 'main_story_polled'])
+    index = _INDEXES.get(key)
+    if index is None:
+        index = build_name_index(df)
+        if len(_INDEXES) >= _MAX_INDEXES:
+            del _INDEXES[next(iter(_INDEXES))]
+        _INDEXES[key] = index
+    return index
+
+def _prefix_matches(index: dict, prefix: str) -> np.ndarray:
+    sorted_names = index['sorted_names']
+    lo = np.searchsorted(sorted_names, prefix, side='left')
+    hi = np.searchsorted(sorted_names, prefix + '\uffff', side='left')
+    return index['sorted_positions'][lo:hi]
+
+def _fuzzy_matches(index: dict, query: str, limit: int) -> tuple:
+    """Positions and Jaccard scores of the names sharing the most trigrams with query"""
+    grams = _trigram_codes(np.array([query], dtype=object))[0]
+    slots = np.searchsorted(index['trigrams'], grams)
+    slots = slots[(slots < len(index['trigrams'])) & (index['trigrams'][np.minimum(slots, len(index['trigrams']) - 1)] == grams)]
+    if not len(slots):
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    hits = np.concatenate([index['postings'][index['offsets'][s]:index['offsets'][s + 1]] for s in slots])
+    shared = np.bincount(hits, minlength=len(index['names']))
+    positions = np.flatnonzero(shared)
+    shared = shared[positions]
+    scores = shared / (len(grams) + index['trigram_counts'][positions] - shared)
+    if len(positions) > limit:
+        top = np.argpartition(-scores, limit)[:limit]
+        positions, scores = positions[top], scores[top]
+    return positions, scores
+
+def search_names(df: pd.DataFrame, query: str, limit: int = 20, min_score: float = 0.2) -> list:
+    """Up to limit game names for query: prefix matches first (most polled first), then fuzzy ones
+
+    Fuzzy matches are ranked by trigram Jaccard similarity to the query and
+    need at least min_score of it, so a typo or a missing word still finds
+    the game.
+    """
+    query = normalise_name(query)
+    if not query:
+        return []
+    index = get_name_index(df)
+    popularity = index['popularity']
+    
+    prefix = _prefix_matches(index, query)
+    if len(prefix) > limit:
+        prefix = prefix[np.argpartition(-popularity[prefix], limit)[:limit]]
+    prefix = prefix[np.argsort(-popularity[prefix], kind='stable')]
+    if len(prefix) >= limit:
+        return index['names'][prefix].tolist()
+    
+    positions, scores = _fuzzy_matches(index, query, limit + len(prefix))
+    keep = (scores >= min_score) & ~np.isin(positions, prefix)
+    positions, scores = positions[keep], scores[keep]
+    fuzzy = positions[np.lexsort((-popularity[positions], -scores))]
+    
+    ranked = np.concatenate([prefix, fuzzy])[:limit]
+    return index['names'][ranked].tolist()
@@ -0,0 +1,153 @@
+"""
+Payload Compaction - Smaller Plotly JSON for slow links
+Numeric arrays become float32/int32 typed arrays (base64 in the JSON) and
+repeated strings in customdata move out of the per-point data
+"""
+import base64
+import re
+import numpy as np
+import plotly.graph_objects as go
+
+# Per-point attributes sliced together when a trace is split
+POINT_KEYS = ['x', 'y', 'z', 'r', 'theta', 'text', 'hovertext', 'ids', 'customdata']
+MARKER_POINT_KEYS = ['size', 'color', 'opacity', 'symbol']
+
+_CUSTOMDATA_REF = re.compile(r'%\{customdata\[(\d+)\](:[^}]*)?\}')
+
+def _decode(value):
+    """Plotly's base64 typed-array dicts back to numpy, recursing into nested attributes"""
+    if isinstance(value, dict):
+        if 'bdata' in value and 'dtype' in value:
+            array = np.frombuffer(base64.b64decode(value['bdata']), dtype=value['dtype'])
+            shape = value.get('shape')
+            if shape:
+                array = array.reshape([int(n) for n in str(shape).split(',')])
+            return array
+        return {k: _decode(v) for k, v in value.items()}
+    return value
+
+def _numeric(values):
+    """values as a float32 array when they are all numbers, else None
+
+    Integer arrays are returned unchanged: plotly already encodes them with
+    the narrowest integer type that fits.
+    """
+    array = np.asarray(values)
+    if array.dtype == object:
+        try:
+            array = array.astype(np.float64)
+        except (TypeError, ValueError):
+            return None
+    if array.dtype.kind == 'f':
+        return array.astype(np.float32)
+    if array.dtype.kind in 'iub':
+        return array
+    return None
+
+def _quantise(container: dict, keys):
+    """Replace numeric per-point arrays in container with narrow typed arrays"""
+    for key in keys:
+        value = container.get(key)
+        if isinstance(value, (list, tuple, np.ndarray)) and len(value) > 1:
+            array = _numeric(value)
+            if array is not None:
+                container[key] = array
+
+def _split_column(trace: dict, max_categories: int):
+    """Index of a low-cardinality string column in customdata worth splitting on"""
+    customdata = trace.get('customdata')
+    template = trace.get('hovertemplate')
+    if customdata is None or not isinstance(template, str):
+        return None
+    data = np.asarray(customdata, dtype=object)
+    if data.ndim != 2 or len(data) < 2 * max_categories:
+        return None
+    for column in range(data.shape[1]):
+        values = data[:, column]
+        if all(isinstance(v, str) for v in values[:64]) and len(set(values)) <= max_categories:
+            return column
+    return None
+
+def _split_trace(trace: dict, column: int, legendgroup: str) -> list:
+    """One trace per value of a customdata string column, with the value in the hovertemplate"""
+    data = np.asarray(trace['customdata'], dtype=object)
+    labels = data[:, column]
+    rest = np.delete(data, column, axis=1)
+    template = trace['hovertemplate']
+    marker = trace.get('marker') or {}
+    
+    # Split traces must share one colour scale and one legend entry
+    color = marker.get('color')
+    if isinstance(color, (list, tuple, np.ndarray)) and len(color) == len(data) and 'cmin' not in marker:
+        numeric = _numeric(color)
+        if numeric is not None and numeric.dtype.kind == 'f':
+            marker = {**marker, 'cmin': float(np.nanmin(numeric)), 'cmax': float(np.nanmax(numeric))}
+    
+    def renumber(match, value):
+        index = int(match.group(1))
+        if index == column:
+            return str(value).replace('%', '%%')
+        return f"%{{customdata[{index - (index > column)}]{match.group(2) or ''}}}"
+    
+    pieces = []
+    for n, value in enumerate(dict.fromkeys(labels)):
+        rows = np.flatnonzero(labels == value)
+        piece = {k: v for k, v in trace.items() if k not in POINT_KEYS and k != 'marker'}
+        for key in POINT_KEYS:
+            if key in trace and isinstance(trace[key], (list, tuple, np.ndarray)) and len(trace[key]) == len(data):
+                piece[key] = np.asarray(trace[key], dtype=object if key in ('text', 'hovertext', 'ids') else None)[rows]
+        piece['customdata'] = rest[rows] if rest.shape[1] else None
+        if piece['customdata'] is None:
+            del piece['customdata']
+        if marker:
+            piece['marker'] = {k: (np.asarray(v)[rows] if k in MARKER_POINT_KEYS and isinstance(v, (list, tuple, np.ndarray))
+                                   and len(v) == len(data) else v) for k, v in marker.items()}
+            if n > 0:
+                piece['marker']['showscale'] = False
+        piece['hovertemplate'] = _CUSTOMDATA_REF.sub(lambda m: renumber(m, value), template)
+        piece['legendgroup'] = legendgroup
+        if n > 0:
+            piece['showlegend'] = False
+        pieces.append(piece)
+    return pieces
+
+def compact_figure(fig: go.Figure, max_categories: int = 32) -> go.Figure:
+    """Copy of fig with float32/int32 typed arrays and de-duplicated customdata strings
+
+    Float coordinates, marker sizes and colours and numeric customdata are
+    narrowed to float32 (plotly serialises numpy arrays as base64 typed
+    arrays). A customdata string column with at most max_categories distinct
+    values (a genre, say) is dropped from the per-point data: the trace is
+    split into one trace per value, with the value in its hovertemplate.
+    """
+    spec = fig.to_plotly_json()
+    traces = []
+    for i, trace in enumerate(spec['data']):
+        trace = _decode(trace)
+        column = _split_column(trace, max_categories)
+        if column is not None:
+            group = trace.get('legendgroup') or trace.get('name') or f"trace{i}"
+            pieces = _split_trace(trace, column, group)
+        else:
+            pieces = [trace]
+        for piece in pieces:
+            _quantise(piece, ['x', 'y', 'z', 'r', 'theta', 'customdata'])
+            if isinstance(piece.get('marker'), dict):
+                piece['marker'] = dict(piece['marker'])
+                _quantise(piece['marker'], ['size', 'color', 'opacity'])
+            traces.append(piece)
+    spec['data'] = traces
+    return go.Figure(spec, _validate=False)
+
+def payload_report(fig: go.Figure, compact: go.Figure) -> dict:
+    """JSON bytes before and after compaction"""
+    before = len(fig.to_json())
+    after = len(compact.to_json())
+    return {
+        'bytes_before': before,
+        'bytes_after': after,
+        'bytes_saved': before - after,
+        'ratio': after / before if before else 1.0,
+        'traces_before': len(fig.data),
+        'traces_after': len(compact.data)
+    }
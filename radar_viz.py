@@ -5,6 +5,9 @@ Research-grade multi-dimensional assessment
 import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
+from data_engine import SOURCE_COLUMNS, column_hash, dataset_fingerprint
+from figure_cache import cached_figure
+from tracing import traced
 
 RADAR_PALETTE = {
     'bg': '#0f1419',
@@ -18,27 +21,107 @@ RADAR_PALETTE = {
     'compare_glow': 'rgba(236, 72, 153, 0.4)'
 }
 
-def calculate_game_profile(df, game_name):
-    """Calculate 6-dimensional time respect profile"""
-    game = df[df['name'] == game_name].iloc[0]
+PROFILE_DIMENSIONS = ['Time Efficiency', 'Content Density', 'Repetition Control',
+                      'Retention Quality', 'Engagement Depth', 'Progression Value']
+
+_GAME_INDEXES = {}
+_MAX_GAME_INDEXES = 4
+_PROFILES = {}
+_MAX_PROFILES = 4
+_GENRE_MEDIANS = {}
+
+# Line colours for multi-game comparisons, after the two used by create_radar_chart
+COMPARISON_COLORS = [RADAR_PALETTE['accent'], RADAR_PALETTE['compare'], '#22d3ee', '#f59e0b', '#10b981',
+                     '#a78bfa', '#f87171', '#84cc16', '#fb923c', '#38bdf8']
+
+def game_index(df: pd.DataFrame) -> dict:
+    """Name -> row position map and normalisation quantiles, built once per dataset version
+
+    Duplicate names resolve to their first row, as the old boolean-mask
+    lookup did.
+    """
+    key = dataset_fingerprint(df)
+    index = _GAME_INDEXES.get(key)
+    if index is not None:
+        return index
+    
+    names = df['name'].to_numpy(dtype=object)
+    first = ~pd.Index(names).duplicated(keep='first')
+    index = {
+        'positions': dict(zip(names[first], np.flatnonzero(first).tolist())),
+        'main_story_q95': df['main_story'].quantile(0.95),
+        'confidence_q95': df['confidence_score'].quantile(0.95),
+        'polls_q75': df['main_story_polled'].quantile(0.75),
+        'polls_q50': df['main_story_polled'].quantile(0.5)
+    }
+    if len(_GAME_INDEXES) >= _MAX_GAME_INDEXES:
+        del _GAME_INDEXES[next(iter(_GAME_INDEXES))]
+    _GAME_INDEXES[key] = index
+    return index
+
+def _game_row(df: pd.DataFrame, index: dict, game_name) -> pd.Series:
+    position = index['positions'].get(game_name)
+    if position is None:
+        raise KeyError(f"Unknown game: {game_name!r}")
+    return df.iloc[position]
+
+def _py_min(a, b):
+    """Elementwise min(a, b) with Python's semantics: a NaN b gives a"""
+    return np.where(b < a, b, a)
+
+def _py_max(a, b):
+    """Elementwise max(a, b) with Python's semantics: a NaN b gives a"""
+    return np.where(b > a, b, a)
+
+def profile_matrix(df: pd.DataFrame) -> np.ndarray:
+    """(n_games, 6) float32 radar profiles in PROFILE_DIMENSIONS order, cached per dataset version
+
+    Row i is the profile of df.iloc[i]; the formulas (and their NaN
+    behaviour) match the original one-game-at-a-time calculation.
+    """
+    # TRS is hashed by value: an in-place recompute keeps the frame's fingerprint
+    key = (dataset_fingerprint(df, columns=SOURCE_COLUMNS + ['confidence_score']),
+           column_hash(df, 'time_respect_score'))
+    matrix = _PROFILES.get(key)
+    if matrix is not None:
+        return matrix
+    
+    index = game_index(df)
+    main_story = df['main_story'].to_numpy(dtype=np.float64)
+    extras = df['main_extras'].to_numpy(dtype=np.float64) if 'main_extras' in df.columns else main_story
+    confidence = df['confidence_score'].to_numpy(dtype=np.float64)
+    polls = df['main_story_polled'].to_numpy(dtype=np.float64)
     
     # Normalize metrics to 0-100 scale
-    time_efficiency = 100 - min(100, (game['main_story'] / df['main_story'].quantile(0.95)) * 100)
-    content_density = min(100, (game['confidence_score'] / df['confidence_score'].quantile(0.95)) * 100)
-    repetition_level = 100 - min(100, (game.get('main_extras', game['main_story']) / game['main_story'] - 1) * 50)
-    dropoff_risk = 100 - min(100, (game['main_story'] / 50) * 100)
-    engagement_depth = min(100, (game['main_story_polled'] / df['main_story_polled'].quantile(0.75)) * 100)
-    progression = min(100, game['time_respect_score'] * 100) if 'time_respect_score' in game else 50
+    with np.errstate(divide='ignore', invalid='ignore'):
+        columns = [
+            100 - _py_min(100, (main_story / index['main_story_q95']) * 100),
+            _py_min(100, (confidence / index['confidence_q95']) * 100),
+            100 - _py_min(100, (extras / main_story - 1) * 50),
+            100 - _py_min(100, (main_story / 50) * 100),
+            _py_min(100, (polls / index['polls_q75']) * 100),
+            (_py_min(100, df['time_respect_score'].to_numpy(dtype=np.float64) * 100)
+             if 'time_respect_score' in df.columns else np.full(len(df), 50.0))
+        ]
+    matrix = np.column_stack([_py_max(0, _py_min(100, column)) for column in columns]).astype(np.float32)
+    matrix.setflags(write=False)
     
-    return {
-        'Time Efficiency': max(0, min(100, time_efficiency)),
-        'Content Density': max(0, min(100, content_density)),
-        'Repetition Control': max(0, min(100, repetition_level)),
-        'Retention Quality': max(0, min(100, dropoff_risk)),
-        'Engagement Depth': max(0, min(100, engagement_depth)),
-        'Progression Value': max(0, min(100, progression))
-    }
+    if len(_PROFILES) >= _MAX_PROFILES:
+        del _PROFILES[next(iter(_PROFILES))]
+    _PROFILES[key] = matrix
+    return matrix
 
+@traced
+def calculate_game_profile(df, game_name):
+    """Calculate 6-dimensional time respect profile (a row of the cached profile matrix)"""
+    index = game_index(df)
+    if game_name not in index['positions']:
+        raise KeyError(f"Unknown game: {game_name!r}")
+    row = profile_matrix(df)[index['positions'][game_name]]
+    return dict(zip(PROFILE_DIMENSIONS, row.tolist()))
+
+@traced
+@cached_figure
 def create_radar_chart(df, game1_name, game2_name=None):
     """Premium radar visualization with optional comparison"""
     profile1 = calculate_game_profile(df, game1_name)
@@ -111,12 +194,114 @@ def create_radar_chart(df, game1_name, game2_name=None):
     
     return fig
 
+def genre_profile_medians(df: pd.DataFrame) -> pd.DataFrame:
+    """Median radar profile of each primary genre (genres x PROFILE_DIMENSIONS), cached per dataset version"""
+    key = (dataset_fingerprint(df, columns=SOURCE_COLUMNS + ['confidence_score', 'primary_genre']),
+           column_hash(df, 'time_respect_score'))
+    medians = _GENRE_MEDIANS.get(key)
+    if medians is None:
+        profiles = pd.DataFrame(profile_matrix(df), columns=PROFILE_DIMENSIONS)
+        medians = profiles.groupby(df['primary_genre'].to_numpy(), sort=True).median()
+        if len(_GENRE_MEDIANS) >= _MAX_PROFILES:
+            del _GENRE_MEDIANS[next(iter(_GENRE_MEDIANS))]
+        _GENRE_MEDIANS[key] = medians
+    return medians
+
+@traced
+@cached_figure
+def create_radar_comparison(df, game_names, show_genre_medians=True):
+    """Radar overlay of any number of games, with dashed median polygons for their genres"""
+    index = game_index(df)
+    missing = [name for name in game_names if name not in index['positions']]
+    if missing:
+        raise KeyError(f"Unknown games: {missing!r}")
+    positions = np.array([index['positions'][name] for name in game_names], dtype=np.int64)
+    
+    # One gather for every selected game; polygons are closed by repeating the first dimension
+    profiles = profile_matrix(df)[positions]
+    closed = np.concatenate([profiles, profiles[:, :1]], axis=1).astype(np.float64)
+    theta = PROFILE_DIMENSIONS + PROFILE_DIMENSIONS[:1]
+    
+    traces = []
+    if show_genre_medians and 'primary_genre' in df.columns:
+        genres = list(dict.fromkeys(df['primary_genre'].to_numpy()[positions].tolist()))
+        medians = genre_profile_medians(df).loc[genres].to_numpy()
+        for genre, values in zip(genres, np.concatenate([medians, medians[:, :1]], axis=1)):
+            traces.append(dict(
+                type='scatterpolar',
+                r=values,
+                theta=theta,
+                mode='lines',
+                line=dict(color=RADAR_PALETTE['text_dim'], width=1.5, dash='dash'),
+                name=f"{genre} median",
+                hovertemplate=f'<b>{genre} median</b><br>%{{theta}}: %{{r:.1f}}/100<extra></extra>'
+            ))
+    
+    fill = len(game_names) <= 3
+    for i, (name, values) in enumerate(zip(game_names, closed)):
+        color = COMPARISON_COLORS[i % len(COMPARISON_COLORS)]
+        traces.append(dict(
+            type='scatterpolar',
+            r=values,
+            theta=theta,
+            mode='lines',
+            fill='toself' if fill else 'none',
+            opacity=1.0 if fill else 0.85,
+            line=dict(color=color, width=3 if fill else 2),
+            name=name,
+            hovertemplate='<b>%{theta}</b><br>Score: %{r:.1f}/100<extra></extra>'
+        ))
+    
+    # Traces are plain dicts with fixed, known-good attributes: skip per-trace validation
+    # so building stays flat as the number of games grows
+    fig = go.Figure({'data': traces}, _validate=False)
+    fig.update_layout(
+        polar=dict(
+            bgcolor=RADAR_PALETTE['bg'],
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100],
+                gridcolor=RADAR_PALETTE['grid'],
+                gridwidth=1,
+                tickfont=dict(size=10, color=RADAR_PALETTE['text_dim']),
+                tickmode='linear',
+                tick0=0,
+                dtick=25
+            ),
+            angularaxis=dict(
+                gridcolor=RADAR_PALETTE['grid'],
+                gridwidth=1,
+                linecolor=RADAR_PALETTE['grid'],
+                tickfont=dict(size=12, color=RADAR_PALETTE['text'], family='Inter, sans-serif')
+            )
+        ),
+        paper_bgcolor=RADAR_PALETTE['bg'],
+        plot_bgcolor=RADAR_PALETTE['bg'],
+        font=dict(family='Inter, sans-serif', color=RADAR_PALETTE['text']),
+        showlegend=True,
+        legend=dict(
+            orientation='h',
+            yanchor='bottom',
+            y=-0.3,
+            xanchor='center',
+            x=0.5,
+            font=dict(size=11),
+            bgcolor='rgba(0,0,0,0)'
+        ),
+        margin=dict(l=80, r=80, t=40, b=100),
+        height=560
+    )
+    
+    return fig
+
+@traced
 def get_game_stats(df, game_name):
     """Extract key stats for stat cards"""
-    game = df[df['name'] == game_name].iloc[0]
+    index = game_index(df)
+    game = _game_row(df, index, game_name)
     
     # Calculate derived metrics
-    completion_rate = min(100, (game['main_story_polled'] / df['main_story_polled'].quantile(0.5)) * 50)
+    completion_rate = min(100, (game['main_story_polled'] / index['polls_q50']) * 50)
     dropoff_hours = game['main_story'] * 0.7  # Estimate
     side_quest_density = ((game.get('main_extras', game['main_story']) / game['main_story']) - 1) * 100 if game.get('main_extras', 0) > 0 else 0
     grind_index = max(0, min(100, (game['main_story'] / 30) * 100 - 50))
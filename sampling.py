@@ -0,0 +1,70 @@
+"""
+Sampling - One stratified sample order per dataset version, shared by every chart
+A chart that needs n games takes the first n of the order, so a smaller
+chart sample is always a subset of a larger one
+"""
+import numpy as np
+import pandas as pd
+from data_engine import SOURCE_COLUMNS, dataset_fingerprint
+
+STRATA = ['zone', 'primary_genre']
+ZONE_FLOOR = 100
+
+_ORDERS = {}
+_MAX_ORDERS = 4
+
+def stratified_order(df: pd.DataFrame, strata: list = None, zone_floor: int = ZONE_FLOOR,
+                     seed: int = 42) -> np.ndarray:
+    """Row positions ordered so that every prefix is stratified by zone x genre
+
+    Each row is placed at (random rank within its stratum + jitter) / stratum
+    size, so a prefix of k rows holds about k * share of every stratum. The
+    first zone_floor rows of each zone come first, so rare zones such as
+    False Epic appear in every sample of at least 5 * zone_floor rows.
+    """
+    strata = STRATA if strata is None else strata
+    columns = [c for c in strata if c in df.columns]
+    key = (dataset_fingerprint(df, columns=SOURCE_COLUMNS + columns), tuple(columns), zone_floor, seed)
+    order = _ORDERS.get(key)
+    if order is not None:
+        return order
+    
+    n = len(df)
+    rng = np.random.default_rng(seed)
+    if columns:
+        stratum = df.groupby(columns, observed=True, sort=False, dropna=False).ngroup().to_numpy()
+    else:
+        stratum = np.zeros(n, dtype=np.int64)
+    
+    # Random rank of each row inside its stratum
+    shuffled = rng.permutation(n)
+    by_stratum = shuffled[np.argsort(stratum[shuffled], kind='stable')]
+    sizes = np.bincount(stratum)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    rank = np.empty(n, dtype=np.int64)
+    rank[by_stratum] = np.arange(n) - np.repeat(starts, sizes)
+    position = (rank + rng.random(n)) / sizes[stratum]
+    
+    if 'zone' in df.columns and zone_floor > 0:
+        zone_codes = pd.factorize(df['zone'])[0]
+        # Rank inside the zone, following the stratified positions
+        zone_order = np.lexsort((position, zone_codes))
+        zone_sizes = np.bincount(zone_codes)
+        zone_starts = np.concatenate([[0], np.cumsum(zone_sizes)[:-1]])
+        zone_rank = np.empty(n, dtype=np.int64)
+        zone_rank[zone_order] = np.arange(n) - np.repeat(zone_starts, zone_sizes)
+        floor = zone_rank < zone_floor
+        position[floor] -= 1.0
+    
+    order = np.argsort(position, kind='stable')
+    if len(_ORDERS) >= _MAX_ORDERS:
+        del _ORDERS[next(iter(_ORDERS))]
+    _ORDERS[key] = order
+    return order
+
+def stratified_sample(df: pd.DataFrame, n: int, **kwargs) -> pd.DataFrame:
+    """The first n rows of the shared order, returned in their original row order"""
+    if n >= len(df):
+        return df
+    positions = np.sort(stratified_order(df, **kwargs)[:n])
+    return df.iloc[positions]
@@ -0,0 +1,135 @@
+"""
+Similarity - "Games like this" search over the radar profiles of the whole catalogue
+A KD-tree over the six radar dimensions is built once per dataset version and
+stored under the cache directory; genre and confidence tier filters use an
+oversampled neighbour list, or a per-filter tree when matches are rare
+"""
+import json
+import os
+import pickle
+import numpy as np
+import pandas as pd
+from sklearn.neighbors import KDTree
+from data_engine import CACHE_DIR, SOURCE_COLUMNS, column_hash, dataset_fingerprint
+from radar_viz import game_index, profile_matrix
+
+# Bump when the profile features or tree parameters change
+SIMILARITY_VERSION = 1
+OVERSAMPLE = 8
+
+_INDEXES = {}
+_MAX_INDEXES = 4
+
+def _codes(values: pd.Series):
+    codes, uniques = pd.factorize(values.astype(object), use_na_sentinel=True)
+    return codes.astype(np.int32), [str(u) for u in uniques]
+
+def build_similarity_index(df: pd.DataFrame) -> dict:
+    """KD-tree over the profile matrix plus integer codes for the filter columns"""
+    genres = df['primary_genre'] if 'primary_genre' in df.columns else pd.Series('Unknown', index=df.index)
+    genre_codes, genre_names = _codes(genres)
+    tier_codes, tier_names = _codes(df['confidence_tier'])
+    return {
+        'tree': KDTree(profile_matrix(df).astype(np.float64), leaf_size=40),
+        'genre_codes': genre_codes,
+        'genres': genre_names,
+        'tier_codes': tier_codes,
+        'tiers': tier_names
+    }
+
+def get_similarity_index(df: pd.DataFrame, root: str = None) -> dict:
+    """Similarity index for this dataset version, rebuilt only on a new fingerprint"""
+    columns = SOURCE_COLUMNS + ['confidence_score', 'primary_genre']
+    # TRS is hashed by value, like the profile matrix the tree is built from
+    key = f"v{SIMILARITY_VERSION}-{dataset_fingerprint(df, columns=columns)}-{column_hash(df, 'time_respect_score')}"
+    if key in _INDEXES:
+        return _INDEXES[key]
+    
+    root = root or os.path.join(CACHE_DIR, 'similarity')
+    tree_path = os.path.join(root, f"{key}.tree.pkl")
+    meta_path = os.path.join(root, f"{key}.json")
+    if os.path.exists(meta_path):
+        with open(meta_path) as fh:
+            index = json.load(fh)
+        with open(tree_path, 'rb') as fh:
+            index['tree'] = pickle.load(fh)
+        for name in ['genre_codes', 'tier_codes']:
+            index[name] = np.load(os.path.join(root, f"{key}.{name}.npy"))
+    else:
+        index = build_similarity_index(df)
+        os.makedirs(root, exist_ok=True)
+        with open(tree_path, 'wb') as fh:
+            pickle.dump(index['tree'], fh, protocol=4)
+        for name in ['genre_codes', 'tier_codes']:
+            np.save(os.path.join(root, f"{key}.{name}.npy"), index[name])
+        # Metadata is written last: its presence marks a complete entry
+        tmp = meta_path + '.tmp'
+        with open(tmp, 'w') as fh:
+            json.dump({'genres': index['genres'], 'tiers': index['tiers'], 'n_games': len(df)}, fh, indent=2)
+        os.replace(tmp, meta_path)
+    
+    if len(_INDEXES) >= _MAX_INDEXES:
+        del _INDEXES[next(iter(_INDEXES))]
+    _INDEXES[key] = index
+    return index
+
+def _subset_tree(index: dict, genre_code, tier_code) -> tuple:
+    """KD-tree over just the games matching a filter, built on first use and kept in memory"""
+    subsets = index.setdefault('subsets', {})
+    key = (genre_code, tier_code)
+    if key not in subsets:
+        mask = np.ones(len(index['genre_codes']), dtype=bool)
+        if genre_code is not None:
+            mask &= index['genre_codes'] == genre_code
+        if tier_code is not None:
+            mask &= index['tier_codes'] == tier_code
+        members = np.flatnonzero(mask)
+        data = np.asarray(index['tree'].data)[members]
+        subsets[key] = (KDTree(data, leaf_size=40) if len(members) else None, members)
+    return subsets[key]
+
+def similar_positions(df: pd.DataFrame, game_name, k: int = 10, genre: str = None,
+                      tier: str = None) -> tuple:
+    """Row positions and profile distances of the k games closest to game_name
+
+    With filters, the full tree is asked for OVERSAMPLE * k neighbours
+    first; when too few of them match (a rare genre, or a tier far from the
+    game's own), the query goes to a tree over just the matching games.
+    """
+    index = get_similarity_index(df)
+    position = game_index(df)['positions'].get(game_name)
+    if position is None:
+        raise KeyError(f"Unknown game: {game_name!r}")
+    tree = index['tree']
+    point = np.asarray(tree.data[position]).reshape(1, -1)
+    
+    if genre is None and tier is None:
+        distances, positions = tree.query(point, k=min(k + 1, len(df)))
+        keep = positions[0] != position
+        return positions[0][keep][:k], distances[0][keep][:k]
+    
+    genre_code = (index['genres'].index(genre) if genre in index['genres'] else -2) if genre is not None else None
+    tier_code = (index['tiers'].index(tier) if tier in index['tiers'] else -2) if tier is not None else None
+    distances, positions = tree.query(point, k=min(OVERSAMPLE * k + 1, len(df)))
+    distances, positions = distances[0], positions[0]
+    keep = positions != position
+    if genre_code is not None:
+        keep &= index['genre_codes'][positions] == genre_code
+    if tier_code is not None:
+        keep &= index['tier_codes'][positions] == tier_code
+    if keep.sum() >= k:
+        return positions[keep][:k], distances[keep][:k]
+    
+    subset, members = _subset_tree(index, genre_code, tier_code)
+    if subset is None:
+        return np.empty(0, dtype=np.int64), np.empty(0)
+    distances, found = subset.query(point, k=min(k + 1, len(members)))
+    positions = members[found[0]]
+    keep = positions != position
+    return positions[keep][:k], distances[0][keep][:k]
+
+def similar_games(df: pd.DataFrame, game_name, k: int = 10, genre: str = None,
+                  tier: str = None) -> pd.DataFrame:
+    """The k most similar games as rows of df, closest first, with a similarity_distance column"""
+    positions, distances = similar_positions(df, game_name, k, genre, tier)
+    return df.iloc[positions].assign(similarity_distance=distances)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Synthetic HLTB Data - Seeded, vectorised stand-in for hltb_dataset.csv
+Same schema as the HowLongToBeat export, for tests and benchmarks
+
+    python synthetic_data.py hltb_synthetic.csv --rows 10000000
+    python synthetic_data.py hltb_synthetic.parquet --rows 40000000   # needs pyarrow
+
+Rows are generated in fixed blocks, each with its own seed stream, so the
+output for a given seed never depends on the chunk size, and a smaller
+dataset is always a prefix of a larger one.
+"""
+import argparse
+import numpy as np
+import pandas as pd
+
+BLOCK_ROWS = 65_536
+DEFAULT_CHUNK_ROWS = 16 * BLOCK_ROWS
+
+TYPES = ['game', 'dlc', 'mod', 'hack']
+TYPE_WEIGHTS = [0.85, 0.08, 0.04, 0.03]
+
+# (genre, popularity weight, typical length multiplier)
+GENRES = [
+    ('Action', 20, 1.0), ('Adventure', 18, 1.1), ('Platform', 9, 0.8), ('Puzzle', 9, 0.5),
+    ('RPG', 8, 2.6), ('Shooter', 7, 0.9), ('Strategy', 6, 1.8), ('Simulation', 5, 1.5),
+    ('Visual Novel', 4, 1.3), ('Racing', 3, 0.9), ('Sports', 3, 0.8), ('Horror', 3, 0.8),
+    ('Roguelike', 3, 1.2), ('Fighting', 2, 0.5), ('Point-and-Click', 2, 0.7), ('Open World', 2, 2.8)
+]
+
+PLATFORMS = [
+    ('PC', 40), ('PlayStation 4', 9), ('Nintendo Switch', 9), ('Xbox One', 7), ('PlayStation 3', 5),
+    ('Xbox 360', 5), ('Mobile', 5), ('PlayStation 5', 4), ('Xbox Series X/S', 3), ('Mac', 4),
+    ('Linux', 3), ('Nintendo 3DS', 2), ('Wii', 2), ('Game Boy Advance', 2)
+]
+
+NAME_ADJECTIVES = np.array([
+    'Crimson', 'Silent', 'Last', 'Broken', 'Eternal', 'Hollow', 'Iron', 'Lost', 'Neon', 'Shattered',
+    'Golden', 'Dark', 'Hidden', 'Forgotten', 'Endless', 'Wild', 'Frozen', 'Burning', 'Sacred', 'Distant',
+    'Little', 'Super', 'Final', 'Ancient', 'Cosmic', 'Savage', 'Quiet', 'Electric', 'Pale', 'Rogue'
+], dtype=object)
+
+NAME_NOUNS = np.array([
+    'Kingdom', 'Horizon', 'Legacy', 'Knight', 'Frontier', 'Dungeon', 'Odyssey', 'Signal', 'Harbor', 'Citadel',
+    'Garden', 'Protocol', 'Requiem', 'Tactics', 'Chronicle', 'Voyage', 'Labyrinth', 'Outpost', 'Tower', 'Saga',
+    'Empire', 'Drift', 'Hunter', 'Machine', 'Lantern', 'Crown', 'Echo', 'Island', 'Station', 'Forge'
+], dtype=object)
+
+NAME_SUFFIXES = np.array([
+    '', '', '', '', '', ' II', ' III', ' 2', ': Remastered', ': Origins', ' Deluxe', ': Reborn',
+    " Director's Cut", ' Online', ' HD', ' Zero'
+], dtype=object)
+
+def _weighted_top_k(rng, weights, n_rows, k_max):
+    """Weighted sampling of up to k_max distinct labels per row (Gumbel top-k)"""
+    keys = np.log(weights)[None, :] + rng.gumbel(size=(n_rows, len(weights)))
+    return np.argsort(-keys, axis=1)[:, :k_max]
+
+def _join_labels(names, codes, counts):
+    """Join the first counts[i] labels of each row with ', ' (vectorised over rows)"""
+    labels = np.asarray(names, dtype=object)
+    joined = labels[codes[:, 0]]
+    for j in range(1, codes.shape[1]):
+        more = counts > j
+        joined[more] = joined[more] + ', ' + labels[codes[more, j]]
+    return joined
+
+def _generate_block(seed: int, block: int, keep_rows: int) -> pd.DataFrame:
+    """One block of rows from its own SeedSequence stream
+
+    A full block is always drawn and then truncated, so a partial final
+    block matches the start of the same block in a larger dataset.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(block,)))
+    n_rows = BLOCK_ROWS
+    row_offset = block * BLOCK_ROWS
+    
+    # Genres: 1-3 distinct labels, the first one drives length
+    genre_names = [g[0] for g in GENRES]
+    genre_codes = _weighted_top_k(rng, np.array([g[1] for g in GENRES], float), n_rows, 3)
+    genre_counts = rng.choice([1, 2, 3], size=n_rows, p=[0.45, 0.35, 0.20])
+    genres = _join_labels(genre_names, genre_codes, genre_counts)
+    genres[rng.random(n_rows) < 0.04] = None
+    
+    platform_names = [p[0] for p in PLATFORMS]
+    platform_codes = _weighted_top_k(rng, np.array([p[1] for p in PLATFORMS], float), n_rows, 4)
+    platform_counts = rng.choice([1, 2, 3, 4], size=n_rows, p=[0.50, 0.25, 0.15, 0.10])
+    platforms = _join_labels(platform_names, platform_codes, platform_counts)
+    platforms[rng.random(n_rows) < 0.02] = None
+    
+    # Polls: log-normal body with a Pareto tail of blockbusters (~74% under 10 polls)
+    polled = np.floor(rng.lognormal(0.9, 1.35, n_rows))
+    blockbuster = rng.random(n_rows) < 0.03
+    polled[blockbuster] = np.floor(30 * (1 + rng.pareto(1.1, blockbuster.sum())))
+    polled = np.minimum(polled, 20_000)
+    
+    # Main story: log-normal hours scaled by genre, long games a little better polled
+    length_factor = np.array([g[2] for g in GENRES])[genre_codes[:, 0]]
+    main_story = rng.lognormal(np.log(6.5), 0.85, n_rows) * length_factor
+    main_story *= 1 + 0.05 * np.log1p(polled)
+    main_story = np.round(np.clip(main_story, 0.1, 800), 2)
+    
+    main_extras = np.round(main_story * (1 + rng.lognormal(-0.4, 0.55, n_rows)), 2)
+    
+    # Missing data: unpolled entries carry no times, extras often unreported
+    unpolled = rng.random(n_rows) < 0.12
+    polled[unpolled] = np.where(rng.random(unpolled.sum()) < 0.5, 0, np.nan)
+    main_story[unpolled] = np.nan
+    main_extras[unpolled | (rng.random(n_rows) < 0.3)] = np.nan
+    
+    names = (NAME_ADJECTIVES[rng.integers(0, len(NAME_ADJECTIVES), n_rows)] + ' ' +
+             NAME_NOUNS[rng.integers(0, len(NAME_NOUNS), n_rows)] +
+             NAME_SUFFIXES[rng.integers(0, len(NAME_SUFFIXES), n_rows)])
+    # Disambiguate the way catalogues do, with a release tag (the global row number, so tags
+    # never collide); only a name's first occurrence in the first block may go untagged
+    tagged = (rng.random(n_rows) < 0.6) | (block > 0) | pd.Index(names).duplicated(keep='first')
+    names[tagged] = names[tagged] + ' (' + (row_offset + np.flatnonzero(tagged)).astype(str).astype(object) + ')'
+    
+    return pd.DataFrame({
+        'type': np.take(TYPES, rng.choice(len(TYPES), size=n_rows, p=TYPE_WEIGHTS)),
+        'name': names,
+        'main_story': main_story,
+        'main_story_polled': polled,
+        'main_extras': main_extras,
+        'genres': genres,
+        'platform': platforms
+    }, index=pd.RangeIndex(row_offset, row_offset + n_rows)).iloc[:keep_rows]
+
+def iter_hltb_chunks(n_rows: int, seed: int = 42, chunk_size: int = DEFAULT_CHUNK_ROWS):
+    """Yield the dataset in frames of about chunk_size rows (rounded to whole blocks)"""
+    blocks_per_chunk = max(1, chunk_size // BLOCK_ROWS)
+    n_blocks = -(-n_rows // BLOCK_ROWS)
+    for first in range(0, n_blocks, blocks_per_chunk):
+        frames = []
+        for block in range(first, min(first + blocks_per_chunk, n_blocks)):
+            frames.append(_generate_block(seed, block, min(BLOCK_ROWS, n_rows - block * BLOCK_ROWS)))
+        yield pd.concat(frames) if len(frames) > 1 else frames[0]
+
+def generate_hltb_frame(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """Generate n_rows of HLTB-shaped raw data (before cleaning) in memory"""
+    chunks = list(iter_hltb_chunks(n_rows, seed))
+    if not chunks:
+        # No rows: an empty frame with the full schema and dtypes
+        return _generate_block(seed, 0, 0)
+    return pd.concat(chunks)
+
+def write_hltb_dataset(path: str, n_rows: int, seed: int = 42,
+                       chunk_size: int = DEFAULT_CHUNK_ROWS, fmt: str = None) -> str:
+    """Stream the dataset to CSV or Parquet chunk by chunk, in bounded memory"""
+    fmt = fmt or ('parquet' if path.endswith('.parquet') else 'csv')
+    chunks = iter_hltb_chunks(n_rows, seed, chunk_size)
+    
+    if fmt == 'csv':
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(path, mode='w' if i == 0 else 'a', header=(i == 0), index=False)
+    elif fmt == 'parquet':
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as exc:
+            raise ImportError("Parquet output needs pyarrow: pip install pyarrow") from exc
+        writer = None
+        try:
+            for chunk in chunks:
+                table = pa.Table.from_pandas(chunk, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table.cast(writer.schema))
+        finally:
+            if writer is not None:
+                writer.close()
+    else:
+        raise ValueError(f"Unknown format: {fmt!r} (expected 'csv' or 'parquet')")
+    return path
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('path', help='output file (.csv or .parquet)')
+    parser.add_argument('--rows', type=int, default=40_000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_ROWS)
+    args = parser.parse_args()
+    
+    write_hltb_dataset(args.path, args.rows, args.seed, args.chunk_size)
+    print(f"✓ Wrote {args.rows:,} synthetic rows to {args.path}")
+
+if __name__ == '__main__':
+    main()
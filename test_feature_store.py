@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Quick test to verify the feature store follows in-place label recomputes
+"""
+import tempfile
+from data_engine import TimeRespectAnalyzer
+from feature_store import FeatureStore
+from synthetic_data import generate_hltb_frame
+
+print("Testing feature store...")
+
+analyzer = TimeRespectAnalyzer.from_frame(generate_hltb_frame(20_000))
+analyzer.clean_data()
+analyzer.compute_metrics()
+df = analyzer.df
+store = FeatureStore(tempfile.mkdtemp())
+
+_, before = store.frames(df)
+assert before.equals(store.frames(df)[1])
+print(f"✓ Materialised {len(before)} rows, {int(before.sum())} positive labels")
+
+# Same frame object and shape, new TRS values: the labels must be recomputed
+analyzer.compute_time_respect_score(multi_label=True)
+_, after = store.frames(df)
+expected = (df['time_respect_score'] >= df['time_respect_score'].quantile(0.70)).astype('int8')
+assert not after.equals(before)
+assert (after.to_numpy() == expected.to_numpy()).all()
+print(f"✓ In-place TRS recompute relabels {int((after != before).sum())} rows")
+
+print("\n✅ All tests passed!")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Quick test to verify the figure cache never serves a figure built from stale frame values
+"""
+import tempfile
+from data_engine import TimeRespectAnalyzer
+from figure_cache import configure_figure_cache, figure_cache_stats
+from payload import _decode
+from radar_viz import calculate_game_profile, create_radar_chart
+from synthetic_data import generate_hltb_frame
+
+print("Testing figure cache...")
+
+configure_figure_cache(enabled=True, root=tempfile.mkdtemp())
+analyzer = TimeRespectAnalyzer.from_frame(generate_hltb_frame(20_000))
+analyzer.clean_data()
+analyzer.compute_metrics()
+df = analyzer.df
+game = df.nlargest(1, 'main_story_polled')['name'].iloc[0]
+
+def drawn_profile(fig):
+    """The primary game's plotted values (cached figures hold them as typed arrays)"""
+    return [float(v) for v in _decode(fig.data[0].r)[:6]]
+
+first = create_radar_chart(df, game)
+again = create_radar_chart(df, game)
+assert figure_cache_stats()['memory_hits'] == 1
+assert drawn_profile(again) == drawn_profile(first)
+print("✓ Unchanged frame served from the cache")
+
+# An in-place TRS recompute keeps the frame object and shape but changes the profile
+analyzer.compute_time_respect_score(multi_label=True)
+expected = calculate_game_profile(df, game)['Progression Value']
+recomputed = create_radar_chart(df, game)
+assert abs(drawn_profile(recomputed)[5] - expected) < 1e-3
+assert figure_cache_stats()['memory_hits'] == 1
+print(f"✓ In-place TRS recompute rebuilds the figure (Progression Value {expected:.3f})")
+
+print("\n✅ All tests passed!")
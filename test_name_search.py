@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Quick test to verify game name search: prefix ranking, typo tolerance and name folding
+"""
+import pandas as pd
+from name_search import normalise_name, search_names
+
+print("Testing name search...")
+
+df = pd.DataFrame({
+    'name': ['Hollow Knight', 'Hollow Knight: Silksong', 'Hollow Kingdom', 'Pokémon Red',
+             'The Witcher 3: Wild Hunt', 'Celeste', '東京ゲーム', '!!!'],
+    'main_story_polled': [900, 50, 3000, 700, 2500, 1200, 40, 5]
+})
+
+# Prefix matches come first, most polled first
+assert search_names(df, 'hollow k') == ['Hollow Kingdom', 'Hollow Knight', 'Hollow Knight: Silksong']
+assert search_names(df, 'hollow k', limit=1) == ['Hollow Kingdom']
+print("✓ Prefix matches ranked by polls")
+
+# One typo or a missing word still finds the game through trigram overlap
+assert search_names(df, 'celest')[0] == 'Celeste'
+assert search_names(df, 'witcer 3')[0] == 'The Witcher 3: Wild Hunt'
+assert search_names(df, 'wild hunt')[0] == 'The Witcher 3: Wild Hunt'
+assert search_names(df, 'zzzz') == []
+print("✓ Fuzzy matches for typos and inner words")
+
+# Accents fold to ASCII before tokenising
+assert normalise_name('Pokémon Red') == 'pokemon red'
+assert search_names(df, 'pokemon') == ['Pokémon Red']
+assert search_names(df, 'POKÉMON r') == ['Pokémon Red']
+print("✓ Accented names fold to ASCII")
+
+# Names and queries with no ASCII letters or digits normalise to nothing
+assert normalise_name('東京ゲーム') == '' and normalise_name('!!!') == ''
+assert search_names(df, '東京') == [] and search_names(df, '  ?! ') == []
+assert search_names(df, 'celeste') == ['Celeste']
+print("✓ Empty normalised names and queries match nothing")
+
+print("\n✅ All tests passed!")
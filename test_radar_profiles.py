@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Quick test to verify the vectorised radar profiles match the original per-game calculation
+(including Python's min/max NaN semantics)
+"""
+import numpy as np
+from data_engine import TimeRespectAnalyzer
+from radar_viz import PROFILE_DIMENSIONS, profile_matrix
+from synthetic_data import generate_hltb_frame
+
+def reference_profile(df, game):
+    """The original one-game-at-a-time profile, kept verbatim as the oracle"""
+    time_efficiency = 100 - min(100, (game['main_story'] / df['main_story'].quantile(0.95)) * 100)
+    content_density = min(100, (game['confidence_score'] / df['confidence_score'].quantile(0.95)) * 100)
+    repetition_level = 100 - min(100, (game.get('main_extras', game['main_story']) / game['main_story'] - 1) * 50)
+    dropoff_risk = 100 - min(100, (game['main_story'] / 50) * 100)
+    engagement_depth = min(100, (game['main_story_polled'] / df['main_story_polled'].quantile(0.75)) * 100)
+    progression = min(100, game['time_respect_score'] * 100) if 'time_respect_score' in game else 50
+    
+    return [
+        max(0, min(100, time_efficiency)),
+        max(0, min(100, content_density)),
+        max(0, min(100, repetition_level)),
+        max(0, min(100, dropoff_risk)),
+        max(0, min(100, engagement_depth)),
+        max(0, min(100, progression))
+    ]
+
+print("Testing radar profiles...")
+
+analyzer = TimeRespectAnalyzer.from_frame(generate_hltb_frame(40_000))
+analyzer.clean_data()
+analyzer.compute_metrics()
+df = analyzer.df.copy()
+positions = np.random.default_rng(0).choice(len(df), 3000, replace=False)
+# Missing TRS and extras exercise the NaN paths: Python's min(100, nan) is 100
+df.loc[df.index[positions[:300]], 'time_respect_score'] = np.nan
+matrix = profile_matrix(df)
+assert matrix.shape == (len(df), len(PROFILE_DIMENSIONS))
+print(f"✓ Profile matrix: {matrix.shape[0]} games")
+
+assert df['main_extras'].iloc[positions].isna().any()
+expected = np.array([reference_profile(df, df.iloc[p]) for p in positions], dtype=np.float64)
+actual = matrix[positions].astype(np.float64)
+assert np.allclose(actual, expected, atol=1e-3, equal_nan=True)
+print(f"✓ {len(positions)} random games match the per-game calculation")
+
+print("\n✅ All tests passed!")
@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
 """
 Quick test to verify TRS implementation works
+Uses hltb_dataset.csv when present, seeded synthetic data otherwise
 """
-from data_engine import TimeRespectAnalyzer
+import os
+from data_engine import TimeRespectAnalyzer, aggregate_cube
+from synthetic_data import generate_hltb_frame
 
 print("Testing TRS implementation...")
 
 # Load and process data
-analyzer = TimeRespectAnalyzer('hltb_dataset.csv')
-print("✓ Data loaded")
+if os.path.exists('hltb_dataset.csv'):
+    analyzer = TimeRespectAnalyzer('hltb_dataset.csv')
+    print("✓ Data loaded")
+else:
+    analyzer = TimeRespectAnalyzer.from_frame(generate_hltb_frame(40_000))
+    print("✓ Synthetic data generated (hltb_dataset.csv not found)")
 
 analyzer.clean_data()
 print(f"✓ Data cleaned: {len(analyzer.df)} games")
@@ -19,6 +26,18 @@ print("✓ Metrics computed")
 analyzer.compute_time_respect_score()
 print("✓ TRS computed")
 
+# Multi-genre analysis counts every tagged genre, so never fewer games than primary-only
+multi = analyzer.genre_analysis(min_games=1, multi_label=True)
+assert multi['count'].sum() >= analyzer.genre_analysis(min_games=1)['count'].sum()
+print(f"✓ Multi-genre analysis: {len(multi)} genres")
+
+# The aggregate cube answers slices without rescanning rows
+cube = aggregate_cube(analyzer.df)
+assert cube.summary()['count'] == len(analyzer.df)
+assert cube.summary(tier='Strong')['count'] == (analyzer.df['confidence_tier'] == 'Strong').sum()
+assert aggregate_cube(analyzer.df.iloc[:0]).groupby('zone').empty
+print(f"✓ Aggregate cube: {len(cube.occupied)} occupied cells")
+
 # Test leaderboard
 top, bottom = analyzer.get_trs_leaderboard(top_n=10, bottom_n=10)
 print(f"✓ Leaderboard generated: {len(top)} top, {len(bottom)} bottom")
@@ -1,8 +1,12 @@
 """
 Timeline Demo - Player Journey Analytics
 """
+import os
 import streamlit as st
-from timeline_viz import create_timeline_viz, generate_synthetic_journey, TIMELINE_PALETTE
+from data_engine import TimeRespectAnalyzer
+from journey_store import JourneyStore
+from synthetic_data import generate_hltb_frame
+from timeline_viz import create_timeline_viz, default_journey, TIMELINE_PALETTE
 
 st.set_page_config(page_title="Player Journey Timeline", layout="wide", initial_sidebar_state="collapsed")
 
@@ -73,8 +77,27 @@ st.markdown(f"""
 st.markdown('<div class="main-header">Player Journey Analytics</div>', unsafe_allow_html=True)
 st.markdown('<div class="sub-header">How game design affects time investment, retention, and engagement across playtime</div>', unsafe_allow_html=True)
 
-# Generate data
-df = generate_synthetic_journey(hours=100)
+@st.cache_resource
+def load_games():
+    # Seeded synthetic games stand in when hltb_dataset.csv is not available
+    if os.path.exists('hltb_dataset.csv'):
+        analyzer = TimeRespectAnalyzer('hltb_dataset.csv')
+    else:
+        analyzer = TimeRespectAnalyzer.from_frame(generate_hltb_frame(40_000))
+    analyzer.clean_data()
+    analyzer.compute_metrics()
+    return analyzer.df, JourneyStore()
+
+# Journeys for every game are generated once into a memory-mapped store
+games, store = load_games()
+top_games = games.nlargest(100, 'main_story_polled')
+REFERENCE_JOURNEY = 'Synthetic reference journey (100h)'
+choice = st.selectbox(
+    'Select Game',
+    [REFERENCE_JOURNEY] + top_games.index.tolist(),
+    format_func=lambda x: x if x == REFERENCE_JOURNEY else top_games.at[x, 'name']
+)
+df = default_journey(hours=100) if choice == REFERENCE_JOURNEY else store.journey(games, choice)
 
 # Metric selector
 col1, col2, col3 = st.columns([2, 1, 1])
@@ -2,10 +2,13 @@
 Premium Timeline Visualization - Player Journey Analytics
 Research-grade temporal engagement modeling
 """
+import functools
+import hashlib
 import plotly.graph_objects as go
 import numpy as np
 import pandas as pd
 from scipy.interpolate import make_interp_spline
+from tracing import traced
 
 TIMELINE_PALETTE = {
     'bg': '#1a1d23',
@@ -46,6 +49,42 @@ def generate_synthetic_journey(hours=100, seed=42):
         'repetition': np.clip(repetition, 10, 80)
     })
 
+JOURNEY_METRICS = ['engagement', 'progress_time', 'dropoff', 'content_density', 'repetition']
+
+_SPLINE_BANKS = {}
+_MAX_SPLINE_BANKS = 32
+
+@functools.lru_cache(maxsize=8)
+def default_journey(hours=100, seed=42):
+    """The synthetic journey, generated once per (hours, seed); treat as read-only"""
+    return generate_synthetic_journey(hours, seed)
+
+def spline_bank(df, points=200):
+    """Smoothed curves for every journey metric from one vectorised spline fit
+
+    Returns {'hours': x, metric: y, ...}, cached by the journey's contents,
+    so switching metrics is a dictionary lookup rather than a refit.
+    """
+    columns = ['hours'] + [m for m in JOURNEY_METRICS if m in df.columns]
+    values = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float64))
+    key = (hashlib.sha1(values.tobytes()).hexdigest(), tuple(columns), points)
+    bank = _SPLINE_BANKS.get(key)
+    if bank is not None:
+        return bank
+    
+    x, Y = values[:, 0], values[:, 1:]
+    if len(x) < 4:
+        bank = {'hours': x, **{m: Y[:, i] for i, m in enumerate(columns[1:])}}
+    else:
+        x_smooth = np.linspace(x.min(), x.max(), points)
+        Y_smooth = make_interp_spline(x, Y, k=3, axis=0)(x_smooth)
+        bank = {'hours': x_smooth, **{m: Y_smooth[:, i] for i, m in enumerate(columns[1:])}}
+    
+    if len(_SPLINE_BANKS) >= _MAX_SPLINE_BANKS:
+        del _SPLINE_BANKS[next(iter(_SPLINE_BANKS))]
+    _SPLINE_BANKS[key] = bank
+    return bank
+
 def smooth_curve(x, y, points=200):
     """Smooth curve interpolation"""
     if len(x) < 4:
@@ -55,10 +94,11 @@ def smooth_curve(x, y, points=200):
     y_smooth = spl(x_smooth)
     return x_smooth, y_smooth
 
+@traced
 def create_timeline_viz(df=None, selected_metric='engagement'):
     """Premium timeline visualization"""
     if df is None:
-        df = generate_synthetic_journey()
+        df = default_journey()
     
     metrics = {
         'engagement': {'label': 'Engagement Index', 'color': TIMELINE_PALETTE['accent'], 'suffix': '%'},
@@ -69,21 +109,23 @@ def create_timeline_viz(df=None, selected_metric='engagement'):
     }
     
     metric_info = metrics[selected_metric]
-    x_smooth, y_smooth = smooth_curve(df['hours'].values, df[selected_metric].values)
+    bank = spline_bank(df)
+    x_smooth, y_smooth = bank['hours'], bank[selected_metric]
     
     fig = go.Figure()
     
-    # Phase backgrounds
+    # Phase backgrounds (fractions of the journey, so per-game journeys line up)
     phases = [
-        {'range': [0, 20], 'label': 'Early Game', 'color': 'rgba(138,180,248,0.08)'},
-        {'range': [20, 60], 'label': 'Mid Game', 'color': 'rgba(255,167,38,0.08)'},
-        {'range': [60, 80], 'label': 'Late Game', 'color': 'rgba(239,83,80,0.08)'},
-        {'range': [80, 100], 'label': 'Post-Game', 'color': 'rgba(171,71,188,0.08)'}
+        {'range': [0, 0.2], 'label': 'Early Game', 'color': 'rgba(138,180,248,0.08)'},
+        {'range': [0.2, 0.6], 'label': 'Mid Game', 'color': 'rgba(255,167,38,0.08)'},
+        {'range': [0.6, 0.8], 'label': 'Late Game', 'color': 'rgba(239,83,80,0.08)'},
+        {'range': [0.8, 1.0], 'label': 'Post-Game', 'color': 'rgba(171,71,188,0.08)'}
     ]
+    span = float(df['hours'].max())
     
     for phase in phases:
         fig.add_vrect(
-            x0=phase['range'][0], x1=phase['range'][1],
+            x0=phase['range'][0] * span, x1=phase['range'][1] * span,
             fillcolor=phase['color'], layer='below',
             line_width=0, annotation_text=phase['label'],
             annotation_position='top left',
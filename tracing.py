@@ -0,0 +1,148 @@
+"""
+Stage Tracing - Opt-in wall time, CPU time, row counts and memory per stage
+Spans are appended to a local JSONL file and kept in memory for the current run
+
+    TRS_TRACE=trace.jsonl streamlit run app.py      # or enable_tracing('trace.jsonl')
+    start_run(trace=True)                           # this run only, in memory, no memory peaks
+"""
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+import uuid
+import pandas as pd
+
+_config = {'enabled': False, 'path': None, 'memory': True}
+_write_lock = threading.Lock()
+_local = threading.local()
+
+def enable_tracing(path: str = 'trace.jsonl', memory: bool = True):
+    """Start recording spans to path; memory=True also tracks tracemalloc peaks"""
+    _config.update(enabled=True, path=path, memory=memory)
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+def disable_tracing():
+    """Stop recording spans (the tracemalloc session is left running)"""
+    _config['enabled'] = False
+
+def tracing_enabled() -> bool:
+    """Whether spans are currently being recorded"""
+    return _config['enabled']
+
+def start_run(run_id: str = None, trace: bool = False) -> str:
+    """Begin a new run (one dashboard rerun); current_spans() then only shows its spans
+
+    trace=True records this run's spans even when tracing is not enabled;
+    nothing process-wide changes, so other runs stay untraced.
+    """
+    _local.run_id = run_id or uuid.uuid4().hex[:12]
+    _local.trace = trace
+    _local.spans = []
+    _local.stack = []
+    return _local.run_id
+
+def current_spans() -> list:
+    """Spans recorded in this thread since the last start_run()"""
+    return list(getattr(_local, 'spans', []))
+
+def _rows(obj):
+    """Row count of a frame, a tuple of frames or an analyzer's working frame"""
+    if isinstance(obj, pd.DataFrame):
+        return len(obj)
+    if isinstance(obj, tuple) and obj and all(isinstance(o, pd.DataFrame) for o in obj):
+        return sum(len(o) for o in obj)
+    if hasattr(obj, 'df_raw'):
+        return len(obj.df if obj.df is not None else obj.df_raw)
+    return None
+
+def _points(fig):
+    """Number of plotted points across a figure's traces"""
+    total = 0
+    for trace in fig.data:
+        for axis in ('x', 'r', 'values', 'z'):
+            values = getattr(trace, axis, None)
+            if values is not None and not isinstance(values, (str, dict)):
+                total += len(values)
+                break
+    return total
+
+def _write(record: dict):
+    """Append one span as a JSON line"""
+    if not (_config['enabled'] and _config['path']):
+        return
+    with _write_lock, open(_config['path'], 'a') as fh:
+        fh.write(json.dumps(record) + '\n')
+
+def traced(fn=None, *, name: str = None):
+    """Record a span around fn when tracing is enabled; a plain call otherwise
+
+    Rows in are taken from the first argument (a DataFrame or an analyzer),
+    rows out from the result, falling back to the analyzer after the call.
+    """
+    if fn is None:
+        return functools.partial(traced, name=name)
+    span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+    
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        if not (_config['enabled'] or getattr(_local, 'trace', False)):
+            return fn(*args, **kwargs)
+        if not hasattr(_local, 'spans'):
+            start_run()
+        
+        stack = _local.stack
+        parent = stack[-1] if stack else None
+        frame = {'name': span_name, 'child_peak': 0}
+        track_memory = _config['memory'] and tracemalloc.is_tracing()
+        if track_memory:
+            if parent is not None:
+                parent['child_peak'] = max(parent['child_peak'], tracemalloc.get_traced_memory()[1] - parent['mem_start'])
+            tracemalloc.reset_peak()
+            frame['mem_start'] = tracemalloc.get_traced_memory()[0]
+        stack.append(frame)
+        
+        rows_in = _rows(args[0]) if args else None
+        started = time.time()
+        wall_start = time.perf_counter()
+        cpu_start = time.thread_time()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.thread_time() - cpu_start
+            stack.pop()
+            peak = None
+            if track_memory:
+                own_peak = tracemalloc.get_traced_memory()[1] - frame['mem_start']
+                peak = max(own_peak, frame['child_peak'])
+                if parent is not None:
+                    parent['child_peak'] = max(parent['child_peak'], peak + frame['mem_start'] - parent['mem_start'])
+        
+        rows_out = _rows(result)
+        if rows_out is None and args and hasattr(args[0], 'df_raw'):
+            rows_out = _rows(args[0])
+        record = {
+            'run': _local.run_id,
+            'span': span_name,
+            'parent': parent['name'] if parent else None,
+            'depth': len(stack),
+            'start': started,
+            'wall_ms': wall * 1000,
+            'cpu_ms': cpu * 1000,
+            'rows_in': rows_in,
+            'rows_out': rows_out,
+            'peak_mb': peak / 2**20 if peak is not None else None
+        }
+        if hasattr(result, 'data') and hasattr(result, 'layout'):
+            record['points'] = _points(result)
+        _local.spans.append(record)
+        _write(record)
+        return result
+    
+    return wrapper
+
+if os.environ.get('TRS_TRACE'):
+    enable_tracing(os.environ['TRS_TRACE'])
@@ -6,6 +6,12 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
 import pandas as pd
+from typing import Optional
+from clustering import get_clusters, with_clusters
+from data_engine import platform_stats, quantile_buckets
+from figure_cache import cached_figure
+from sampling import stratified_sample
+from tracing import traced
 
 # Editorial palette
 PALETTE = {
@@ -18,13 +24,15 @@ PALETTE = {
     'accent': '#E63946'
 }
 
+@traced
+@cached_figure
 def trust_time_stability_3d(df: pd.DataFrame, sample_size: int = 6000) -> go.Figure:
     """
     3D #1: Trust-Time-Stability Landscape
     Reveals the void where trustworthy long games should be
     """
-    sample = df.sample(min(sample_size, len(df)), random_state=42).copy()
-    sample['stability_index'] = sample['confidence_score'] / (sample['adjusted_time_cost'] + 1)
+    sample = stratified_sample(df, sample_size)
+    sample = sample.assign(stability_index=sample['confidence_score'] / (sample['adjusted_time_cost'] + 1))
     
     fig = go.Figure()
     
@@ -87,6 +95,8 @@ def trust_time_stability_3d(df: pd.DataFrame, sample_size: int = 6000) -> go.Fig
     
     return fig
 
+@traced
+@cached_figure
 def genre_honesty_orbit_3d(df: pd.DataFrame) -> go.Figure:
     """
     3D #2: Genre Honesty Orbit
@@ -175,51 +185,43 @@ def genre_honesty_orbit_3d(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@traced
+@cached_figure
 def platform_reliability_cube_3d(df: pd.DataFrame) -> go.Figure:
     """
     3D #3: Platform Reliability Cube
     Reveals platform-specific patterns
     """
-    # Get primary platform
-    df_platform = df.copy()
-    df_platform['primary_platform'] = df_platform['platform'].fillna('Unknown').str.split(',').str[0].str.strip()
-    
-    # Platform stats
-    platform_stats = df_platform.groupby('primary_platform').agg({
-        'time_cost': 'median',
-        'confidence_score': 'median',
-        'main_story_polled': ['sum', 'count']
-    }).reset_index()
-    
-    platform_stats.columns = ['platform', 'median_time', 'median_conf', 'total_polls', 'count']
-    platform_stats = platform_stats[platform_stats['count'] >= 50].copy()
-    platform_stats = platform_stats.sort_values('median_time')
+    # Platform stats from the cached platform index (primary platform per game)
+    stats = platform_stats(df)
+    stats = stats[stats['count'] >= 50].copy()
+    stats = stats.sort_values('median_time')
     
     # Encode platform as numeric
-    platform_stats['platform_num'] = range(len(platform_stats))
+    stats['platform_num'] = range(len(stats))
     
     # Color by confidence
-    colors = platform_stats['median_conf'].values
+    colors = stats['median_conf'].values
     
     fig = go.Figure()
     
     fig.add_trace(go.Scatter3d(
-        x=platform_stats['platform_num'],
-        y=platform_stats['median_time'],
-        z=platform_stats['median_conf'],
+        x=stats['platform_num'],
+        y=stats['median_time'],
+        z=stats['median_conf'],
         mode='markers+text',
         marker=dict(
-            size=np.sqrt(platform_stats['count']) * 1.5,
+            size=np.sqrt(stats['count']) * 1.5,
             color=colors,
             colorscale='Viridis',
             showscale=True,
             colorbar=dict(title="Confidence", thickness=15, len=0.7),
             line=dict(width=1, color='white')
         ),
-        text=platform_stats['platform'],
+        text=stats['platform'],
         textposition='top center',
         textfont=dict(size=8, family="Inter"),
-        customdata=platform_stats[['count', 'total_polls']],
+        customdata=stats[['count', 'total_polls']],
         hovertemplate='<b>%{text}</b><br>Median Time: %{y:.1f}h<br>Confidence: %{z:.2f}<br>Games: %{customdata[0]}<br>Total Polls: %{customdata[1]}<extra></extra>'
     ))
     
@@ -243,18 +245,23 @@ def platform_reliability_cube_3d(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
-def misrepresentation_risk_helix_3d(df: pd.DataFrame, sample_size: int = 5000) -> go.Figure:
+@traced
+@cached_figure
+def misrepresentation_risk_helix_3d(df: pd.DataFrame, sample_size: Optional[int] = 5000) -> go.Figure:
     """
     3D #4: Misrepresentation Risk Helix
     Reveals games that look long but are unreliable
-    """
-    sample = df.sample(min(sample_size, len(df)), random_state=42).copy()
     
-    # High risk games (top 20%)
-    risk_threshold = sample['misrep_risk'].quantile(0.8)
-    sample['risk_category'] = sample['misrep_risk'].apply(
-        lambda x: 'High Risk' if x >= risk_threshold else 'Moderate Risk' if x >= sample['misrep_risk'].median() else 'Low Risk'
+    Risk categories (median and top 20%) and the danger zone come from the
+    full dataset; sample_size only limits the markers drawn (None = all).
+    """
+    # High risk games (top 20%), moderate above the median
+    risk_category = pd.Series(
+        quantile_buckets(df['misrep_risk'], [0.5, 0.8], ['Low Risk', 'Moderate Risk', 'High Risk']),
+        index=df.index
     )
+    sample = df if sample_size is None else stratified_sample(df, sample_size)
+    sample = sample.assign(risk_category=risk_category)
     
     fig = go.Figure()
     
@@ -281,7 +288,7 @@ def misrepresentation_risk_helix_3d(df: pd.DataFrame, sample_size: int = 5000) -
             ))
     
     # Annotate danger zone
-    danger_zone = sample[(sample['adjusted_time_cost'] > 50) & (sample['misrep_risk'] > 0.5)]
+    danger_zone = df[(df['adjusted_time_cost'] > 50) & (df['misrep_risk'] > 0.5)]
     if len(danger_zone) > 0:
         fig.add_trace(go.Scatter3d(
             x=[danger_zone['adjusted_time_cost'].mean()],
@@ -315,23 +322,17 @@ def misrepresentation_risk_helix_3d(df: pd.DataFrame, sample_size: int = 5000) -
     
     return fig
 
+@traced
+@cached_figure
 def hidden_gems_cluster_3d(df: pd.DataFrame, sample_size: int = 4000) -> go.Figure:
     """
     3D #5: Hidden Gems Cluster Explorer
     Reveals underrated (high confidence, low time) vs overhyped (low confidence, high time)
+    Clusters are fitted once over the full catalogue; only the markers are sampled
     """
-    sample = df.sample(min(sample_size, len(df)), random_state=42).copy()
-    
-    # Classify games
-    high_conf = sample['confidence_score'] > sample['confidence_score'].quantile(0.7)
-    low_time = sample['adjusted_time_cost'] < sample['adjusted_time_cost'].quantile(0.3)
-    high_time = sample['adjusted_time_cost'] > sample['adjusted_time_cost'].quantile(0.7)
-    low_conf = sample['confidence_score'] < sample['confidence_score'].quantile(0.3)
-    
-    sample['cluster'] = 'Standard'
-    sample.loc[high_conf & low_time, 'cluster'] = 'Hidden Gems'
-    sample.loc[low_conf & high_time, 'cluster'] = 'Overhyped'
-    sample.loc[high_conf & high_time, 'cluster'] = 'Verified Epics'
+    # Cluster labels come from k-means over every game (see clustering.py)
+    clusters = get_clusters(df)
+    sample = with_clusters(df, stratified_sample(df, sample_size))
     
     fig = go.Figure()
     
@@ -358,32 +359,21 @@ def hidden_gems_cluster_3d(df: pd.DataFrame, sample_size: int = 4000) -> go.Figu
                 hovertemplate='<b>%{text}</b><br>Adj Time: %{x:.1f}h<br>Confidence: %{y:.2f}<br>Polls: %{z}<br>Raw Time: %{customdata[0]:.1f}h<br>Genre: %{customdata[1]}<extra></extra>'
             ))
     
-    # Annotate clusters
-    gems = sample[sample['cluster'] == 'Hidden Gems']
-    if len(gems) > 0:
-        fig.add_trace(go.Scatter3d(
-            x=[gems['adjusted_time_cost'].mean()],
-            y=[gems['confidence_score'].mean()],
-            z=[gems['main_story_polled'].mean()],
-            mode='text',
-            text=['HIDDEN GEMS<br>(Trustworthy + Short)'],
-            textfont=dict(size=11, color=PALETTE['earned'], family="Inter"),
-            showlegend=False,
-            hoverinfo='skip'
-        ))
-    
-    overhyped = sample[sample['cluster'] == 'Overhyped']
-    if len(overhyped) > 0:
-        fig.add_trace(go.Scatter3d(
-            x=[overhyped['adjusted_time_cost'].mean()],
-            y=[overhyped['confidence_score'].mean()],
-            z=[overhyped['main_story_polled'].mean()],
-            mode='text',
-            text=['OVERHYPED<br>(Long + Uncertain)'],
-            textfont=dict(size=11, color=PALETTE['accent'], family="Inter"),
-            showlegend=False,
-            hoverinfo='skip'
-        ))
+    # Annotate clusters at their full-catalogue centroids
+    for cluster, label, color in [('Hidden Gems', 'HIDDEN GEMS<br>(Trustworthy + Short)', PALETTE['earned']),
+                                  ('Overhyped', 'OVERHYPED<br>(Long + Uncertain)', PALETTE['accent'])]:
+        if cluster in clusters['names']:
+            i = clusters['names'].index(cluster)
+            fig.add_trace(go.Scatter3d(
+                x=[clusters['adjusted_time'][i]],
+                y=[clusters['confidence'][i]],
+                z=[clusters['polls'][i]],
+                mode='text',
+                text=[label],
+                textfont=dict(size=11, color=color, family="Inter"),
+                showlegend=False,
+                hoverinfo='skip'
+            ))
     
     camera = dict(eye=dict(x=1.6, y=1.3, z=1.4))
     
@@ -3,10 +3,16 @@ Signature Visualizations - Research-grade visual reasoning
 Every chart encodes WHY, not WHAT
 """
 import plotly.graph_objects as go
+from plotly.colors import sample_colorscale
 from plotly.subplots import make_subplots
 import numpy as np
 import pandas as pd
-from scipy.ndimage import gaussian_filter
+from clustering import get_clusters
+from data_engine import aggregate_cube, dataset_fingerprint
+from density_engine import get_density_engine
+from figure_cache import cached_figure
+from sampling import stratified_sample
+from tracing import traced
 
 # Professional vibrant palette
 PALETTE = {
@@ -21,30 +27,24 @@ PALETTE = {
     'gradient_end': '#F093FB'
 }
 
-def topographic_density_map(df: pd.DataFrame, sample_size: int = 10000) -> go.Figure:
-    """Topographic contour map showing game density across time-confidence space"""
-    sample = df.sample(min(sample_size, len(df)), random_state=42)
-    
-    # Create 2D histogram for density
-    x_bins = np.linspace(0, sample['time_cost'].quantile(0.95), 50)
-    y_bins = np.linspace(0, sample['confidence_score'].quantile(0.95), 50)
-    
-    hist, x_edges, y_edges = np.histogram2d(
-        sample['time_cost'], 
-        sample['confidence_score'],
-        bins=[x_bins, y_bins]
-    )
-    
-    # Smooth the histogram for better contours
-    hist_smooth = gaussian_filter(hist.T, sigma=1.5)
+@traced
+@cached_figure
+def topographic_density_map(df: pd.DataFrame, genres: list = None, bandwidth='scott') -> go.Figure:
+    """Topographic contour map showing game density across time-confidence space
+
+    Every game is binned once per dataset version (see density_engine);
+    a genre filter sums cached per-genre grids before FFT smoothing.
+    """
+    engine = get_density_engine(df)
+    density = engine.density(genres, bandwidth)
     
     fig = go.Figure()
     
     # Add contour map
     fig.add_trace(go.Contour(
-        x=x_edges[:-1],
-        y=y_edges[:-1],
-        z=hist_smooth,
+        x=engine.x_centers,
+        y=engine.y_centers,
+        z=density.astype(np.float32),
         colorscale='Viridis',
         contours=dict(
             coloring='heatmap',
@@ -55,7 +55,7 @@ def topographic_density_map(df: pd.DataFrame, sample_size: int = 10000) -> go.Fi
             title=dict(text='Game<br>Density', side='right'),
             tickmode='linear',
             tick0=0,
-            dtick=hist_smooth.max()/5
+            dtick=max(float(density.max()) / 5, 1e-9)
         ),
         hovertemplate='Time: %{x:.1f}h<br>Confidence: %{y:.2f}<br>Density: %{z:.0f}<extra></extra>'
     ))
@@ -73,13 +73,154 @@ def topographic_density_map(df: pd.DataFrame, sample_size: int = 10000) -> go.Fi
     
     return fig
 
-def trust_time_landscape(df: pd.DataFrame, sample_size: int = 8000) -> go.Figure:
+LANDSCAPE_ZONES = [('Earned Time', PALETTE['earned']),
+                   ('Uncertain Grind', PALETTE['uncertain']),
+                   ('False Epic', PALETTE['false_epic']),
+                   ('Verified Epic', PALETTE['verified'])]
+
+def density_grid(x, y, x_range, y_range, bins=(160, 90)):
+    """Bin every point into a regular grid with one bincount
+
+    Returns counts shaped (y bins, x bins) plus the x and y cell centres;
+    payload size depends only on the grid, never on the number of points.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    nx, ny = bins
+    ix = np.clip(((x - x_range[0]) / (x_range[1] - x_range[0]) * nx).astype(np.int64), 0, nx - 1)
+    iy = np.clip(((y - y_range[0]) / (y_range[1] - y_range[0]) * ny).astype(np.int64), 0, ny - 1)
+    counts = np.bincount(iy * nx + ix, minlength=nx * ny).reshape(ny, nx)
+    x_centers = x_range[0] + (np.arange(nx) + 0.5) * (x_range[1] - x_range[0]) / nx
+    y_centers = y_range[0] + (np.arange(ny) + 0.5) * (y_range[1] - y_range[0]) / ny
+    return counts, x_centers, y_centers
+
+def _log_colorscale(colorscale, top: float, steps: int = 16) -> list:
+    """colorscale re-stopped so that linear z in [1, top] is coloured on a log scale"""
+    top = max(float(top), 2.0)
+    levels = top ** (np.arange(steps + 1) / steps)
+    colors = sample_colorscale(colorscale, list(np.linspace(0, 1, steps + 1)))
+    return [[float((level - 1) / (top - 1)), color] for level, color in zip(levels, colors)]
+
+def density_heatmap(counts, x_centers, y_centers, colorscale, name='All games'):
+    """Heatmap of a density grid coloured on a log scale; empty cells stay transparent
+
+    z carries the counts themselves (hover shows them directly) and the
+    colorscale stops are spaced logarithmically, so one array is sent.
+    """
+    top = float(counts.max()) if counts.size else 1.0
+    return go.Heatmap(
+        x=x_centers,
+        y=y_centers,
+        z=np.where(counts > 0, counts, np.nan).astype(np.float32),
+        zmin=1,
+        zmax=max(top, 2.0),
+        colorscale=_log_colorscale(colorscale, top),
+        showscale=False,
+        name=name,
+        hoverongaps=False,
+        hovertemplate='Hours: %{x:.1f}<br>Confidence: %{y:.2f}<br>Games: %{z:,}<extra></extra>'
+    )
+
+def _fill_level(counts, budget):
+    """Largest per-cell cap L (at least 1) with sum(min(counts, L)) <= budget"""
+    lo, hi = 1, int(counts.max())
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if np.minimum(counts, mid).sum() <= budget:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+def lod_downsample(x, y, groups=None, priority=None, budget: int = 20000,
+                   grid: tuple = None, outlier_quantile: float = 0.995) -> np.ndarray:
+    """Deterministic level-of-detail thinning for 2D scatters
+
+    Points are bucketed by grid cell and group (e.g. zone). Every non-empty
+    bucket keeps at least one point, so sparse regions and zone boundaries
+    survive; dense buckets share the remaining budget by water-filling and
+    keep their highest-priority points (ties broken by position). Points
+    beyond outlier_quantile on either axis are bucketed on their own grid
+    over the full range, and the extreme point on each axis is always kept.
+    The default grid has about budget / 8 cells. Returns sorted positions.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = len(x)
+    if n <= budget:
+        return np.arange(n)
+    if grid is None:
+        ny = max(int(np.sqrt(budget / 8 * 0.6)), 1)
+        grid = (max(int(ny / 0.6), 1), ny)
+    nx, ny = grid
+    
+    def cells(x_range, y_range):
+        ix = np.clip(((x - x_range[0]) / max(x_range[1] - x_range[0], 1e-12) * nx).astype(np.int64), 0, nx - 1)
+        iy = np.clip(((y - y_range[0]) / max(y_range[1] - y_range[0], 1e-12) * ny).astype(np.int64), 0, ny - 1)
+        return iy * nx + ix
+    
+    q = [1 - outlier_quantile, outlier_quantile]
+    x_core, y_core = np.quantile(x, q), np.quantile(y, q)
+    outlier = (x < x_core[0]) | (x > x_core[1]) | (y < y_core[0]) | (y > y_core[1])
+    cell = np.where(outlier,
+                    nx * ny + cells((x.min(), x.max()), (y.min(), y.max())),
+                    cells(x_core, y_core))
+    if groups is not None:
+        _, group_codes = np.unique(np.asarray(groups), return_inverse=True)
+        cell = group_codes.astype(np.int64) * (2 * nx * ny) + cell
+    _, bucket = np.unique(cell, return_inverse=True)
+    
+    counts = np.bincount(bucket)
+    level = _fill_level(counts, budget)
+    
+    # Rank points inside each bucket: highest priority first, then position
+    priority = np.zeros(n) if priority is None else np.nan_to_num(np.asarray(priority, dtype=np.float64))
+    order = np.lexsort((np.arange(n), -priority, bucket))
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n) - np.repeat(starts, counts)
+    
+    keep = rank < level
+    keep[[x.argmin(), x.argmax(), y.argmin(), y.argmax()]] = True
+    return np.flatnonzero(keep)
+
+def _zone_scatter(zone_data, zone, color, trace=go.Scatter):
+    """Per-game markers for one Trust-Time zone"""
+    return trace(
+        x=zone_data['time_cost'],
+        y=zone_data['confidence_score'],
+        mode='markers',
+        name=zone,
+        marker=dict(
+            size=np.sqrt(zone_data['main_story_polled']) * 0.6,
+            color=color,
+            opacity=0.75,
+            line=dict(width=1, color='white')
+        ),
+        text=zone_data['name'],
+        customdata=zone_data[['main_story_polled', 'misrep_risk']],
+        hovertemplate='<b>%{text}</b><br>' +
+                      'Hours: %{x:.1f}<br>' +
+                      'Confidence: %{y:.2f}<br>' +
+                      'Polls: %{customdata[0]}<br>' +
+                      'Risk: %{customdata[1]:.2%}<extra></extra>'
+    )
+
+@traced
+@cached_figure
+def trust_time_landscape(df: pd.DataFrame, sample_size: int = 8000, render: str = 'sample',
+                         grid: tuple = (160, 90), marker_limit: int = 300) -> go.Figure:
     """
     THE HERO VISUAL
     Maps confidence vs time, reveals zones of truth and illusion
-    """
-    sample = df.sample(min(sample_size, len(df)), random_state=42)
     
+    render='sample' plots the shared stratified sample of games as markers.
+    render='raster' bins every game server-side into a density heatmap and
+    overlays at most about marker_limit markers per zone, thinned with
+    lod_downsample, so the payload does not grow with the catalogue.
+    render='webgl' draws WebGL markers for a level-of-detail subset of at
+    most about sample_size games (see lod_downsample).
+    """
     fig = go.Figure()
     
     # Zone backgrounds (visual reasoning)
@@ -92,32 +233,37 @@ def trust_time_landscape(df: pd.DataFrame, sample_size: int = 8000) -> go.Figure
     fig.add_shape(type="rect", x0=50, y0=0, x1=100, y1=2.0,
                   fillcolor=PALETTE['false_epic'], opacity=0.2, line_width=0)
     
-    # Scatter by zone
-    for zone, color in [('Earned Time', PALETTE['earned']),
-                        ('Uncertain Grind', PALETTE['uncertain']),
-                        ('False Epic', PALETTE['false_epic']),
-                        ('Verified Epic', PALETTE['verified'])]:
-        zone_data = sample[sample['zone'] == zone]
-        if len(zone_data) > 0:
-            fig.add_trace(go.Scatter(
-                x=zone_data['time_cost'],
-                y=zone_data['confidence_score'],
-                mode='markers',
-                name=zone,
-                marker=dict(
-                    size=np.sqrt(zone_data['main_story_polled']) * 0.6,
-                    color=color,
-                    opacity=0.75,
-                    line=dict(width=1, color='white')
-                ),
-                text=zone_data['name'],
-                customdata=zone_data[['main_story_polled', 'misrep_risk']],
-                hovertemplate='<b>%{text}</b><br>' +
-                              'Hours: %{x:.1f}<br>' +
-                              'Confidence: %{y:.2f}<br>' +
-                              'Polls: %{customdata[0]}<br>' +
-                              'Risk: %{customdata[1]:.2%}<extra></extra>'
-            ))
+    if render == 'raster':
+        x_range = (0, max(100.0, float(df['time_cost'].max())))
+        y_range = (0, float(df['confidence_score'].max()) * 1.001)
+        counts, xc, yc = density_grid(df['time_cost'], df['confidence_score'], x_range, y_range, grid)
+        fig.add_trace(density_heatmap(counts, xc, yc, [[0, '#E3E8EE'], [1, '#5D6D7E']]))
+        
+        # Every zone keeps a fixed marker budget, spread over its extent, most polled first
+        for zone, color in LANDSCAPE_ZONES:
+            zone_data = df[df['zone'] == zone]
+            if len(zone_data) > 0:
+                keep = lod_downsample(zone_data['time_cost'], zone_data['confidence_score'],
+                                      priority=zone_data['main_story_polled'], budget=marker_limit)
+                fig.add_trace(_zone_scatter(zone_data.iloc[keep], zone, color))
+    elif render == 'webgl':
+        keep = lod_downsample(df['time_cost'], df['confidence_score'], groups=df['zone'],
+                              priority=df['main_story_polled'], budget=sample_size)
+        subset = df.iloc[keep]
+        for zone, color in LANDSCAPE_ZONES:
+            zone_data = subset[subset['zone'] == zone]
+            if len(zone_data) > 0:
+                fig.add_trace(_zone_scatter(zone_data, zone, color, trace=go.Scattergl))
+    elif render == 'sample':
+        sample = stratified_sample(df, sample_size)
+        
+        # Scatter by zone
+        for zone, color in LANDSCAPE_ZONES:
+            zone_data = sample[sample['zone'] == zone]
+            if len(zone_data) > 0:
+                fig.add_trace(_zone_scatter(zone_data, zone, color))
+    else:
+        raise ValueError(f"Unknown render mode: {render!r} (expected 'sample', 'raster' or 'webgl')")
     
     # Critical annotations (the reasoning)
     fig.add_annotation(
@@ -162,6 +308,8 @@ def trust_time_landscape(df: pd.DataFrame, sample_size: int = 8000) -> go.Figure
     
     return fig
 
+@traced
+@cached_figure
 def perception_reality_split(df: pd.DataFrame, genre_stats: pd.DataFrame) -> go.Figure:
     """
     THE TRANSFORMATION VISUAL
@@ -226,6 +374,8 @@ def perception_reality_split(df: pd.DataFrame, genre_stats: pd.DataFrame) -> go.
     
     return fig
 
+@traced
+@cached_figure
 def genre_honesty_ranking(genre_stats: pd.DataFrame) -> go.Figure:
     """
     THE RERANKING VISUAL
@@ -269,6 +419,8 @@ def genre_honesty_ranking(genre_stats: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@traced
+@cached_figure
 def trs_leaderboard(top_df: pd.DataFrame, bottom_df: pd.DataFrame) -> go.Figure:
     """
     THE LEADERBOARD VISUAL
@@ -346,6 +498,8 @@ def trs_leaderboard(top_df: pd.DataFrame, bottom_df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@traced
+@cached_figure
 def sensitivity_proof(sensitivity_df: pd.DataFrame) -> go.Figure:
     """
     THE ROBUSTNESS VISUAL
@@ -396,32 +550,81 @@ def sensitivity_proof(sensitivity_df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+# Confidence tiers as in compute_metrics: upper bounds are inclusive
+POLL_TIERS = [('Unreliable', 10, PALETTE['uncertain']), ('Weak', 50, PALETTE['false_epic']),
+              ('Moderate', 200, PALETTE['verified']), ('Strong', np.inf, PALETTE['earned'])]
+
+_POLL_HISTOGRAMS = {}
+_MAX_POLL_HISTOGRAMS = 8
+
+def poll_histogram(df: pd.DataFrame, n_bins: int = 48) -> dict:
+    """Log-spaced integer bins of poll counts, counted per confidence tier
+
+    Edges always include the tier boundaries, so every bin belongs to one
+    tier. Computed with a single bincount and cached per dataset version.
+    """
+    key = (dataset_fingerprint(df, columns=['main_story_polled']), n_bins)
+    if key in _POLL_HISTOGRAMS:
+        return _POLL_HISTOGRAMS[key]
+    
+    polls = df['main_story_polled'].to_numpy(dtype=np.float64)
+    polls = polls[np.isfinite(polls) & (polls >= 1)]
+    top = max(float(polls.max()) if len(polls) else 1.0, 1.0)
+    tier_starts = [bound + 1 for _, bound, _ in POLL_TIERS[:-1]]
+    # Bins are [edge_i, edge_i+1): integers, log-spaced, tier starts included
+    edges = np.unique(np.concatenate([np.round(np.geomspace(1, top + 1, n_bins + 1)), tier_starts, [top + 1]]))
+    edges = edges[edges <= top + 1]
+    
+    bins = np.searchsorted(edges, polls, side='right') - 1
+    tiers = np.searchsorted(tier_starts, edges[:-1], side='right')
+    counts = np.bincount(bins, minlength=len(edges) - 1)
+    
+    histogram = {'edges': edges, 'counts': counts, 'tiers': tiers, 'total': len(polls)}
+    if len(_POLL_HISTOGRAMS) >= _MAX_POLL_HISTOGRAMS:
+        del _POLL_HISTOGRAMS[next(iter(_POLL_HISTOGRAMS))]
+    _POLL_HISTOGRAMS[key] = histogram
+    return histogram
+
+@traced
+@cached_figure
 def confidence_crisis_histogram(df: pd.DataFrame) -> go.Figure:
     """
     THE CRISIS VISUAL
     Most games are unmeasured
+    
+    Bars are binned server-side (poll_histogram), so the payload is a few
+    dozen bar heights whatever the catalogue size.
     """
+    hist = poll_histogram(df)
+    lo, hi = hist['edges'][:-1], hist['edges'][1:]
+    
     fig = go.Figure()
     
-    fig.add_trace(go.Histogram(
-        x=df['main_story_polled'],
-        nbinsx=60,
-        marker=dict(
-            color=df['main_story_polled'],
-            colorscale=[[0, PALETTE['uncertain']], [0.5, PALETTE['false_epic']], [1, PALETTE['earned']]],
-            opacity=0.85,
-            line=dict(width=1, color='white')
-        ),
-        hovertemplate='Polls: %{x}<br>Games: %{y}<extra></extra>'
-    ))
+    # One trace per tier, stacked on a log axis; each bar spans its bin exactly
+    for tier, (name, _, color) in enumerate(POLL_TIERS):
+        in_tier = (hist['tiers'] == tier) & (hist['counts'] > 0)
+        if not in_tier.any():
+            continue
+        fig.add_trace(go.Bar(
+            x=(lo[in_tier] + hi[in_tier]) / 2,
+            y=hist['counts'][in_tier],
+            width=(hi[in_tier] - lo[in_tier]) * 0.98,
+            name=name,
+            marker=dict(color=color, opacity=0.85, line=dict(width=1, color='white')),
+            customdata=np.column_stack([lo[in_tier], hi[in_tier] - 1]).astype(np.int64),
+            hovertemplate=f'<b>{name}</b><br>' +
+                          'Polls: %{customdata[0]:,}–%{customdata[1]:,}<br>Games: %{y:,}<extra></extra>'
+        ))
     
-    # Critical thresholds
+    # Critical thresholds; annotations are placed by hand because log
+    # axes take annotation positions in log10 units
     for thresh, label, color in [(10, '10 polls', '#D32F2F'), 
                                    (50, '50 polls', PALETTE['earned'])]:
-        fig.add_vline(
-            x=thresh, line_dash="dash", line_color=color, line_width=4,
-            annotation_text=label, annotation_position="top right",
-            annotation_font=dict(size=13, color=color, family="Inter", weight=600)
+        fig.add_vline(x=thresh + 0.5, line_dash="dash", line_color=color, line_width=4)
+        fig.add_annotation(
+            x=np.log10(thresh + 0.5), y=1, xref='x', yref='paper', text=label,
+            showarrow=False, xanchor='left', yanchor='top', xshift=6,
+            font=dict(size=13, color=color, family="Inter", weight=600)
         )
     
     fig.update_layout(
@@ -429,21 +632,25 @@ def confidence_crisis_histogram(df: pd.DataFrame) -> go.Figure:
             text="<b>The Confidence Crisis</b><br><sub>74% of games have <10 polls — we don't know their length</sub>",
             font=dict(size=24, color=PALETTE['text'], family="Inter")
         ),
-        xaxis_title="<b>Number of Completion Reports</b>",
+        xaxis_title="<b>Number of Completion Reports</b> (log scale)",
         yaxis_title="<b>Number of Games</b>",
         height=450,
         font=dict(size=12, family="Inter"),
         plot_bgcolor=PALETTE['bg'],
         showlegend=False,
-        xaxis=dict(range=[0, 300], gridcolor='rgba(0,0,0,0.05)'),
+        barmode='stack',
+        bargap=0,
+        xaxis=dict(type='log', gridcolor='rgba(0,0,0,0.05)'),
         yaxis=dict(gridcolor='rgba(0,0,0,0.05)')
     )
     
     return fig
 
+@traced
+@cached_figure
 def zone_distribution_pie(df: pd.DataFrame) -> go.Figure:
     """Pie chart showing distribution of games across trust-time zones"""
-    zone_counts = df['zone'].value_counts().sort_values(ascending=False)
+    zone_counts = aggregate_cube(df).groupby('zone').set_index('zone')['count'].sort_values(ascending=False, kind='stable')
     
     colors = {
         'Earned Time': PALETTE['earned'],
@@ -490,19 +697,16 @@ def zone_distribution_pie(df: pd.DataFrame) -> go.Figure:
     
     return fig
 
+@traced
+@cached_figure
 def hidden_gems_cluster_3d(df: pd.DataFrame, sample_size: int = 5000) -> go.Figure:
     """
     THE 3D SIGNATURE VISUAL
     Reveals hidden patterns in trust-time-stability space
     Third dimension shows stability (inverse of adjusted time variance)
     """
-    # Sample for performance
-    sample = df.sample(min(sample_size, len(df)), random_state=42)
-    
-    # Calculate stability index (inverse coefficient of variation)
-    # Higher stability = more consistent estimates
-    sample = sample.copy()
-    sample['stability_index'] = sample['confidence_score'] / (sample['adjusted_time_cost'] + 1)
+    # Shared stratified sample (see sampling.py)
+    sample = stratified_sample(df, sample_size)
     
     # Genre color mapping
     top_genres = sample['primary_genre'].value_counts().head(10).index.tolist()
@@ -510,7 +714,13 @@ def hidden_gems_cluster_3d(df: pd.DataFrame, sample_size: int = 5000) -> go.Figu
         genre: PALETTE['earned'] if i < 3 else PALETTE['verified'] if i < 6 else PALETTE['uncertain']
         for i, genre in enumerate(top_genres)
     }
-    sample['color'] = sample['primary_genre'].map(genre_colors).fillna(PALETTE['uncertain'])
+    
+    # Calculate stability index (inverse coefficient of variation)
+    # Higher stability = more consistent estimates
+    sample = sample.assign(
+        stability_index=sample['confidence_score'] / (sample['adjusted_time_cost'] + 1),
+        color=sample['primary_genre'].map(genre_colors).fillna(PALETTE['uncertain'])
+    )
     
     fig = go.Figure()
     
@@ -565,17 +775,21 @@ def hidden_gems_cluster_3d(df: pd.DataFrame, sample_size: int = 5000) -> go.Figu
         hoverinfo='skip'
     ))
     
-    # Low stability, high time (False Epic cluster)
-    false_epics = sample[(sample['time_cost'] > 60) & (sample['stability_index'] < 0.5)]
-    if len(false_epics) > 0:
-        center = false_epics.iloc[0]
+    # Cluster centroids from k-means over every game (see clustering.py)
+    clusters = get_clusters(df)
+    for cluster, color, symbol in [('Hidden Gems', PALETTE['earned'], 'diamond'),
+                                   ('Verified Epics', PALETTE['verified'], 'diamond'),
+                                   ('Overhyped', PALETTE['false_epic'], 'x')]:
+        if cluster not in clusters['names']:
+            continue
+        c = clusters['names'].index(cluster)
         fig.add_trace(go.Scatter3d(
-            x=[center['time_cost']],
-            y=[center['confidence_score']],
-            z=[center['stability_index']],
+            x=[clusters['time'][c]],
+            y=[clusters['confidence'][c]],
+            z=[clusters['confidence'][c] / (clusters['adjusted_time'][c] + 1)],
             mode='markers+text',
-            marker=dict(size=15, color=PALETTE['false_epic'], symbol='x', line=dict(width=2, color='black')),
-            text=['False Epic Zone'],
+            marker=dict(size=15, color=color, symbol=symbol, line=dict(width=2, color='black')),
+            text=[f"{cluster} ({clusters['sizes'][c]:,})"],
             textposition='top center',
             textfont=dict(size=10, color='black', family="Inter"),
             showlegend=False,